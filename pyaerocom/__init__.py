@@ -1,59 +1,82 @@
 # isort:skip_file
-from importlib import metadata
+from importlib import import_module, metadata, util
 
 from ._logging import change_verbosity
 
 __version__ = metadata.version(__package__)
 
-from .config import Config
-
-# Instantiate default configuration
-const = Config()
-
-# Sub-packages
-from . import io
-from . import plot
-from . import tools
-from . import scripts
-
-# Imports
-from . import obs_io
-from . import metastandards
-from . import vertical_profile
-from . import mathutils
-from . import geodesy
-from . import region_defs
-from . import region
-
-# from . import vert_coords
-from . import stationdata
-from . import griddeddata
-from . import ungriddeddata
-from . import colocation
-from . import var_groups
-from . import combine_vardata_ungridded
-from . import helpers_landsea_masks
-from . import helpers
-from . import trends_helpers
-from . import trends_engine
-
-# custom toplevel classes
-from .variable import Variable
-from .region import Region
-from .vertical_profile import VerticalProfile
-from .stationdata import StationData
-from .griddeddata import GriddedData
-from .ungriddeddata import UngriddedData
-from .filter import Filter
-from .colocateddata import ColocatedData
-from .colocation_auto import ColocationSetup, Colocator
-from .tstype import TsType
-from .time_resampler import TimeResampler
-from .io.helpers import search_data_dir_aerocom
-from .variable_helpers import get_variable
-from .utils import create_varinfo_table
-
-from . import aeroval
-
-# toplevel functions
-from pyaerocom.tools import browse_database
+# Sub-packages and modules, toplevel classes and functions and the default
+# configuration (const) are loaded on first access (PEP 562), so that
+# `import pyaerocom` does not import iris, matplotlib, etc.
+
+#: sub-packages and modules available as attributes of pyaerocom
+_SUBMODULES = [
+    # Sub-packages
+    "io",
+    "plot",
+    "tools",
+    "scripts",
+    "aeroval",
+    # Modules
+    "obs_io",
+    "metastandards",
+    "vertical_profile",
+    "mathutils",
+    "geodesy",
+    "region_defs",
+    "region",
+    "stationdata",
+    "griddeddata",
+    "ungriddeddata",
+    "colocation",
+    "var_groups",
+    "combine_vardata_ungridded",
+    "helpers_landsea_masks",
+    "helpers",
+    "trends_helpers",
+    "trends_engine",
+]
+
+#: toplevel classes and functions and modules they are defined in
+_TOPLEVEL = {
+    "Config": "config",
+    "Variable": "variable",
+    "Region": "region",
+    "VerticalProfile": "vertical_profile",
+    "StationData": "stationdata",
+    "GriddedData": "griddeddata",
+    "UngriddedData": "ungriddeddata",
+    "Filter": "filter",
+    "ColocatedData": "colocateddata",
+    "ColocationSetup": "colocation_auto",
+    "Colocator": "colocation_auto",
+    "TsType": "tstype",
+    "TimeResampler": "time_resampler",
+    "search_data_dir_aerocom": "io.helpers",
+    "get_variable": "variable_helpers",
+    "create_varinfo_table": "utils",
+    "browse_database": "tools",
+}
+
+
+def __getattr__(name):
+    if name == "const":
+        # Instantiate default configuration
+        from .config import Config
+
+        const = globals().get("const")
+        if const is None:
+            const = globals()["const"] = Config()
+        return const
+    elif name in _TOPLEVEL:
+        value = getattr(import_module(f".{_TOPLEVEL[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    elif not name.startswith("__") and util.find_spec(f".{name}", __name__) is not None:
+        # any other sub-package or module (e.g. pyaerocom.exceptions)
+        return import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | {"const"} | set(_SUBMODULES) | set(_TOPLEVEL))
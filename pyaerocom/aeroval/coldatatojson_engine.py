@@ -24,12 +24,33 @@ from pyaerocom.aeroval.coldatatojson_helpers import (
     init_regions_web,
     update_regions_json,
 )
+from pyaerocom.aeroval.json_output_buffer import JsonOutputBuffer
 from pyaerocom.exceptions import AeroValConfigError, TemporalResolutionError
 
 logger = logging.getLogger(__name__)
 
 
 class ColdataToJsonEngine(ProcessingEngine):
+    """
+    Processing engine that converts colocated data objects to json files
+
+    Parameters
+    ----------
+    cfg : EvalSetup
+        AeroVal experiment setup
+    output_buffer : JsonOutputBuffer, optional
+        buffer for entries of heatmap and statistics timeseries files (``hm``
+        and ``hm/ts``). If provided, these entries are only written when the
+        buffer is flushed by the owner of the buffer (e.g.
+        :class:`ExperimentProcessor`). If None, :func:`run` uses a buffer
+        that is flushed at the end of the run, and entries added via
+        :func:`process_coldata` are written immediately.
+    """
+
+    def __init__(self, cfg, output_buffer: JsonOutputBuffer = None):
+        super().__init__(cfg)
+        self.output_buffer = output_buffer
+
     def run(self, files):
         """
         Convert colocated data files to json
@@ -46,14 +67,28 @@ class ColdataToJsonEngine(ProcessingEngine):
             list of files that have been converted.
 
         """
+        own_buffer = self.output_buffer is None
+        if own_buffer:
+            self.output_buffer = JsonOutputBuffer(self.exp_output.json_lock_file)
         converted = []
-        for file in files:
-            logger.info(f"Processing: {file}")
-            coldata = ColocatedData(file)
-            self.process_coldata(coldata)
-            converted.append(file)
+        try:
+            for file in files:
+                logger.info(f"Processing: {file}")
+                coldata = ColocatedData(file)
+                self.process_coldata(coldata)
+                converted.append(file)
+        finally:
+            if own_buffer:
+                self.output_buffer.flush()
+                self.output_buffer = None
         return converted
 
+    def _add_heatmap_entry(self, *args):
+        if self.output_buffer is None:
+            _add_heatmap_entry_json(*args, lock_file=self.exp_output.json_lock_file)
+        else:
+            self.output_buffer.add_heatmap_entry(*args)
+
     def process_coldata(self, coldata: ColocatedData):
         """
         Creates all json files for one ColocatedData object
@@ -102,6 +137,9 @@ class ColdataToJsonEngine(ProcessingEngine):
         use_fairmode = self.cfg.statistics_opts.use_fairmode
         use_diurnal = self.cfg.statistics_opts.use_diurnal
 
+        compress_ts = self.cfg.processing_opts.compress_ts_json
+        shard_ts = self.cfg.processing_opts.shard_ts_json_by_region
+
         # ToDo: some of the checks below could be done automatically in
         # EvalSetup, and at an earlier stage
         if vert_code == "ModelLevel":
@@ -185,7 +223,7 @@ class ColdataToJsonEngine(ProcessingEngine):
 
                 fname = get_timeseries_file_name(regnames[reg], obs_name, var_name_web, vert_code)
                 ts_file = os.path.join(out_dirs["hm/ts"], fname)
-                _add_heatmap_entry_json(
+                self._add_heatmap_entry(
                     ts_file, stats_ts, obs_name, var_name_web, vert_code, model_name, model_var
                 )
 
@@ -207,14 +245,14 @@ class ColdataToJsonEngine(ProcessingEngine):
 
                 hm_file = os.path.join(out_dirs["hm"], fname)
 
-                _add_heatmap_entry_json(
+                self._add_heatmap_entry(
                     hm_file, hm_data, obs_name, var_name_web, vert_code, model_name, model_var
                 )
 
             logger.info("Processing regional timeseries for all regions")
             ts_objs_regional = _process_regional_timeseries(data, regnames, regions_how, meta_glob)
 
-            _write_site_data(ts_objs_regional, out_dirs["ts"])
+            _write_site_data(ts_objs_regional, out_dirs["ts"], compress_ts, shard_ts)
             if coldata.has_latlon_dims:
                 for cd in data.values():
                     if cd is not None:
@@ -223,7 +261,7 @@ class ColdataToJsonEngine(ProcessingEngine):
             logger.info("Processing individual site timeseries data")
             (ts_objs, map_meta, site_indices) = _process_sites(data, regs, regions_how, meta_glob)
 
-            _write_site_data(ts_objs, out_dirs["ts"])
+            _write_site_data(ts_objs, out_dirs["ts"], compress_ts, shard_ts)
 
             logger.info("Processing map and scat data by period")
             for period in periods:
@@ -1,8 +1,11 @@
 """
 Helpers for conversion of ColocatedData to JSON files for web interface.
 """
+import gzip
+import json
 import logging
 import os
+from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime
 
@@ -14,6 +17,7 @@ from pyaerocom._lowlevel_helpers import read_json, write_json
 from pyaerocom._warnings import ignore_warnings
 from pyaerocom.aeroval.fairmode_stats import fairmode_stats
 from pyaerocom.aeroval.helpers import _get_min_max_year_periods, _period_str_to_timeslice
+from pyaerocom.aeroval.json_output_buffer import update_nested_json
 from pyaerocom.colocateddata import ColocatedData
 from pyaerocom.config import ALL_REGION_NAME
 from pyaerocom.exceptions import (
@@ -23,8 +27,8 @@ from pyaerocom.exceptions import (
     TemporalResolutionError,
 )
 from pyaerocom.helpers import start_stop
-from pyaerocom.mathutils import _init_stats_dummy, calc_statistics
-from pyaerocom.region import Region, find_closest_region_coord, get_all_default_region_ids
+from pyaerocom.mathutils import _init_stats_dummy, calc_statistics, calc_statistics_grouped
+from pyaerocom.region import Region, find_closest_region_coords, get_all_default_region_ids
 from pyaerocom.region_defs import HTAP_REGIONS_DEFAULT, OLD_AEROCOM_REGIONS
 from pyaerocom.trends_engine import TrendsEngine
 from pyaerocom.trends_helpers import _get_season_from_months
@@ -46,12 +50,143 @@ def get_stationfile_name(station_name, obs_name, var_name_web, vert_code):
     return f"{station_name}_{obs_name}-{var_name_web}_{vert_code}.json"
 
 
+def get_station_shard_file_name(region, obs_name, var_name_web, vert_code):
+    """Get name of file containing timeseries of all stations in a region"""
+    return get_stationfile_name(f"stations-{region}", obs_name, var_name_web, vert_code)
+
+
 def get_json_mapname(obs_name, var_name_web, model_name, model_var, vert_code, period):
     """Get name base name of json file"""
     return f"{obs_name}-{var_name_web}_{vert_code}_{model_name}-{model_var}_{period}.json"
 
 
-def _write_stationdata_json(ts_data, out_dir):
+def _float_array_to_json_list(arr, precision=5):
+    """
+    Convert float array into (nested) list that can be serialised to json
+
+    Vectorised equivalent of applying :func:`round_floats` to the list
+    representation of the array and writing NaN / inf as null.
+
+    Parameters
+    ----------
+    arr : array-like
+        float array.
+    precision : int
+        number of decimals to round to.
+
+    Returns
+    -------
+    list
+        rounded values, non-finite values are replaced with None.
+    """
+    arr = np.around(np.asarray(arr, dtype=np.float64), precision)
+    finite = np.isfinite(arr)
+    if finite.all():
+        return arr.tolist()
+    out = arr.astype(object)
+    out[~finite] = None
+    return out.tolist()
+
+
+def _to_json_compatible(data, precision=5):
+    """
+    Prepare data for serialisation with the standard library json encoder
+
+    Numpy arrays and lists of floats are rounded and converted in one go
+    (cf. :func:`_float_array_to_json_list`), dictionaries and other lists are
+    processed recursively.
+
+    Parameters
+    ----------
+    data
+        input data (e.g. station timeseries dictionary).
+    precision : int
+        number of decimals to round floats to.
+
+    Returns
+    -------
+    object
+        json compatible representation of input data.
+    """
+    if isinstance(data, dict):
+        return {key: _to_json_compatible(val, precision) for key, val in data.items()}
+    elif isinstance(data, (float, np.floating)):
+        if not np.isfinite(data):
+            return None
+        return float(np.around(data, precision))
+    elif isinstance(data, np.integer):
+        return int(data)
+    elif isinstance(data, (list, tuple, np.ndarray)):
+        try:
+            arr = np.asarray(data) if len(data) > 0 else np.asarray(data, dtype=np.float64)
+        except ValueError:  # e.g. nested lists of different lengths
+            arr = None
+        if arr is not None and arr.dtype.kind == "f":
+            return _float_array_to_json_list(arr, precision)
+        elif arr is not None and arr.dtype.kind in "iub":
+            return arr.tolist()
+        return [_to_json_compatible(val, precision) for val in data]
+    return data
+
+
+def _read_json_file(fp):
+    if fp.endswith(".gz"):
+        with gzip.open(fp, "rt") as f:
+            return json.load(f)
+    return read_json(fp)
+
+
+def _dump_json_file(data, fp):
+    """
+    Write json compatible data using the C accelerated standard library encoder
+
+    Parameters
+    ----------
+    data : dict
+        json compatible data (cf. :func:`_to_json_compatible`).
+    fp : str
+        json file path. If it ends with ".gz", the file is gzip compressed.
+    """
+    if fp.endswith(".gz"):
+        with gzip.open(fp, "wt", compresslevel=5) as f:
+            f.write(json.dumps(data))
+    else:
+        with open(fp, "w") as f:
+            f.write(json.dumps(data))
+
+
+def _update_json_file(fp, entries, depth=1):
+    """
+    Add entries to dictionary in json file
+
+    Parameters
+    ----------
+    fp : str
+        json file path. If it ends with ".gz", the file is gzip compressed.
+    entries : dict
+        json compatible entries to be added to the file.
+    depth : int
+        nesting level at which existing entries are replaced. E.g. for
+        ``depth=2``, entries ``{model: {station: ts_data}}`` are added to the
+        existing stations of a model instead of replacing them.
+    """
+    if os.path.exists(fp):
+        current = _read_json_file(fp)
+        _merge_nested(current, entries, depth)
+    else:
+        current = entries
+    _dump_json_file(current, fp)
+
+
+def _merge_nested(current, entries, depth):
+    for key, val in entries.items():
+        if depth > 1 and isinstance(current.get(key), dict):
+            _merge_nested(current[key], val, depth - 1)
+        else:
+            current[key] = val
+
+
+def _write_stationdata_json(ts_data, out_dir, compress=False):
     """
     This method writes time series data given in a dictionary to .json files
 
@@ -61,6 +196,9 @@ def _write_stationdata_json(ts_data, out_dir):
         A dictionary containing all processed time series data.
     out_dir : str or similar
         output directory
+    compress : bool
+        if True, the json file is gzip compressed (and ".gz" is appended to
+        the file name).
 
     Returns
     -------
@@ -70,21 +208,54 @@ def _write_stationdata_json(ts_data, out_dir):
     filename = get_stationfile_name(
         ts_data["station_name"], ts_data["obs_name"], ts_data["var_name_web"], ts_data["vert_code"]
     )
+    if compress:
+        filename = f"{filename}.gz"
 
     fp = os.path.join(out_dir, filename)
-    if os.path.exists(fp):
-        current = read_json(fp)
-    else:
-        current = {}
-    current[ts_data["model_name"]] = ts_data
-    write_json(current, fp, ignore_nan=True)
+    _update_json_file(fp, {ts_data["model_name"]: _to_json_compatible(ts_data)})
+
 
+def _write_site_data(ts_objs, dirloc, compress=False, shard_by_region=False):
+    """
+    Write list of station timeseries files to json
+
+    Parameters
+    ----------
+    ts_objs : list
+        list of dictionaries containing station timeseries data and metadata
+        (cf. :func:`_process_sites`). Timeseries may be provided as numpy
+        arrays.
+    dirloc : str
+        output directory.
+    compress : bool
+        if True, json files are gzip compressed.
+    shard_by_region : bool
+        if True, the timeseries of all stations are written into one file per
+        region (cf. :func:`get_station_shard_file_name`), using the first
+        region assigned to each station, instead of one file per station. The
+        files contain ``{model_name: {station_name: ts_data}}``.
+    """
+    if not shard_by_region:
+        for ts_data in ts_objs:
+            # writes json file
+            _write_stationdata_json(ts_data, dirloc, compress)
+        return
 
-def _write_site_data(ts_objs, dirloc):
-    """Write list of station timeseries files to json"""
+    shards = defaultdict(dict)
     for ts_data in ts_objs:
-        # writes json file
-        _write_stationdata_json(ts_data, dirloc)
+        region = ts_data.get("region", [ts_data["station_name"]])
+        if isinstance(region, list):
+            region = region[0]
+        filename = get_station_shard_file_name(
+            region, ts_data["obs_name"], ts_data["var_name_web"], ts_data["vert_code"]
+        )
+        model_entries = shards[filename].setdefault(ts_data["model_name"], {})
+        model_entries[ts_data["station_name"]] = _to_json_compatible(ts_data)
+
+    for filename, entries in shards.items():
+        if compress:
+            filename = f"{filename}.gz"
+        _update_json_file(os.path.join(dirloc, filename), entries, depth=2)
 
 
 def _write_diurnal_week_stationdata_json(ts_data, out_dirs):
@@ -123,26 +294,13 @@ def _write_diurnal_week_stationdata_json(ts_data, out_dirs):
 
 
 def _add_heatmap_entry_json(
-    heatmap_file, result, obs_name, var_name_web, vert_code, model_name, model_var
+    heatmap_file, result, obs_name, var_name_web, vert_code, model_name, model_var, lock_file=None
 ):
-    if os.path.exists(heatmap_file):
-        current = read_json(heatmap_file)
-    else:
-        current = {}
-    if not var_name_web in current:
-        current[var_name_web] = {}
-    ov = current[var_name_web]
-    if not obs_name in ov:
-        ov[obs_name] = {}
-    on = ov[obs_name]
-    if not vert_code in on:
-        on[vert_code] = {}
-    ovc = on[vert_code]
-    if not model_name in ovc:
-        ovc[model_name] = {}
-    mn = ovc[model_name]
-    mn[model_var] = result
-    write_json(current, heatmap_file, ignore_nan=True)
+    update_nested_json(
+        heatmap_file,
+        {(var_name_web, obs_name, vert_code, model_name, model_var): result},
+        lock_file,
+    )
 
 
 def _prepare_regions_json_helper(region_ids):
@@ -633,11 +791,7 @@ def _init_site_coord_arrays(data):
 
 
 def _get_stat_regions(lats, lons, regions):
-    regs = []
-    for (lat, lon) in zip(lats, lons):
-        reg = find_closest_region_coord(lat, lon, regions=regions)
-        regs.append(reg)
-    return regs
+    return find_closest_region_coords(lats, lons, regions=regions)
 
 
 def _process_sites(data, regions, regions_how, meta_glob):
@@ -676,8 +830,8 @@ def _process_sites(data, regions, regions_how, meta_glob):
                     # skip this site, all is NaN
                     continue
                 ts_data[f"{freq}_date"] = jsdates[freq]
-                ts_data[f"{freq}_obs"] = sitedata[0].tolist()
-                ts_data[f"{freq}_mod"] = sitedata[1].tolist()
+                ts_data[f"{freq}_obs"] = sitedata[0]
+                ts_data[f"{freq}_mod"] = sitedata[1]
                 has_data = True
         if has_data:  # site is valid
             # register ts_data
@@ -813,6 +967,68 @@ def _make_trends(obs_vals, mod_vals, time, freq, season, start, stop, min_yrs):
     return obs_trend, mod_trend
 
 
+def _make_trends_batch(obs_vals, mod_vals, time, freq, season, start, stop, min_yrs):
+    """
+    Function for generating trends for several sites at once
+
+    Like :func:`_make_trends`, but for the columns (sites) of 2D arrays,
+    using :func:`TrendsEngine.compute_trends`.
+
+    Parameters
+    ----------
+    obs_vals : ndarray
+        obs data, shape (time, sites)
+    mod_vals : ndarray
+        model data, shape (time, sites)
+    time : array-like
+        time stamps
+    freq    : str
+        Frequency for the trends, either monthly or yearly
+    season  : str
+        Seasons used for the trends
+    start   : int
+        Start year
+    stop    : int
+        Stop year
+    min_yrs : int
+        Minimal number of years for the calculation of the trends
+
+    Raises
+    ------
+    AeroValTrendsError
+        If stop - start is smaller than min_yrs or if no data is available
+        in the trend period
+
+    Returns
+    ------
+    list
+        list containing a tuple (obs_trend, mod_trend) of dicts for each
+        site (cf. :func:`_make_trends`)
+    """
+    if stop - start < min_yrs:
+        raise AeroValTrendsError(f"min_yrs ({min_yrs}) larger than time between start and stop")
+
+    season = _get_season_from_months(season)
+
+    te = TrendsEngine
+    obs_trends = te.compute_trends(
+        pd.DataFrame(obs_vals, time), freq, start, stop, min_yrs, season
+    )
+    mod_trends = te.compute_trends(
+        pd.DataFrame(mod_vals, time), freq, start, stop, min_yrs, season
+    )
+
+    result = []
+    for obs_trend, mod_trend in zip(obs_trends, mod_trends):
+        if obs_trend["data"] is None or mod_trend["data"] is None:
+            raise AeroValTrendsError("Trends came back as None")
+        for trend in (obs_trend, mod_trend):
+            trend["data"] = trend["data"].to_json()
+            trend["map_var"] = f"slp_{start}"
+        result.append((obs_trend, mod_trend))
+    return result
+
+
 def _process_map_and_scat(
     data,
     map_data,
@@ -839,7 +1055,27 @@ def _process_map_and_scat(
                         jsdate = subset.data.jsdate.values.tolist()
                     except (DataCoverageError, TemporalResolutionError):
                         use_dummy = True
-                for i, map_stat in zip(site_indices, map_data):
+                #  Code for the calculation of trends (for all sites at once)
+                trends = None
+                if not use_dummy and add_trends and freq != "daily":
+                    (start, stop) = _get_min_max_year_periods([per])
+
+                    if stop - start >= trends_min_yrs:
+                        try:
+                            trends = _make_trends_batch(
+                                subset.data.data[0][:, site_indices],
+                                subset.data.data[1][:, site_indices],
+                                subset.data.time.values,
+                                freq,
+                                season,
+                                start,
+                                stop,
+                                trends_min_yrs,
+                            )
+                        except AeroValTrendsError as e:
+                            msg = f"Failed to calculate trends, and will skip. This was due to {e}"
+                            logger.warning(msg)
+                for site_num, (i, map_stat) in enumerate(zip(site_indices, map_data)):
                     if not freq in map_stat:
                         map_stat[freq] = {}
 
@@ -855,33 +1091,9 @@ def _process_map_and_scat(
 
                             stats["fairmode"] = fairmode_stats(obs_var, stats)
 
-                        #  Code for the calculation of trends
-                        if add_trends and freq != "daily":
-
-                            (start, stop) = _get_min_max_year_periods([per])
-
-                            if stop - start >= trends_min_yrs:
-
-                                try:
-                                    time = subset.data.time.values
-                                    (obs_trend, mod_trend) = _make_trends(
-                                        obs_vals,
-                                        mod_vals,
-                                        time,
-                                        freq,
-                                        season,
-                                        start,
-                                        stop,
-                                        trends_min_yrs,
-                                    )
-
-                                    # The whole trends dicts are placed in the stats dict
-                                    stats["obs_trend"] = obs_trend
-                                    stats["mod_trend"] = mod_trend
-
-                                except AeroValTrendsError as e:
-                                    msg = f"Failed to calculate trends, and will skip. This was due to {e}"
-                                    logger.warning(msg)
+                        if trends is not None:
+                            # The whole trends dicts are placed in the stats dict
+                            (stats["obs_trend"], stats["mod_trend"]) = trends[site_num]
 
                     perstr = f"{per}-{season}"
                     map_stat[freq][perstr] = stats
@@ -1292,12 +1504,25 @@ def _process_statistics_timeseries(data, freq, region_ids, use_weights, use_coun
     to_idx_str = [str(x) for x in to_idx.astype(f"datetime64[{tstr}]")]
     jsdate = _get_jsdate(to_idx)
 
+    # statistics of all periods can be computed in one go if the periods can
+    # be assigned via numpy datetime64 units (same as selection via to_idx_str)
+    grouped = (
+        coldata.dims == ("data_source", "time", "station_name")
+        and TsType(freq).mulfac == 1
+        and TsType(freq).base in ("hourly", "daily", "monthly", "yearly")
+    )
     for regid, regname in region_ids.items():
         output[regname] = {}
         try:
             subset = coldata.filter_region(region_id=regid, check_country_meta=use_country)
         except DataCoverageError:
             continue
+        if grouped:
+            stats = _calc_statistics_periods(subset, to_idx, tstr)
+            for i, js in enumerate(jsdate):
+                if stats[i] is not None:
+                    output[regname][str(js)] = _prep_stats_json(stats[i])
+            continue
         for i, js in enumerate(jsdate):
             per = to_idx_str[i]
             try:
@@ -1310,6 +1535,58 @@ def _process_statistics_timeseries(data, freq, region_ids, use_weights, use_coun
     return output
 
 
+def _calc_statistics_periods(coldata, to_idx, tstr):
+    """Compute statistics of 3D colocated data for each output period
+
+    Same as :func:`ColocatedData.calc_statistics` for each period of the
+    output time index, but computed in one go using
+    :func:`pyaerocom.mathutils.calc_statistics_grouped`.
+
+    Parameters
+    ----------
+    coldata : ColocatedData
+        3D colocated data (data_source, time, station_name)
+    to_idx : ndarray
+        timestamps of output periods
+    tstr : str
+        numpy datetime64 unit of output periods
+
+    Returns
+    -------
+    list
+        statistics dictionaries for each output period (None for periods
+        that contain no timestamps)
+    """
+    periods = to_idx.astype(f"datetime64[{tstr}]")
+    times = coldata.data.time.values.astype(f"datetime64[{tstr}]")
+    tgroups = np.searchsorted(periods, times)
+    tgroups[tgroups == len(periods)] = -1
+    tgroups[periods[tgroups] != times] = -1
+
+    obsvals = coldata.data.values[0]
+    modvals = coldata.data.values[1]
+    num_stats = obsvals.shape[1]
+    groups = np.repeat(tgroups, num_stats)
+    stats = calc_statistics_grouped(
+        modvals.ravel(), obsvals.ravel(), groups, num_groups=len(periods)
+    )
+
+    # number of sites with obs data in each period
+    has_obs = np.zeros((len(periods), num_stats), dtype=bool)
+    ingroup = tgroups >= 0
+    np.logical_or.at(has_obs, tgroups[ingroup], ~np.isnan(obsvals[ingroup]))
+    num_coords_with_data = has_obs.sum(axis=1)
+    num_times = np.bincount(tgroups[ingroup], minlength=len(periods))
+
+    for i, stat in enumerate(stats):
+        if num_times[i] == 0:
+            stats[i] = None
+            continue
+        stat["num_coords_tot"] = num_stats
+        stat["num_coords_with_data"] = num_coords_with_data[i]
+    return stats
+
+
 def _get_jsdate(nparr):
     dt = nparr.astype("datetime64[s]")
     offs = np.datetime64("1970", "s")
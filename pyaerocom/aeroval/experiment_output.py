@@ -13,6 +13,7 @@ from pyaerocom._lowlevel_helpers import (
     sort_dict_by_name,
     write_json,
 )
+from pyaerocom.aeroval.coldatatojson_helpers import _dump_json_file, _read_json_file
 from pyaerocom.aeroval.glob_defaults import (
     extended_statistics,
     statistics_defaults,
@@ -137,6 +138,16 @@ class ExperimentOutput(ProjectOutput):
             logger.info(f"Creating AeroVal experiment directory at {fp}")
         return fp
 
+    @property
+    def json_lock_file(self):
+        """Lock file used for concurrent writing of json files of the experiment
+
+        Hidden file next to the experiment directory, so that it is on the
+        same (shared) file system as the output but not in the experiment
+        directory itself (cf. :mod:`pyaerocom.aeroval.json_output_buffer`).
+        """
+        return os.path.join(self.proj_dir, f".{self.exp_id}.lock")
+
     @property
     def regions_file(self):
         """json file containing region specifications"""
@@ -420,7 +431,7 @@ class ExperimentOutput(ProjectOutput):
             return True
 
         try:
-            data = read_json(fp)
+            data = _read_json_file(fp)
         except Exception:
             logger.exception(f"FATAL: detected corrupt json file: {fp}. Removing file...")
             os.remove(fp)
@@ -440,7 +451,7 @@ class ExperimentOutput(ProjectOutput):
                 modified = True
                 logger.info(f"Removing data for model {mod_name} from ts file: {fp}")
 
-        write_json(data_new, fp)
+        _dump_json_file(data_new, fp)
         return modified
 
     def _clean_modelmap_files(self):
@@ -541,8 +552,9 @@ class ExperimentOutput(ProjectOutput):
         return order
 
     def _get_json_output_files(self, dirname):
+        """json files in output directory (including gzip compressed files)"""
         dirloc = self.out_dirs_json[dirname]
-        return glob.glob(f"{dirloc}/*.json")
+        return glob.glob(f"{dirloc}/*.json") + glob.glob(f"{dirloc}/*.json.gz")
 
     def _get_cmap_info(self, var):
         if var in var_ranges_defaults:
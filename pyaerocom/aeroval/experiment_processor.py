@@ -7,6 +7,7 @@ from multiprocessing import dummy
 from pyaerocom.aeroval._processing_base import HasColocator, ProcessingEngine
 from pyaerocom.aeroval.coldatatojson_engine import ColdataToJsonEngine
 from pyaerocom.aeroval.helpers import delete_dummy_model, make_dummy_model
+from pyaerocom.aeroval.json_output_buffer import JsonOutputBuffer
 from pyaerocom.aeroval.modelmaps_engine import ModelMapsEngine
 from pyaerocom.aeroval.superobs_engine import SuperObsEngine
 
@@ -27,8 +28,16 @@ class ExperimentProcessor(ProcessingEngine, HasColocator):
     networks and 2 variables there will be 4 co-located NetCDF files).
     The co-location is done using :class:`pyaerocom.colocation_auto.Colocator`.
 
+    Entries of the heatmap and statistics timeseries json files are collected
+    in :attr:`output_buffer` during :func:`run` and each of these files is
+    written once, at the end of the run.
+
     """
 
+    def __init__(self, cfg):
+        super().__init__(cfg)
+        self.output_buffer = None
+
     def _run_single_entry(self, model_name, obs_name, var_list):
         if model_name == obs_name:
             msg = f"Cannot run same dataset against each other ({model_name} vs. {obs_name})"
@@ -69,7 +78,7 @@ class ExperimentProcessor(ProcessingEngine, HasColocator):
                     f"{model_name} combination."
                 )
             else:
-                engine = ColdataToJsonEngine(self.cfg)
+                engine = ColdataToJsonEngine(self.cfg, output_buffer=self.output_buffer)
                 engine.run(files_to_convert)
 
     def run(self, model_name=None, obs_name=None, var_list=None, update_interface=True):
@@ -130,9 +139,14 @@ class ExperimentProcessor(ProcessingEngine, HasColocator):
             engine.run(model_list=model_list, var_list=var_list)
 
         if not self.cfg.processing_opts.only_model_maps:
-            for obs_name in obs_list:
-                for model_name in model_list:
-                    self._run_single_entry(model_name, obs_name, var_list)
+            self.output_buffer = JsonOutputBuffer(self.exp_output.json_lock_file)
+            try:
+                for obs_name in obs_list:
+                    for model_name in model_list:
+                        self._run_single_entry(model_name, obs_name, var_list)
+            finally:
+                self.output_buffer.flush()
+                self.output_buffer = None
 
         if update_interface:
             self.update_interface()
@@ -0,0 +1,230 @@
+"""
+Buffered, single-writer output of nested AeroVal json files
+
+Heatmap (``hm/``) and statistics timeseries (``hm/ts/``) json files collect
+the results of all model / obs / variable combinations of an experiment. The
+:class:`JsonOutputBuffer` keeps these entries in memory while an experiment is
+processed and writes each target file only once, when :func:`flush` is
+called. Writing is done via a temporary file and an atomic rename while
+holding an exclusive lock (cf. :func:`_locked`), so that several processes
+can contribute to the same files without overwriting each other's entries.
+"""
+import logging
+import os
+import tempfile
+from contextlib import contextmanager
+
+from pyaerocom._lowlevel_helpers import read_json, write_json
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+#: suffix of lock files
+LOCK_FILE_SUFFIX = ".lock"
+
+
+def _default_lock_file(file_path):
+    """
+    Default lock file of a json file
+
+    Hidden file next to the directory that contains the json file (e.g.
+    ``<exp_dir>/.hm.lock`` for files in ``<exp_dir>/hm``).
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    parent, name = os.path.split(directory)
+    return os.path.join(parent, f".{name}{LOCK_FILE_SUFFIX}")
+
+
+@contextmanager
+def _locked(lock_file):
+    """
+    Context manager holding an exclusive lock on a lock file
+
+    The lock (:func:`fcntl.flock`) serialises the read / update / write
+    cycles of all writers that use the same lock file, that is, threads and
+    processes on one machine and, if the (shared) file system supports
+    ``flock`` across nodes (e.g. Lustre mounted with ``flock``, NFS), also
+    processes on different nodes. It is advisory and does not protect against
+    writers that do not use it, file systems without (cluster-wide) ``flock``
+    support, or platforms without :mod:`fcntl` (where no locking is done).
+    Readers do not need the lock, since files are replaced atomically.
+
+    The lock file is created if it does not exist (readable and writable for
+    everyone, so that other users can lock it too) and is left in place.
+    """
+    if fcntl is None:  # pragma: no cover
+        yield
+        return
+    # flock does not require write access, so lock files created by other users work as well
+    fd = os.open(lock_file, os.O_RDONLY | os.O_CREAT, 0o666)
+    try:
+        try:
+            os.fchmod(fd, 0o666)
+        except PermissionError:  # lock file of other user
+            pass
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _write_json_atomic(data, file_path, **kwargs):
+    """
+    Write json file via temporary file and atomic rename
+
+    Parameters
+    ----------
+    data : dict
+        data to be written.
+    file_path : str
+        output file path.
+    **kwargs
+        additional keyword args passed to :func:`write_json`.
+    """
+    directory = os.path.dirname(file_path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        write_json(data, tmp_path, **kwargs)
+        # mkstemp creates files with mode 0600, use default permissions instead
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def update_nested_json(file_path, entries, lock_file=None):
+    """
+    Insert entries into nested json file (e.g. heatmap file)
+
+    The file is read, updated and rewritten while holding a lock (cf.
+    :func:`_locked`), so concurrent calls for the same file do not lose
+    entries.
+
+    Parameters
+    ----------
+    file_path : str
+        path of json file. Created if it does not exist.
+    entries : dict
+        entries to be inserted. Keys are tuples of nested keys (e.g.
+        ``(var_name_web, obs_name, vert_code, model_name, model_var)``),
+        values are the results to be stored under that key path. Existing
+        entries at the same key path are replaced.
+    lock_file : str, optional
+        lock file used to serialise concurrent writers (all writers of a file
+        need to use the same lock file). Defaults to a hidden file next to the
+        directory of the json file (cf. :func:`_default_lock_file`).
+    """
+    file_path = str(file_path)
+    if lock_file is None:
+        lock_file = _default_lock_file(file_path)
+    with _locked(lock_file):
+        if os.path.exists(file_path):
+            current = read_json(file_path)
+        else:
+            current = {}
+        for keys, result in entries.items():
+            sub = current
+            for key in keys[:-1]:
+                sub = sub.setdefault(key, {})
+            sub[keys[-1]] = result
+        _write_json_atomic(current, file_path, ignore_nan=True)
+
+
+class JsonOutputBuffer:
+    """
+    In-memory buffer for entries of nested AeroVal json output files
+
+    Entries are collected via :func:`add_heatmap_entry` and written to disk
+    with one read / write cycle per output file when :func:`flush` is called.
+
+    Parameters
+    ----------
+    lock_file : str, optional
+        lock file used when writing (cf. :func:`update_nested_json`).
+
+    Example
+    -------
+    >>> buffer = JsonOutputBuffer()
+    >>> buffer.add_heatmap_entry(
+    ...     "hm/glob_stats_monthly.json", {}, "AERONET", "od550aer", "Column", "TM5", "od550aer"
+    ... )
+    >>> len(buffer)
+    1
+    """
+
+    def __init__(self, lock_file=None):
+        self.lock_file = lock_file
+        self._entries = {}
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._entries.values())
+
+    @property
+    def files(self) -> list:
+        """List of output files that have pending entries"""
+        return list(self._entries)
+
+    def add_heatmap_entry(
+        self, heatmap_file, result, obs_name, var_name_web, vert_code, model_name, model_var
+    ):
+        """
+        Register entry for heatmap or statistics timeseries file
+
+        Same signature as
+        :func:`pyaerocom.aeroval.coldatatojson_helpers._add_heatmap_entry_json`,
+        but the entry is only written when :func:`flush` is called.
+
+        Parameters
+        ----------
+        heatmap_file : str
+            output json file.
+        result : dict
+            result to be stored.
+        obs_name : str
+            name of observation network.
+        var_name_web : str
+            variable name used in web interface.
+        vert_code : str
+            vertical code (e.g. Column, Surface).
+        model_name : str
+            name of model.
+        model_var : str
+            name of model variable.
+        """
+        keys = (var_name_web, obs_name, vert_code, model_name, model_var)
+        self._entries.setdefault(str(heatmap_file), {})[keys] = result
+
+    def flush(self) -> list:
+        """
+        Write all buffered entries to disk and empty buffer
+
+        Returns
+        -------
+        list
+            list of files that have been written.
+        """
+        written = []
+        while self._entries:
+            file_path, entries = next(iter(self._entries.items()))
+            update_nested_json(file_path, entries, self.lock_file)
+            del self._entries[file_path]
+            written.append(file_path)
+        if written:
+            logger.info(f"Flushed buffered json output to {len(written)} files")
+        return written
+
+    def clear(self):
+        """Discard all buffered entries"""
+        self._entries.clear()
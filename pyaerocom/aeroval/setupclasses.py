@@ -234,6 +234,11 @@ class EvalRunOptions(ConstrainedContainer):
         #: If True, process only maps (skip obs evaluation)
         self.only_model_maps = False
         self.obs_only = False
+        #: If True, station timeseries json files (ts/) are gzip compressed
+        self.compress_ts_json = False
+        #: If True, station timeseries are written into one json file per
+        #: region instead of one file per station
+        self.shard_ts_json_by_region = False
         self.update(**kwargs)
 
 
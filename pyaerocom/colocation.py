@@ -23,17 +23,25 @@ from pyaerocom.exceptions import (
 )
 from pyaerocom.filter import Filter
 from pyaerocom.helpers import (
+    extract_latlon_dataarray,
     get_lowest_resolution,
     isnumeric,
     make_datetime_index,
+    resample_timeseries,
     to_pandas_timestamp,
 )
+from pyaerocom.stationdata import convert_unit_stations
 from pyaerocom.time_resampler import TimeResampler
 from pyaerocom.tstype import TsType
+from pyaerocom.units_helpers import convert_unit
 from pyaerocom.variable import Variable
 
 logger = logging.getLogger(__name__)
 
+#: Resampling aggregators supported in batched colocation of gridded and
+#: ungridded data (cf. :func:`_colocate_site_data_batched`)
+BATCHED_RESAMPLE_HOW = ("mean", "median", "std", "max", "min", "sum", "count", "first", "last")
+
 
 def _resolve_var_name(data):
     """
@@ -573,6 +581,226 @@ def _colocate_site_data_helper_timecol(
     return pd.concat([obs_ts, grid_ts], axis=1, keys=["ref", "data"])
 
 
+def _batched_colocation_possible(data, colocate_time, use_climatology_ref, resample_how):
+    """Check if colocation can use :func:`_colocate_site_data_batched`"""
+    if colocate_time or use_climatology_ref or not data.ndim == 3:
+        return False
+    if resample_how is None:
+        return True
+    elif isinstance(resample_how, str):
+        return resample_how in BATCHED_RESAMPLE_HOW
+    elif isinstance(resample_how, dict):
+        return all(
+            isinstance(how, dict) and all(x in BATCHED_RESAMPLE_HOW for x in how.values())
+            for how in resample_how.values()
+        )
+    return False
+
+
+def _valid_range_mask(notnull):
+    """Mask of all rows between first and last valid row of each column"""
+    fwd = np.logical_or.accumulate(notnull, axis=0)
+    bwd = np.logical_or.accumulate(notnull[::-1], axis=0)[::-1]
+    return fwd & bwd
+
+
+def _resample_stations_batched(ts_list, steps):
+    """Resample timeseries of multiple sites in one go
+
+    The timeseries are combined into one (time, station) matrix which is
+    resampled column by column using :func:`resample_timeseries`. Since the
+    output of resampling a single timeseries only covers the periods between
+    its first and last timestamp, the covered periods are tracked for each
+    site and values outside are set to NaN.
+
+    Parameters
+    ----------
+    ts_list : list
+        list of :class:`pandas.Series` with unique :class:`DatetimeIndex`
+    steps : list
+        resampling steps (cf. :func:`TimeResampler.get_resample_steps`)
+
+    Returns
+    -------
+    DataFrame
+        resampled data (columns correspond to input timeseries)
+    ndarray
+        boolean mask specifying the periods covered by each timeseries
+    """
+    times = np.unique(np.concatenate([ts.index.values for ts in ts_list]))
+    vals = np.full((len(times), len(ts_list)), np.nan)
+    covered = np.full((len(times), len(ts_list)), np.nan)
+    for i, ts in enumerate(ts_list):
+        pos = np.searchsorted(times, ts.index.values)
+        vals[pos, i] = ts.values
+        covered[pos, i] = 1
+
+    index = pd.DatetimeIndex(times)
+    data = pd.DataFrame(vals, index=index)
+    covered = pd.DataFrame(covered, index=index)
+    mask = covered.notnull().values
+    for freq, min_num_obs, how in steps:
+        data = resample_timeseries(data, freq=freq, how=how, min_num_obs=min_num_obs)
+        covered = resample_timeseries(covered, freq=freq, how="max")
+        mask = _valid_range_mask(covered.notnull().values)
+        covered = pd.DataFrame(np.where(mask, 1.0, np.nan), index=covered.index)
+    return data, mask
+
+
+def _colocate_site_data_batched(
+    data,
+    obs_stat_data,
+    latitude,
+    longitude,
+    var,
+    var_ref,
+    ts_type,
+    resample_how,
+    min_num_obs,
+    harmonise_units,
+    time_idx,
+    arr,
+):
+    """Colocate gridded data with timeseries of multiple sites in one go
+
+    Batched alternative to calling :func:`_colocate_site_data_helper` for
+    each site in :func:`colocate_gridded_ungridded`, that produces the same
+    output. Model timeseries are extracted for all sites in one nearest
+    neighbour lookup and model and obs data are resampled as (time, station)
+    matrices (obs sites are grouped by their temporal resolution).
+
+    Sites that cannot be handled in batch mode (e.g. since resampled
+    timestamps do not match the colocation time index) are returned and need
+    to be colocated individually.
+
+    Parameters
+    ----------
+    data : GriddedData
+        gridded data (3D, time, lat, lon)
+    obs_stat_data : list
+        list of :class:`StationData` objects containing the obs data
+    latitude : list
+        latitudes of sites
+    longitude : list
+        longitudes of sites
+    var : str
+        variable of gridded data
+    var_ref : str
+        variable of obs data
+    ts_type : str
+        output frequency
+    resample_how : str or dict
+        aggregator(s) used for resampling
+    min_num_obs : int or dict, optional
+        minimum number of observations for resampling of time
+    harmonise_units : bool
+        if True, the unit of the gridded data is converted to obs unit
+    time_idx : DatetimeIndex
+        time index of colocated data
+    arr : ndarray
+        output array of shape (2, time, station), is filled with the
+        colocated obs (index 0) and model (index 1) data
+
+    Returns
+    -------
+    list
+        indices of sites that need to be colocated individually
+    str or None
+        unit of colocated model data if `harmonise_units` is True, else None
+    """
+    num_stats = len(obs_stat_data)
+    subset = extract_latlon_dataarray(
+        data.to_xarray(), latitude, longitude, method="nearest", new_index_name="latlon"
+    )
+    if not subset.shape[-1] == num_stats:
+        return list(range(num_stats)), None
+    grid_vals = subset.compute().data
+
+    grid_tst = TsType(data.ts_type)
+    data_unit = None
+    if harmonise_units:
+        grid_unit = str(data.units)
+        data_unit = obs_stat_data[0].get_unit(var_ref)
+        if not grid_unit == data_unit:
+            grid_vals = convert_unit(
+                grid_vals,
+                from_unit=grid_unit,
+                to_unit=data_unit,
+                var_name=var,
+                ts_type=grid_tst.val,
+            )
+
+    to_ts_type = TsType(ts_type)
+    resampler = TimeResampler()
+    try:
+        grid_df = resampler.resample(
+            to_ts_type,
+            input_data=pd.DataFrame(grid_vals, index=data.time_stamps()),
+            from_ts_type=grid_tst,
+            how=resample_how,
+            min_num_obs=min_num_obs,
+        )
+    except TemporalResolutionError:
+        return list(range(num_stats)), data_unit
+    if not grid_df.index.equals(time_idx):
+        return list(range(num_stats)), data_unit
+
+    # group obs sites by temporal resolution
+    todo = []
+    groups = {}
+    for i, obs_stat in enumerate(obs_stat_data):
+        obs_ts = obs_stat[var_ref]
+        if not isinstance(obs_ts, pd.Series):
+            obs_ts = obs_stat.to_timeseries(var_ref)
+        if not isinstance(obs_ts.index, pd.DatetimeIndex) or obs_ts.index.tz is not None:
+            todo.append(i)
+            continue
+        elif not obs_ts.index.is_unique:
+            todo.append(i)
+            continue
+        try:
+            from_tst = TsType(obs_stat.get_var_ts_type(var_ref))
+        except (MetaDataError, TemporalResolutionError):
+            from_tst = None
+            logger.warning(
+                f"Failed to access current temporal resolution of {var_ref} data "
+                f"in StationData {obs_stat.station_name}. "
+                f"No resampling constraints will be applied"
+            )
+        key = None if from_tst is None else from_tst.val
+        if not key in groups:
+            groups[key] = (from_tst, [], [])
+        groups[key][1].append(i)
+        groups[key][2].append(obs_ts)
+
+    for from_tst, stat_indices, ts_list in groups.values():
+        try:
+            steps = resampler.get_resample_steps(
+                to_ts_type, from_tst, resample_how, None if from_tst is None else min_num_obs
+            )
+        except TemporalResolutionError as e:
+            # resolution of obsdata is too low
+            for i in stat_indices:
+                logger.warning(
+                    f"{var_ref} data from site {obs_stat_data[i].station_name} will "
+                    f"not be added to ColocatedData. Reason: {e}"
+                )
+            continue
+        obs_df, covered = _resample_stations_batched(ts_list, steps)
+        pos = time_idx.get_indexer(obs_df.index)
+        # sites that cover periods outside of colocation time index
+        outside = np.any(covered & (pos < 0)[:, None], axis=0)
+        if outside.any():
+            todo.extend(np.asarray(stat_indices)[outside])
+        cols = np.where(~outside)[0]
+        stat_idx = np.asarray(stat_indices, dtype=int)[cols]
+        rows = pos >= 0
+        obs_vals = np.where(covered, obs_df.values, np.nan)[rows][:, cols]
+        arr[0][np.ix_(pos[rows], stat_idx)] = obs_vals
+        arr[1][:, stat_idx] = grid_df.values[:, stat_idx]
+    return sorted(int(i) for i in todo), data_unit
+
+
 def colocate_gridded_ungridded(
     data,
     data_ref,
@@ -771,8 +999,6 @@ def colocate_gridded_ungridded(
             f"Variable {var_ref} is not available in specified time interval ({start}-{stop})"
         )
 
-    grid_stat_data = data.to_time_series(longitude=ungridded_lons, latitude=ungridded_lats)
-
     pd_freq = col_tst.to_pandas_freq()
     time_idx = make_datetime_index(start, stop, pd_freq)
 
@@ -793,7 +1019,7 @@ def colocate_gridded_ungridded(
     else:
         data_unit = None
 
-    # loop over all stations and append to colocated data object
+    # loop over all stations and collect metadata
     for i, obs_stat in enumerate(obs_stat_data):
         # Add coordinates to arrays required for xarray.DataArray below
         lons[i] = obs_stat.longitude
@@ -826,20 +1052,58 @@ def colocate_gridded_ungridded(
                 f"Cannot perform colocation. "
                 f"Ungridded data object contains different units ({var_ref})"
             )
+
+    # colocate all sites in one go, if possible (sites that cannot be handled
+    # in batch mode are colocated one by one below)
+    todo = list(range(stat_num))
+    if _batched_colocation_possible(data, colocate_time, use_climatology_ref, resample_how):
+        todo, _data_unit = _colocate_site_data_batched(
+            data=data,
+            obs_stat_data=obs_stat_data,
+            latitude=ungridded_lats,
+            longitude=ungridded_lons,
+            var=var,
+            var_ref=var_ref,
+            ts_type=col_freq,
+            resample_how=resample_how,
+            min_num_obs=min_num_obs,
+            harmonise_units=harmonise_units,
+            time_idx=time_idx,
+            arr=arr,
+        )
+        if harmonise_units:
+            data_unit = _data_unit
+
+    grid_stat_data = []
+    if len(todo) > 0:
+        grid_stat_data = data.to_time_series(
+            longitude=[ungridded_lons[i] for i in todo],
+            latitude=[ungridded_lats[i] for i in todo],
+        )
+
+    if harmonise_units and len(todo) > 0:
+        # convert model stations into units of observations, all stations
+        # that require the same conversion are converted at once
+        to_convert = {}
+        for j, i in enumerate(todo):
+            obs_unit = obs_stat_data[i].get_unit(var_ref)
+            if not grid_stat_data[j].get_unit(var) == obs_unit:
+                to_convert.setdefault(obs_unit, []).append(grid_stat_data[j])
+        for obs_unit, stats in to_convert.items():
+            convert_unit_stations(stats, var, obs_unit)
+        if data_unit is None:
+            data_unit = obs_stat_data[todo[0]].get_unit(var_ref)
+
+    # loop over remaining stations and add to colocated data object
+    for j, i in enumerate(todo):
+        obs_stat = obs_stat_data[i]
         # get observations (Note: the index of the observation time series
         # is already in the specified frequency format, and thus, does not
         # need to be updated, for details (or if errors occur), cf.
         # UngriddedData.to_station_data, where the conversion happens)
 
         # get model station data
-        grid_stat = grid_stat_data[i]
-        if harmonise_units:
-            grid_unit = grid_stat.get_unit(var)
-            obs_unit = obs_stat.get_unit(var_ref)
-            if not grid_unit == obs_unit:
-                grid_stat.convert_unit(var, obs_unit)
-            if data_unit is None:
-                data_unit = obs_unit
+        grid_stat = grid_stat_data[j]
 
         try:
             if colocate_time:
@@ -2,10 +2,14 @@
 Classes and methods to perform high-level colocation.
 """
 import glob
+import io
 import logging
+import multiprocessing
 import os
+import pickle
 import sys
 import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 
@@ -280,6 +284,12 @@ class ColocationSetup(BrowseDict):
     keep_data : bool
         if True, then all colocated data objects computed when running
         :func:`run` will be stored in :attr:`data`. Defaults to True.
+    num_workers : int
+        number of worker processes used to colocate the model / obs variable
+        pairs in :func:`Colocator.run`. Defaults to 1, that is, all pairs are
+        processed serially. Pairs that share the same ungridded obs variable
+        are scheduled such that the obs data is read only once, and loaded
+        from the cache in the other worker processes.
     add_meta : dict
         additional metadata that is supposed to be added to each output
         :class:`ColocatedData` object.
@@ -392,6 +402,7 @@ class ColocationSetup(BrowseDict):
         self.reanalyse_existing = True
         self.raise_exceptions = False
         self.keep_data = True
+        self.num_workers = 1
 
         self.add_meta = {}
         self.update(**kwargs)
@@ -515,6 +526,18 @@ class Colocator(ColocationSetup):
         5: "NOT OK: Colocation failed",
     }
 
+    #: attributes that are not passed to worker processes in parallel mode
+    _WORKER_SETUP_IGNORE = [
+        "_log",
+        "logging",
+        "_loaded_model_data",
+        "data",
+        "_processing_status",
+        "files_written",
+        "_model_reader",
+        "_obs_reader",
+    ]
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -797,15 +820,14 @@ class Colocator(ColocationSetup):
                 raise
             vars_to_process = {}
         self._print_coloc_info(vars_to_process)
-        for mod_var, obs_var in vars_to_process.items():
-            try:
-                coldata = self._run_helper(mod_var, obs_var)
+        for mod_var, obs_var, coldata, tb in self._iter_run(vars_to_process):
+            if tb is None:
                 if not mod_var in data_out:
                     data_out[mod_var] = {}
                 data_out[mod_var][obs_var] = coldata
                 self._processing_status.append([mod_var, obs_var, 1])
-            except Exception:
-                msg = f"Failed to perform analysis: {traceback.format_exc()}\n"
+            else:
+                msg = f"Failed to perform analysis: {tb}\n"
                 logger.warning(msg)
                 self._processing_status.append([mod_var, obs_var, 5])
                 self._write_log(msg)
@@ -813,7 +835,7 @@ class Colocator(ColocationSetup):
                     self._print_processing_status()
                     self._write_log("ABORTED: raise_exceptions is True\n")
                     self._close_log()
-                    raise ColocationError(traceback.format_exc())
+                    raise ColocationError(tb)
         self._write_log("Colocation finished")
         self._close_log()
         self._print_processing_status()
@@ -1444,6 +1466,111 @@ class Colocator(ColocationSetup):
 
         return coldata
 
+    def _iter_run(self, var_matches):
+        """Colocate model / obs variable pairs and iterate over results
+
+        The pairs are processed in a process pool if :attr:`num_workers` is
+        larger than 1. In either case, results are yielded in the order of the
+        input variable matches.
+
+        Parameters
+        ----------
+        var_matches : dict
+            dictionary specifying model / obs var pairs for colocation.
+
+        Yields
+        ------
+        str
+            model variable
+        str
+            obs variable
+        ColocatedData or None
+            colocated data (None, if colocation failed)
+        str or None
+            formatted traceback if colocation failed, else None
+        """
+        num_workers = min(self.num_workers, len(var_matches))
+        setup = None
+        if num_workers > 1:
+            setup = self._get_worker_setup()
+        if setup is None:
+            for mod_var, obs_var in var_matches.items():
+                try:
+                    coldata = self._run_helper(mod_var, obs_var)
+                except Exception:
+                    yield mod_var, obs_var, None, traceback.format_exc()
+                else:
+                    yield mod_var, obs_var, coldata, None
+            return
+
+        logger.info(f"Colocating {len(var_matches)} variable pairs using {num_workers} processes")
+        # pairs that share the same ungridded obs variable are deferred until
+        # the first one is finished, so that the obs data is read from cache
+        deferred, first = {}, {}
+        if self.obs_is_ungridded and not self.obs_reader.ignore_cache:
+            for mod_var, obs_var in var_matches.items():
+                if obs_var in first:
+                    deferred[first[obs_var]].append(mod_var)
+                else:
+                    first[obs_var] = mod_var
+                    deferred[mod_var] = []
+
+        futures, results = {}, {}
+        # worker processes are spawned, since forking a process that already
+        # read NetCDF data (HDF5 library state, dask threads) may deadlock.
+        # The current configuration (e.g. registered data directories) is
+        # passed to the workers.
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_colocation_worker,
+            initargs=(const,),
+        ) as executor:
+
+            def submit(mod_var):
+                obs_var = var_matches[mod_var]
+                future = executor.submit(_run_colocation_worker, setup, mod_var, obs_var)
+                futures[future] = mod_var
+
+            waiting = {x for _deferred in deferred.values() for x in _deferred}
+            for mod_var in var_matches:
+                if not mod_var in waiting:
+                    submit(mod_var)
+
+            for mod_var, obs_var in var_matches.items():
+                while not mod_var in results:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        finished = futures.pop(future)
+                        results[finished] = future.result()
+                        for _mod_var in deferred.pop(finished, []):
+                            submit(_mod_var)
+                coldata, files_written, log, tb = results.pop(mod_var)
+                self.files_written.extend(files_written)
+                self._write_log(log)
+                yield mod_var, obs_var, coldata, tb
+
+    def _get_worker_setup(self):
+        """Setup for Colocator instances in worker processes
+
+        Returns
+        -------
+        dict or None
+            setup attributes, or None if the setup cannot be passed to worker
+            processes (e.g. if :attr:`model_read_aux` contains lambdas).
+        """
+        setup = {k: v for k, v in self.items() if k not in self._WORKER_SETUP_IGNORE}
+        setup["num_workers"] = 1
+        try:
+            pickle.dumps(setup)
+        except Exception as e:
+            logger.warning(
+                f"Colocation setup cannot be passed to worker processes ({repr(e)}). "
+                f"Colocating variable pairs serially."
+            )
+            return None
+        return setup
+
     def _print_coloc_info(self, var_matches):
         if not var_matches:
             logger.info("Nothing to colocate")
@@ -1479,3 +1606,24 @@ class Colocator(ColocationSetup):
         if self._log is not None:
             self._log.close()
             self._log = None
+
+
+def _init_colocation_worker(config):
+    """Initialise worker process with configuration of parent process"""
+    const.__dict__.update(config.__dict__)
+
+
+def _run_colocation_worker(setup, model_var, obs_var):
+    """Colocate single model / obs variable pair in worker process
+
+    Exceptions are not raised but returned as formatted traceback, and the
+    log output is returned, so it can be written by the parent process.
+    """
+    col = Colocator(**setup)
+    col._log = io.StringIO()
+    try:
+        coldata = col._run_helper(model_var, obs_var)
+        tb = None
+    except Exception:
+        coldata, tb = None, traceback.format_exc()
+    return coldata, col.files_written, col._log.getvalue(), tb
@@ -0,0 +1,322 @@
+"""
+Column-wise storage of the data array of :class:`~pyaerocom.ungriddeddata.UngriddedData`
+"""
+from __future__ import annotations
+
+import numpy as np
+
+#: value used to encode missing data (NaN) in integer columns
+MISSING_INT = -1
+
+
+def _to_float(vals, dtype):
+    """Convert stored column values to float64 (missing values become NaN)"""
+    vals = np.asarray(vals)
+    if dtype.kind == "M":
+        out = np.where(np.isnat(vals), np.nan, vals.astype(np.int64))
+    elif dtype.kind in "iu":
+        out = np.where(vals == MISSING_INT, np.nan, vals)
+    else:
+        out = vals.astype(np.float64)
+    return out[()] if out.ndim == 0 else out
+
+
+def _from_float(vals, dtype):
+    """Convert (float) input values to storage dtype of a column"""
+    vals = np.asarray(vals)
+    if dtype.kind == "M":
+        if vals.dtype.kind == "M":
+            return vals.astype(dtype)
+        vals = vals.astype(np.float64)
+        nan = np.isnan(vals)
+        out = np.where(nan, 0, vals).astype(np.int64).astype(dtype)
+        return np.where(nan, np.datetime64("NaT"), out)
+    elif dtype.kind in "iu":
+        if vals.dtype.kind in "iu":
+            return vals.astype(dtype)
+        vals = vals.astype(np.float64)
+        return np.where(np.isnan(vals), MISSING_INT, vals).astype(dtype)
+    return vals.astype(dtype)
+
+
+def _all_missing(vals):
+    """Check if all input values are missing (NaN or NaT)"""
+    vals = np.asarray(vals)
+    if vals.dtype.kind == "M":
+        return np.isnat(vals).all()
+    elif vals.dtype.kind in "fc":
+        return np.isnan(vals).all()
+    return False
+
+
+def _empty_col(num_rows, dtype):
+    """Create new column of input length filled with missing values"""
+    if dtype.kind == "M":
+        return np.full(num_rows, np.datetime64("NaT"), dtype=dtype)
+    elif dtype.kind in "iu":
+        return np.full(num_rows, MISSING_INT, dtype=dtype)
+    return np.full(num_rows, np.nan, dtype=dtype)
+
+
+class ColumnarArray:
+    """2D array of floats that is stored column by column
+
+    Struct-of-arrays alternative to the 2D float64 data array of
+    :class:`~pyaerocom.ungriddeddata.UngriddedData` in which each column is
+    stored in an individual numpy array with its own dtype (e.g. ``int32`` for
+    indices, ``float32`` for data values and ``datetime64[s]`` for
+    timestamps). Optional columns (e.g. data errors or flags) are only
+    allocated once non-NaN values are assigned to them.
+
+    The array supports the numpy indexing patterns used on the data array of
+    :class:`UngriddedData`, and all values are returned as ``float64``, that
+    is, missing values in integer columns (stored as :attr:`MISSING_INT`) and
+    timestamp columns (stored as ``NaT``) are returned as NaN and timestamps
+    are returned in seconds since 1970-01-01:
+
+    - ``arr[rows, col]``: values of column ``col`` (1D array or scalar)
+    - ``arr[row]`` or ``arr[row, cols]``: values of one row (1D array)
+    - ``arr[rows]`` or ``arr[rows, :]``: subset of rows (:class:`ColumnarArray`)
+    - ``arr[rows, cols]``: subset of rows and columns (2D array)
+
+    Assignments work accordingly. Note that values are cast to the dtype of
+    the corresponding column and may hence lose precision (e.g. ``float32``
+    data columns or sub-second timestamps). A dense 2D ``float64`` array can
+    be created via :func:`numpy.asarray`.
+
+    Parameters
+    ----------
+    num_rows : int
+        number of rows
+    dtypes : list
+        storage dtype of each column
+    optional : list, optional
+        indices of columns that are only allocated when non-NaN data is
+        assigned to them
+    """
+
+    #: dtype of values returned on access
+    dtype = np.dtype(np.float64)
+
+    ndim = 2
+
+    MISSING_INT = MISSING_INT
+
+    def __init__(self, num_rows, dtypes, optional=None):
+        if optional is None:
+            optional = []
+        self._num_rows = int(num_rows)
+        self._dtypes = [np.dtype(dtype) for dtype in dtypes]
+        self._optional = frozenset(optional)
+        self._cols = [
+            None if i in self._optional else _empty_col(self._num_rows, dtype)
+            for i, dtype in enumerate(self._dtypes)
+        ]
+
+    @staticmethod
+    def from_array(arr, dtypes, optional=None):
+        """Create columnar array from 2D array
+
+        Parameters
+        ----------
+        arr : ndarray
+            2D array of floats
+        dtypes : list
+            storage dtype of each column
+        optional : list, optional
+            indices of optional columns
+
+        Returns
+        -------
+        ColumnarArray
+            new instance
+        """
+        arr = np.asarray(arr)
+        if arr.ndim != 2 or arr.shape[1] != len(dtypes):
+            raise ValueError(
+                f"Need 2D array with {len(dtypes)} columns for conversion, got {arr.shape}"
+            )
+        new = ColumnarArray(0, dtypes, optional)
+        new._num_rows = len(arr)
+        for j, dtype in enumerate(new._dtypes):
+            if j in new._optional and _all_missing(arr[:, j]):
+                continue
+            new._cols[j] = _from_float(arr[:, j], dtype)
+        return new
+
+    @staticmethod
+    def concatenate(arrays):
+        """Concatenate arrays along the row axis
+
+        Parameters
+        ----------
+        arrays : list
+            list of :class:`ColumnarArray` or 2D float arrays. Column dtypes of
+            the first :class:`ColumnarArray` in the list are used in the output.
+
+        Returns
+        -------
+        ColumnarArray
+            concatenated array
+        """
+        template = next(arr for arr in arrays if isinstance(arr, ColumnarArray))
+        arrays = [
+            arr
+            if isinstance(arr, ColumnarArray)
+            else ColumnarArray.from_array(arr, template._dtypes, template._optional)
+            for arr in arrays
+        ]
+        new = ColumnarArray(0, template._dtypes, template._optional)
+        new._num_rows = sum(len(arr) for arr in arrays)
+        for j, dtype in enumerate(new._dtypes):
+            if all(arr._cols[j] is None for arr in arrays):
+                continue
+            new._cols[j] = np.concatenate([arr._get_raw(j, dtype) for arr in arrays])
+        return new
+
+    @property
+    def shape(self):
+        """Shape of array (rows, columns)"""
+        return (self._num_rows, len(self._dtypes))
+
+    @property
+    def size(self):
+        """Total number of elements"""
+        return self._num_rows * len(self._dtypes)
+
+    @property
+    def dtypes(self):
+        """Storage dtypes of columns"""
+        return list(self._dtypes)
+
+    @property
+    def nbytes(self):
+        """Number of bytes allocated by all columns"""
+        return sum(col.nbytes for col in self._cols if col is not None)
+
+    @property
+    def allocated(self):
+        """Indices of columns that are allocated"""
+        return [j for j, col in enumerate(self._cols) if col is not None]
+
+    def __len__(self):
+        return self._num_rows
+
+    def __repr__(self):
+        dtypes = ", ".join(
+            str(dtype) if col is not None else f"({dtype})"
+            for dtype, col in zip(self._dtypes, self._cols)
+        )
+        return f"ColumnarArray(shape={self.shape}, dtypes=[{dtypes}])"
+
+    def __array__(self, dtype=None, copy=None):
+        out = np.empty(self.shape, dtype=np.float64)
+        for j in range(self.shape[1]):
+            out[:, j] = self._get_col(j, slice(None))
+        if dtype is not None:
+            out = out.astype(dtype)
+        return out
+
+    def copy(self):
+        """Copy of this array"""
+        new = ColumnarArray(0, self._dtypes, self._optional)
+        new._num_rows = self._num_rows
+        new._cols = [None if col is None else col.copy() for col in self._cols]
+        return new
+
+    def append_rows(self, num):
+        """Add rows (filled with missing values) to the end of this array
+
+        Parameters
+        ----------
+        num : int
+            number of rows to be added
+        """
+        for j, col in enumerate(self._cols):
+            if col is not None:
+                self._cols[j] = np.append(col, _empty_col(num, self._dtypes[j]))
+        self._num_rows += int(num)
+
+    @staticmethod
+    def _is_scalar_index(idx):
+        return isinstance(idx, (int, np.integer))
+
+    def _split_key(self, key):
+        if isinstance(key, tuple) and len(key) == 1:
+            key = key[0]
+        rows, cols = key if isinstance(key, tuple) and len(key) == 2 else (key, slice(None))
+        if isinstance(rows, tuple):  # e.g. output of np.where
+            rows = np.asarray(rows)
+        return rows, cols
+
+    def _col_indices(self, cols):
+        return np.arange(self.shape[1])[cols]
+
+    def _get_raw(self, j, dtype=None):
+        """Stored values of column j (full length), in dtype if provided"""
+        col = self._cols[j]
+        if dtype is None:
+            dtype = self._dtypes[j]
+        if col is None:
+            return _empty_col(self._num_rows, dtype)
+        elif col.dtype == dtype:
+            return col
+        return _from_float(_to_float(col, col.dtype), dtype)
+
+    def _get_col(self, j, rows):
+        col = self._cols[j]
+        if col is None:
+            shape = np.empty(self._num_rows, dtype=np.int8)[rows].shape
+            out = np.full(shape, np.nan)
+            return out[()] if out.ndim == 0 else out
+        return _to_float(col[rows], col.dtype)
+
+    def _set_col(self, j, rows, vals):
+        col = self._cols[j]
+        dtype = self._dtypes[j]
+        if col is None:
+            if _all_missing(vals):
+                return
+            col = self._cols[j] = _empty_col(self._num_rows, dtype)
+        elif (
+            j in self._optional
+            and isinstance(rows, slice)
+            and rows == slice(None)
+            and _all_missing(vals)
+        ):
+            # free memory of optional column
+            self._cols[j] = None
+            return
+        col[rows] = _from_float(vals, dtype)
+
+    def _take_rows(self, rows):
+        new = ColumnarArray(0, self._dtypes, self._optional)
+        new._cols = [None if col is None else col[rows] for col in self._cols]
+        new._num_rows = np.empty(self._num_rows, dtype=np.int8)[rows].shape[0]
+        return new
+
+    def __getitem__(self, key):
+        rows, cols = self._split_key(key)
+        if self._is_scalar_index(cols):
+            return self._get_col(cols, rows)
+        colidx = self._col_indices(cols)
+        if self._is_scalar_index(rows):
+            return np.array([self._get_col(j, rows) for j in colidx], dtype=np.float64)
+        elif isinstance(cols, slice) and cols == slice(None):
+            return self._take_rows(rows)
+        sub = self._take_rows(rows)
+        return np.column_stack([sub._get_col(j, slice(None)) for j in colidx])
+
+    def __setitem__(self, key, value):
+        rows, cols = self._split_key(key)
+        if self._is_scalar_index(cols):
+            self._set_col(cols, rows, value)
+            return
+        colidx = self._col_indices(cols)
+        if isinstance(value, ColumnarArray):
+            for i, j in enumerate(colidx):
+                self._set_col(j, rows, value._get_raw(i, self._dtypes[j]))
+            return
+        value = np.asarray(value)
+        for i, j in enumerate(colidx):
+            self._set_col(j, rows, value if value.ndim == 0 else value[..., i])
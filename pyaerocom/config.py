@@ -25,8 +25,10 @@ logger = logging.getLogger(__name__)
 class Config:
     """Class containing relevant paths for read and write routines
 
-    A loaded instance of this class is created on import of pyaerocom and
-    can be accessed via `pyaerocom.const`.
+    A loaded instance of this class is created on first access of
+    `pyaerocom.const`. Unless a config file is provided, accessible database
+    locations are probed when the first environment dependent attribute
+    (e.g. :attr:`OBSLOCS_UNGRIDDED`, :attr:`OUTPUTDIR`) is accessed.
 
     TODO: provide more information
     """
@@ -92,6 +94,11 @@ class Config:
     #: access, defaults to True
     EBAS_DB_LOCAL_CACHE = True
 
+    #: Number of worker processes used by ungridded readers that support
+    #: parallel reading of data files (e.g. :class:`ReadEbas`). Defaults to 1,
+    #: that is, files are read serially.
+    OBS_READ_NUM_WORKERS = 1
+
     #: Lowest possible year in data
     MIN_YEAR = 0
     #: Highest possible year in data
@@ -145,6 +152,11 @@ class Config:
 
     RM_CACHE_OUTDATED = True
 
+    #: If True, cached ungridded data is updated incrementally when source
+    #: files are added, changed or removed (instead of re-reading everything),
+    #: for readers that support it (cf. :class:`CacheHandlerUngridded`)
+    CACHE_INCREMENTAL = False
+
     #: Name of the file containing the revision string of an obs data network
     REVISION_FILE = "Revision.txt"
 
@@ -192,12 +204,8 @@ class Config:
     def __init__(self, config_file=None, try_infer_environment=True):
 
         # Directories
-        self._outputdir = None
-        self._cache_basedir = None
-        self._colocateddatadir = None
         self._logdir = None
         self._filtermaskdir = None
-        self._local_tmp_dir = None
         self._downloaddatadir = None
         self._confirmed_access = []
         self._rejected_access = []
@@ -208,20 +216,11 @@ class Config:
         self._var_param = None
         self._coords = None
 
-        # Attributes that are used to store search directories
-        self.OBSLOCS_UNGRIDDED = {}
-        self.OBS_UNGRIDDED_POST = {}
-        self.SUPPLDIRS = {}
-        self._search_dirs = []
-
         self.WRITE_FILEIO_ERR_LOG = True
 
-        self.last_config_file = None
         self._ebas_flag_info = None
 
-        #: Settings for reading and writing of gridded data
-        self.GRID_IO = GridIO()
-
+        basedir = None
         if config_file is not None:
             if not os.path.exists(config_file):
                 raise FileNotFoundError(f"input config file does not exist {config_file}")
@@ -230,6 +229,44 @@ class Config:
 
             basedir, config_file = os.path.split(config_file)
         elif try_infer_environment:
+            # probing of database locations is deferred until an environment
+            # dependent attribute is accessed (cf. __getattr__)
+            self._env_pending = True
+            return
+        self._init_environment(config_file, basedir)
+
+    def _init_environment(self, config_file=None, basedir=None, infer=False):
+        """Initialise search directories and output locations
+
+        Parameters
+        ----------
+        config_file : str, optional
+            config file to be read.
+        basedir : str, optional
+            base directory passed to :func:`read_config`.
+        infer : bool
+            if True, config file and base directory are inferred from
+            accessible database locations (cf. :func:`infer_basedir_and_config`).
+        """
+        self.__dict__["_env_pending"] = False
+
+        self._outputdir = None
+        self._cache_basedir = None
+        self._colocateddatadir = None
+        self._local_tmp_dir = None
+
+        # Attributes that are used to store search directories
+        self.OBSLOCS_UNGRIDDED = {}
+        self.OBS_UNGRIDDED_POST = {}
+        self.SUPPLDIRS = {}
+        self._search_dirs = []
+
+        self.last_config_file = None
+
+        #: Settings for reading and writing of gridded data
+        self.GRID_IO = GridIO()
+
+        if infer:
             try:
                 basedir, config_file = self.infer_basedir_and_config()
             except FileNotFoundError:
@@ -243,6 +280,19 @@ class Config:
         # create MyPyaerocom directory
         chk_make_subdir(self.HOMEDIR, self._outhomename)
 
+    def __getattr__(self, key):
+        # only called if attribute does not exist, environment dependent
+        # attributes are created on first access
+        if not key.startswith("__") and self.__dict__.get("_env_pending", False):
+            self._init_environment(infer=True)
+            return getattr(self, key)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {key!r}")
+
+    def __setattr__(self, key, val):
+        if self.__dict__.get("_env_pending", False):
+            self._init_environment(infer=True)
+        super().__setattr__(key, val)
+
     def _check_access(self, loc, timeout=None):
         """Uses multiprocessing approach to check if location can be accessed
 
@@ -920,6 +970,8 @@ class Config:
         self.__dict__[key] = val
 
     def __str__(self):
+        if self.__dict__.get("_env_pending", False):
+            self._init_environment(infer=True)
         head = f"Pyaerocom {type(self).__name__}"
         s = f"\n{head}\n{len(head) * '-'}\n"
         for k, v in self.__dict__.items():
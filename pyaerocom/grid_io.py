@@ -60,6 +60,11 @@ class GridIO:
         when necessary (e.g. when extracting surface time series from 4D
         gridded data object that does not contain sufficient information about
         vertical dimension)
+    LOAD_NUM_THREADS : int
+        number of threads used to load multiple NetCDF files into iris cubes
+        (cf. :func:`pyaerocom.io.iris_io.load_cubes_custom`). Concurrent
+        loading mainly speeds up reading from network storage, where opening
+        files dominates the wall time. Defaults to 1 (sequential loading).
 
     """
 
@@ -114,6 +119,8 @@ class GridIO:
 
         self.INFER_SURFACE_LEVEL = True
 
+        self.LOAD_NUM_THREADS = 1
+
         self.load_default()
 
     def load_aerocom_default(self):
@@ -3,6 +3,7 @@ import os
 import warnings
 from pathlib import Path
 
+import dask.array as da
 import iris
 import numpy as np
 import pandas as pd
@@ -1556,6 +1557,10 @@ class GriddedData:
             if True, this object is modified, else outliers are removed in
             a copy of this object
 
+        Note
+        ----
+        Lazy (dask-backed) data is not loaded but masked lazily.
+
         Returns
         -------
         GriddedData
@@ -1568,6 +1573,12 @@ class GriddedData:
             high = self.var_info.maximum
             logger.info(f"Setting {self.var_name} outlier upper lim: {high:.2f}")
         obj = self if inplace else self.copy()
+        if obj.cube.has_lazy_data():
+            data = obj.cube.lazy_data()
+            obj.cube.data = da.ma.masked_where((data < low) | (data > high), data)
+            obj.metadata["outliers_removed"] = True
+            return obj
+
         obj._ensure_is_masked_array()
 
         data = obj.grid.data
@@ -1070,8 +1070,9 @@ def resample_timeseries(ts, freq, how=None, min_num_obs=None):
 
     Parameters
     ----------
-    ts : Series
-        time series instance
+    ts : Series or DataFrame
+        time series instance (or DataFrame, in which case each column is
+        resampled individually)
     freq : str
         new temporal resolution (can be pandas freq. string, or pyaerocom
         ts_type)
@@ -1088,7 +1089,7 @@ def resample_timeseries(ts, freq, how=None, min_num_obs=None):
 
     Returns
     -------
-    Series
+    Series or DataFrame
         resampled time series object
     """
     if how is None:
@@ -1105,8 +1106,8 @@ def resample_timeseries(ts, freq, how=None, min_num_obs=None):
         numobs = resampler.count()
         # df = resampler.agg([how, 'count'])
         invalid = numobs < min_num_obs
-        if np.any(invalid):
-            data.values[invalid] = np.nan
+        if invalid.values.any():
+            data[invalid] = np.nan
     if loffset is not None:
         data.index = data.index + pd.Timedelta(loffset)
     return data
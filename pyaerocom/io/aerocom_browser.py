@@ -6,9 +6,22 @@ import re
 from pyaerocom import const
 from pyaerocom._lowlevel_helpers import BrowseDict
 from pyaerocom.exceptions import DataSearchError
+from pyaerocom.io.fileindex import DirectoryIndex
 
 logger = logging.getLogger(__name__)
 
+#: persistent index of data directories in the Aerocom database search dirs
+_SUBDIR_INDEX = DirectoryIndex("search_subdirs")
+
+
+def _list_subdirs(search_dir):
+    """List all subdirectories of search directory (uses persistent index)"""
+    subdirs = _SUBDIR_INDEX.get(search_dir, "subdirs")
+    if subdirs is None:
+        subdirs = [x for x in os.listdir(search_dir) if os.path.isdir(os.path.join(search_dir, x))]
+        _SUBDIR_INDEX.put(search_dir, "subdirs", subdirs)
+    return subdirs
+
 
 class AerocomBrowser(BrowseDict):
     """Interface for browsing all Aerocom data direcories
@@ -86,10 +99,7 @@ class AerocomBrowser(BrowseDict):
         for search_dir in const.DATA_SEARCH_DIRS:
             # get the directories
             if os.path.isdir(search_dir):
-                # subdirs = listdir(search_dir)
-                subdirs = [
-                    x for x in os.listdir(search_dir) if os.path.isdir(os.path.join(search_dir, x))
-                ]
+                subdirs = _list_subdirs(search_dir)
                 for subdir in subdirs:
                     if ignorecase:
                         match = bool(re.search(pattern, subdir, re.IGNORECASE))
@@ -5,9 +5,17 @@ import glob
 import logging
 import os
 import pickle
+import shutil
+
+import numpy as np
 
 from pyaerocom import const
-from pyaerocom.exceptions import CacheReadError, CacheWriteError
+from pyaerocom.exceptions import (
+    CacheReadError,
+    CacheWriteError,
+    DataCoverageError,
+    DataExtractionError,
+)
 from pyaerocom.ungriddeddata import UngriddedData
 
 logger = logging.getLogger(__name__)
@@ -17,11 +25,28 @@ logger = logging.getLogger(__name__)
 class CacheHandlerUngridded:
     """Interface for reading and writing of cache files
 
-    Cache filename mask is
-
-    <data_id>_<var>.pkl
-
-    e.g. EBASMC_scatc550aer.pkl
+    Two cache formats are supported:
+
+    - ``mmap`` (default): columnar format, stored in a directory
+      ``<data_id>_<var>.mmap`` that contains the data array and the
+      flattened :attr:`UngriddedData.meta_idx` row indices as ``.npy`` files,
+      which are memory-mapped (copy-on-write) when loaded, and the remaining
+      (small) attributes of the :class:`UngriddedData` object as pickle.
+      Loading is thus almost instantaneous and data rows are only paged in
+      from disk when they are accessed.
+    - ``pkl``: the whole :class:`UngriddedData` object is pickled into
+      ``<data_id>_<var>.pkl``, e.g. EBASMC_scatc550aer.pkl
+
+    If a cache file of the preferred format does not exist, the other format
+    is used as fallback when loading.
+
+    In incremental mode (cf. :attr:`pyaerocom.const.CACHE_INCREMENTAL`), and
+    for readers that support it (cf.
+    :attr:`ReadUngriddedBase.SUPPORTS_INCREMENTAL_CACHE`), the size and
+    modification time of each source file are recorded in the cache header.
+    Cached data is then not invalidated when files are added, changed or
+    removed in the data directory, but updated by reading only the added and
+    changed files and removing the data from changed and removed files.
 
     Attributes
     ----------
@@ -30,9 +55,13 @@ class CacheHandlerUngridded:
     loaded_data : dict
         dictionary containing successfully loaded instances of single variable
         :class:`UngriddedData` objects (keys are variable names)
+    file_format : str
+        preferred cache file format (cf. :attr:`SUPPORTED_FORMATS`)
+    incremental : bool
+        if True, incremental caching is used (if supported by reader)
     """
 
-    __version__ = "1.12"
+    __version__ = "1.13"
     #: Cache file header keys that are checked (and required unchanged) when
     #: reading a cache file
     CACHE_HEAD_KEYS = [
@@ -45,13 +74,51 @@ class CacheHandlerUngridded:
         "cacher_version",
     ]
 
-    def __init__(self, reader=None, cache_dir=None, **kwargs):
+    #: Cache file header keys that are not checked in incremental mode, since
+    #: changes in the data directory are tracked via the recorded source files
+    _HEAD_KEYS_SKIP_INCREMENTAL = ["newest_file_in_read_dir", "newest_file_date_in_read_dir"]
+
+    #: Supported cache file formats (values are file extensions)
+    SUPPORTED_FORMATS = {"mmap": ".mmap", "pkl": ".pkl"}
+
+    #: Default cache file format
+    DEFAULT_FORMAT = "mmap"
+
+    #: File names within a cache directory of format ``mmap``
+    _MMAP_HEAD_FILE = "head.pkl"
+    _MMAP_META_FILE = "meta.pkl"
+    _MMAP_DATA_FILE = "data.npy"
+    _MMAP_ROWS_FILE = "rows.npy"
+
+    def __init__(self, reader=None, cache_dir=None, file_format=None, incremental=None, **kwargs):
         self._reader = None
         if reader is not None:
             self.reader = reader
 
         self.loaded_data = {}
         self._cache_dir = cache_dir
+        if file_format is None:
+            file_format = self.DEFAULT_FORMAT
+        elif not file_format in self.SUPPORTED_FORMATS:
+            raise ValueError(
+                f"Invalid cache file format {file_format}. "
+                f"Choose from {list(self.SUPPORTED_FORMATS)}"
+            )
+        self.file_format = file_format
+        if incremental is None:
+            incremental = const.CACHE_INCREMENTAL
+        self.incremental = incremental
+
+    @property
+    def incremental_active(self):
+        """Boolean specifying whether incremental caching is used
+
+        True if :attr:`incremental` is True and the assigned reader supports
+        incremental caching.
+        """
+        if not self.incremental or self._reader is None:
+            return False
+        return self._reader.SUPPORTS_INCREMENTAL_CACHE
 
     @property
     def reader(self):
@@ -95,7 +162,7 @@ class CacheHandlerUngridded:
         """
         return self.reader.data_dir
 
-    def default_file_name(self, var_name):
+    def default_file_name(self, var_name, file_format=None):
         """File name of cache file
 
 
@@ -103,16 +170,27 @@ class CacheHandlerUngridded:
         ----------
         var_name : str
             name of variable to be cached.
+        file_format : str, optional
+            cache file format, defaults to :attr:`file_format`.
 
         Returns
         -------
         str
-            file name of pickle file
+            file name of cache file
         """
+        if file_format is None:
+            file_format = self.file_format
         name = "_".join([self.data_id, var_name])
-        return name + ".pkl"
+        return name + self.SUPPORTED_FORMATS[file_format]
+
+    def _format_from_name(self, file_name):
+        """Cache format inferred from file extension (None if not inferable)"""
+        for fmt, ext in self.SUPPORTED_FORMATS.items():
+            if file_name.endswith(ext):
+                return fmt
+        return None
 
-    def file_path(self, var_or_file_name, cache_dir=None):
+    def file_path(self, var_or_file_name, cache_dir=None, file_format=None):
         """File path of cache file
 
         Parameters
@@ -125,35 +203,78 @@ class CacheHandlerUngridded:
         cache_dir : str, optional
             output directory (default is pyaerocom cache dir accessed via
             :func:`cache_dir`).
+        file_format : str, optional
+            cache file format, only relevant if input is a variable name.
+            Defaults to :attr:`file_format`.
 
         Returns
         -------
         str
             output file path
         """
-        if not var_or_file_name.endswith(".pkl"):
-            var_or_file_name = self.default_file_name(var_or_file_name)
+        if self._format_from_name(var_or_file_name) is None:
+            var_or_file_name = self.default_file_name(var_or_file_name, file_format)
         if cache_dir is None:
             cache_dir = self.cache_dir
         elif not os.path.exists(cache_dir):
             raise FileNotFoundError(f"Specified output directory does not exist:{cache_dir}")
         return os.path.join(cache_dir, var_or_file_name)
 
-    def _check_pkl_head_vs_database(self, in_handle):
+    def _check_head_vs_database(self, head, incremental=False):
+        """Check if cache header is up to date
 
+        Parameters
+        ----------
+        head : dict
+            cache header
+        incremental : bool
+            if True, and the header contains information about the source
+            files, changes in the data directory are ignored (they are
+            handled in :func:`_update_incremental`).
+
+        Returns
+        -------
+        bool
+            True if cache header is up to date, else False
+        """
         current = self.cache_meta_info()
 
-        head = pickle.load(in_handle)
         if not isinstance(head, dict):
             raise CacheReadError("Invalid cache file")
+        skip = []
+        if incremental and "source_files" in head:
+            skip = self._HEAD_KEYS_SKIP_INCREMENTAL
         for k, v in head.items():
-            if not k in current:
+            if k == "source_files" or k in skip:
+                continue
+            elif not k in current:
                 raise CacheReadError(f"Invalid cache header key: {k}")
             elif not v == current[k]:
                 logger.info(f"{k} is outdated (value: {v}). Current value: {current[k]}")
                 return False
         return True
 
+    @staticmethod
+    def source_file_info(files):
+        """Fingerprints of source files used for incremental caching
+
+        Parameters
+        ----------
+        files : list
+            list of file paths
+
+        Returns
+        -------
+        dict
+            keys are file names (basenames), values are tuples of file size
+            and modification time
+        """
+        info = {}
+        for fp in files:
+            stat = os.stat(fp)
+            info[os.path.basename(fp)] = (stat.st_size, stat.st_mtime)
+        return info
+
     def cache_meta_info(self):
         """Dictionary containing relevant caching meta-info"""
         try:
@@ -220,26 +341,71 @@ class CacheHandlerUngridded:
             if cached file is not an instance of :class:`pyaerocom.UngriddedData`
             class (which should not happen)
         """
-        try:
-            fp = self.file_path(var_or_file_name, cache_dir=cache_dir)
-        except FileNotFoundError as e:
-            logger.warning(repr(e))
-            return False
+        fmt_in = self._format_from_name(var_or_file_name)
+        if fmt_in is None:  # variable name, try preferred format first
+            formats = [self.file_format]
+            formats.extend(f for f in self.SUPPORTED_FORMATS if f != self.file_format)
+        else:
+            formats = [fmt_in]
 
-        if not os.path.isfile(fp):
+        for fmt in formats:
+            try:
+                fp = self.file_path(var_or_file_name, cache_dir=cache_dir, file_format=fmt)
+            except FileNotFoundError as e:
+                logger.warning(repr(e))
+                return False
+            if os.path.exists(fp):
+                break
+        else:
             logger.info(f"Cache file does not exist: {fp}")
             return False
 
+        # incremental updates only for default cache files of variables
+        incremental = self.incremental_active and fmt_in is None and not force_use_outdated
+        if fmt == "mmap":
+            loaded = self._load_mmap(fp, force_use_outdated, incremental)
+        else:
+            loaded = self._load_pkl(fp, force_use_outdated, incremental)
+        if loaded is None:
+            return False
+        head, data = loaded
+
+        if not isinstance(data, UngriddedData):
+            raise TypeError(
+                f"Unexpected data type stored in cache file, need instance of UngriddedData, "
+                f"got {type(data)}"
+            )
+
+        if incremental and "source_files" in head:
+            data = self._update_incremental(var_or_file_name, data, head, cache_dir)
+            if data is None:
+                return False
+
+        self.loaded_data[var_or_file_name] = data
+        logger.info(f"Successfully loaded cache file {fp}")
+        return True
+
+    def _check_head(self, fp, in_handle, force_use_outdated, incremental=False):
+        """Load and check cache header from input file handle
+
+        Returns
+        -------
+        dict or None
+            cache header if cache content can be used, else None (in which
+            case the cache file is removed if it is outdated or corrupt, cf.
+            :func:`check_and_load`).
+        """
         delete_existing = const.RM_CACHE_OUTDATED if not force_use_outdated else False
 
-        in_handle = open(fp, "rb")
+        head = None
         if force_use_outdated:
-            last_meta = pickle.load(in_handle)
-            assert len(last_meta) == len(self.CACHE_HEAD_KEYS)
+            head = pickle.load(in_handle)
+            assert all(k in head for k in self.CACHE_HEAD_KEYS)
             ok = True
         else:
             try:
-                ok = self._check_pkl_head_vs_database(in_handle)
+                head = pickle.load(in_handle)
+                ok = self._check_head_vs_database(head, incremental)
             except Exception as e:
                 ok = False
                 delete_existing = True
@@ -256,34 +422,198 @@ class CacheHandlerUngridded:
             in_handle.close()
             if delete_existing:  # something was wrong
                 logger.info(f"Deleting outdated cache file: {fp}")
-                os.remove(fp)
-            return False
+                self._remove(fp)
+            return None
+        return head
 
-        # everything is okay
-        data = pickle.load(in_handle)
-        if not isinstance(data, UngriddedData):
-            raise TypeError(
-                f"Unexpected data type stored in cache file, need instance of UngriddedData, "
-                f"got {type(data)}"
-            )
+    def _load_pkl(self, fp, force_use_outdated, incremental=False):
+        """Load pickled cache file
 
-        self.loaded_data[var_or_file_name] = data
-        logger.info(f"Successfully loaded cache file {fp}")
-        return True
+        Returns header and data (or None if outdated)
+        """
+        with open(fp, "rb") as in_handle:
+            head = self._check_head(fp, in_handle, force_use_outdated, incremental)
+            if head is None:
+                return None
+            # everything is okay
+            return head, pickle.load(in_handle)
+
+    def _load_mmap(self, fp, force_use_outdated, incremental=False):
+        """Load cache directory of format mmap
+
+        Returns header and data (or None if outdated). The data array and the
+        row indices of the meta blocks are memory mapped in copy-on-write mode,
+        that is, the returned object can be modified without affecting the
+        cache file.
+        """
+        with open(os.path.join(fp, self._MMAP_HEAD_FILE), "rb") as in_handle:
+            head = self._check_head(fp, in_handle, force_use_outdated, incremental)
+            if head is None:
+                return None
+        with open(os.path.join(fp, self._MMAP_META_FILE), "rb") as in_handle:
+            meta = pickle.load(in_handle)
+        # np.asarray removes the np.memmap subclass but keeps the mapped buffer
+        arr = np.asarray(np.load(os.path.join(fp, self._MMAP_DATA_FILE), mmap_mode="c"))
+        rows = np.asarray(np.load(os.path.join(fp, self._MMAP_ROWS_FILE), mmap_mode="c"))
+
+        meta_idx = {}
+        for meta_key, var, start, stop in meta["meta_idx_table"]:
+            if not meta_key in meta_idx:
+                meta_idx[meta_key] = {}
+            meta_idx[meta_key][var] = rows[start:stop]
+
+        data = UngriddedData.__new__(UngriddedData)
+        data.__dict__.update(meta["state"])
+        data._data = arr
+        data.meta_idx = meta_idx
+        return head, data
+
+    def _update_incremental(self, var_name, data, head, cache_dir=None):
+        """Update cached data with changes in source files
+
+        Data from source files that were changed or removed since the cache
+        file was written is removed and added or changed files are read. The
+        updated data is written to the cache.
+
+        Parameters
+        ----------
+        var_name : str
+            name of cached variable
+        data : UngriddedData
+            cached data
+        head : dict
+            cache header, containing the fingerprints of the source files
+            (key source_files, cf. :func:`source_file_info`)
+        cache_dir : str, optional
+            cache directory
+
+        Returns
+        -------
+        UngriddedData or None
+            updated data, or None if data cannot be updated incrementally
+            (e.g. since source files of some metadata blocks are unknown)
+        """
+        cached = head["source_files"]
+        paths = {os.path.basename(fp): fp for fp in self.reader.get_source_files([var_name])}
+        current = self.source_file_info(paths.values())
+
+        to_read = [f for f, info in current.items() if cached.get(f) != info]
+        removed = [f for f in cached if not f in current]
+        to_drop = set(to_read).union(removed)
+        if len(to_drop) == 0:
+            return data
+
+        logger.info(
+            f"Updating cached {self.data_id} {var_name} data: "
+            f"{len(to_read)} new or changed and {len(removed)} removed source files"
+        )
+        keep, num_rows = [], 0
+        for meta_key, meta in data.metadata.items():
+            if not "filename" in meta:
+                logger.info("Cannot update cache incrementally, missing filename in metadata")
+                return None
+            if os.path.basename(meta["filename"]) in to_drop:
+                continue
+            keep.append(meta_key)
+            num_rows += sum(len(idx) for idx in data.meta_idx[meta_key].values())
+
+        try:
+            updated = data._new_from_meta_blocks(keep, num_rows)
+        except DataExtractionError:  # all data removed
+            updated = None
+
+        if len(to_read) > 0:
+            try:
+                new = self.reader.read(var_name, files=[paths[f] for f in to_read])
+            except DataCoverageError:  # no data in new files
+                new = None
+            if new is not None and var_name in new.contains_vars:
+                if len(new.contains_vars) > 1:
+                    new = new.extract_var(var_name)
+                updated = new if updated is None else updated.append(new)
+
+        if updated is None:
+            return None
+        try:
+            self.write(updated, var_name, cache_dir=cache_dir, source_files=current)
+        except Exception as e:
+            logger.warning(f"Failed to write updated cache file: {repr(e)}")
+        return updated
+
+    def _write_mmap(self, meta, data, fp):
+        """Write cache directory of format mmap
+
+        Parameters
+        ----------
+        meta : dict
+            cache header
+        data : UngriddedData
+            data to be written
+        fp : str
+            output directory path (is replaced if it exists)
+        """
+        state = {k: v for k, v in data.__dict__.items() if not k in ("_data", "meta_idx")}
+
+        table, rows, start = [], [], 0
+        for meta_key, var_idx in data.meta_idx.items():
+            for var, indices in var_idx.items():
+                indices = np.asarray(indices, dtype=np.int64)
+                stop = start + len(indices)
+                table.append((meta_key, var, start, stop))
+                rows.append(indices)
+                start = stop
+        rows = np.concatenate(rows) if len(rows) > 0 else np.empty(0, dtype=np.int64)
+
+        # write to temporary directory first, so that readers never see
+        # incomplete cache directories
+        tmp = f"{fp}.tmp{os.getpid()}"
+        os.makedirs(tmp)
+        try:
+            with open(os.path.join(tmp, self._MMAP_HEAD_FILE), "wb") as out_handle:
+                pickle.dump(meta, out_handle, pickle.HIGHEST_PROTOCOL)
+            with open(os.path.join(tmp, self._MMAP_META_FILE), "wb") as out_handle:
+                meta_out = dict(state=state, meta_idx_table=table)
+                pickle.dump(meta_out, out_handle, pickle.HIGHEST_PROTOCOL)
+            np.save(os.path.join(tmp, self._MMAP_DATA_FILE), np.asarray(data._data))
+            np.save(os.path.join(tmp, self._MMAP_ROWS_FILE), rows)
+            if os.path.exists(fp):
+                self._remove(fp)
+            os.rename(tmp, fp)
+        finally:
+            if os.path.exists(tmp):
+                shutil.rmtree(tmp)
+
+    def _write_pkl(self, meta, data, fp):
+        """Write pickled cache file"""
+        # OutHandle = gzip.open(c__cache_file, 'wb') # takes too much time
+        with open(fp, "wb") as out_handle:
+            # write cache header
+            pickle.dump(meta, out_handle, pickle.HIGHEST_PROTOCOL)
+            # write data
+            pickle.dump(data, out_handle, pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _remove(fp):
+        """Remove cache file or directory"""
+        if os.path.isdir(fp):
+            shutil.rmtree(fp)
+        else:
+            os.remove(fp)
 
     def delete_all_cache_files(self):
         """
-        Deletes all pickled data objects in cache directory
+        Deletes all cached data objects in cache directory
 
         If not set differently, the cache directory is the pyaerocom default,
         accessible via :attr:`pyaerocom.const.CACHEDIR`.
 
         """
-        for fp in glob.glob(f"{self.cache_dir}/*.pkl"):
-            os.remove(fp)
-            logger.info(f"Deleted {fp}")
+        for ext in self.SUPPORTED_FORMATS.values():
+            for fp in glob.glob(f"{self.cache_dir}/*{ext}"):
+                self._remove(fp)
+                logger.info(f"Deleted {fp}")
 
-    def write(self, data, var_or_file_name=None, cache_dir=None):
+    def write(self, data, var_or_file_name=None, cache_dir=None, source_files=None):
         """Write single-variable instance of UngriddedData to cache
 
         Parameters
@@ -294,10 +624,15 @@ class CacheHandlerUngridded:
             name of output filename or variable that is supposed to be stored.
             Default usage is to provide variable and then
             :func:`default_file_name` is used. Can be None if
-            input `data` contains only a single variable.
+            input `data` contains only a single variable. If a file name is
+            provided, its extension (.mmap or .pkl) specifies the cache
+            format, else :attr:`file_format` is used.
         cache_dir : str, optional
             output directory (default is pyaerocom cache dir accessed via
             :func:`cache_dir`).
+        source_files : dict, optional
+            fingerprints of source files of the data (cf.
+            :func:`source_file_info`), required for incremental caching.
 
         Returns
         -------
@@ -305,11 +640,14 @@ class CacheHandlerUngridded:
             output file path
         """
         meta = self.cache_meta_info()
+        if source_files is not None:
+            meta["source_files"] = source_files
 
         if not isinstance(data, UngriddedData):
             raise TypeError(f"Invalid input, need instance of UngriddedData, got {type(data)}")
 
-        if not var_or_file_name.endswith(".pkl"):
+        fmt = None if var_or_file_name is None else self._format_from_name(var_or_file_name)
+        if fmt is None:
             var_name = var_or_file_name
             if len(data.contains_datasets) > 1:
                 raise CacheWriteError(
@@ -333,26 +671,20 @@ class CacheHandlerUngridded:
 
             if len(data.contains_vars) > 1:
                 data = data.extract_var(var_name)
+            var_or_file_name = var_name
+            fmt = self.file_format
 
-        fp = self.file_path(var_or_file_name, cache_dir=cache_dir)
+        fp = self.file_path(var_or_file_name, cache_dir=cache_dir, file_format=fmt)
         logger.info(f"Writing cache file: {fp}")
-        success = True
-        # OutHandle = gzip.open(c__cache_file, 'wb') # takes too much time
-        out_handle = open(fp, "wb")
-
         try:
-            # write cache header
-            pickle.dump(meta, out_handle, pickle.HIGHEST_PROTOCOL)
-            # write data
-            pickle.dump(data, out_handle, pickle.HIGHEST_PROTOCOL)
-
+            if fmt == "mmap":
+                self._write_mmap(meta, data, fp)
+            else:
+                self._write_pkl(meta, data, fp)
         except Exception as e:
             logger.exception(f"Failed to write cache: {repr(e)}")
-            success = False
-        finally:
-            out_handle.close()
-            if not success:
-                os.remove(fp)
+            if os.path.exists(fp):
+                self._remove(fp)
         logger.info(f"Wrote: {fp}")
         return fp
 
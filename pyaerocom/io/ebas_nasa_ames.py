@@ -9,6 +9,7 @@ import os
 from datetime import datetime
 
 import numpy as np
+import pandas as pd
 
 from pyaerocom import const
 from pyaerocom._lowlevel_helpers import dict_to_str, str_underline
@@ -250,6 +251,9 @@ class EbasFlagCol:
 
     """
 
+    #: cached lookup table of invalid flag codes (cf. :func:`_invalid_flags_lut`)
+    _lut_cache = None
+
     def __init__(self, raw_data, interpret_on_init=True):
         self.raw_data = raw_data
 
@@ -278,38 +282,49 @@ class EbasFlagCol:
             self.decode()
         return self._valid
 
+    def _invalid_flags_lut(self):
+        """Boolean lookup table over flag code space (0-999), True if invalid
+
+        The table is computed from :attr:`FLAG_INFO` and cached as long as the
+        latter does not change.
+        """
+        valid_info = self.FLAG_INFO["valid"]
+        cached = EbasFlagCol._lut_cache
+        if cached is None or cached[0] is not valid_info:
+            lut = np.zeros(1000, dtype=bool)
+            for code, isvalid in valid_info.items():
+                if 0 <= code < 1000:
+                    lut[code] = not isvalid
+            EbasFlagCol._lut_cache = cached = (valid_info, lut)
+        return cached[1]
+
     def decode(self):
-        """Decode raw flag column"""
-        flags = np.zeros((len(self.raw_data), 3)).astype(int)
-        mask = self.raw_data.astype(
-            bool
-        )  # rmooves all points that are 0, i.e. that contain no flag (valid measurements)
-        valid = np.ones_like(self.raw_data).astype(bool)
-        not_ok = self.raw_data[mask]
-        if len(not_ok) > 0:
-            _decoded = []
-            _valid = []
-            for flag in not_ok:
-                item = f"{flag:.9f}".split(".")[1]
-                vals = [int(item[:3]), int(item[3:6]), int(item[6:9])]
-                _invalid = False
-                for val in vals:
-                    if val == 100:
-                        _invalid = False
-                        break  # since all other flags are irrelevant if 100 is flagged
-                    elif (
-                        val in self.FLAG_INFO["valid"] and not self.FLAG_INFO["valid"][val]
-                    ):  # is invalid
-                        _invalid = True
-
-                _decoded.append(vals)
-                _valid.append(not _invalid)
-
-            flags[mask] = np.asarray(_decoded)
-            valid[mask] = _valid
-
-        self._valid = valid
-        self._decoded = flags
+        """Decode raw flag column
+
+        Each flag value encodes up to 3 flags of 3 digits each (e.g.
+        0.111222333 -> 111 222 333). A measurement is invalid if any of its
+        flags is invalid according to :attr:`FLAG_INFO`, unless it is flagged
+        with 100 (checked by data originator), which overrides all other
+        flags. Missing (NaN) flags are treated as unflagged.
+
+        Note
+        ----
+        Since flag columns are usually highly repetitive, only the unique
+        values in the column are decoded.
+        """
+        raw_data = np.asarray(self.raw_data, dtype=float)
+        raw_data = np.where(np.isnan(raw_data), 0, raw_data)
+        inverse, uniques = pd.factorize(raw_data)
+
+        # digits 1-9 after the decimal point as integer
+        scaled = np.round(np.abs(uniques) * 1e9).astype(np.int64) % 1000000000
+        flags = np.stack([scaled // 1000000, scaled // 1000 % 1000, scaled % 1000], axis=1)
+
+        invalid = self._invalid_flags_lut()[flags].any(axis=1)
+        invalid &= ~(flags == 100).any(axis=1)
+
+        self._valid = ~invalid[inverse]
+        self._decoded = flags[inverse]
 
 
 class EbasNasaAmesFile(NasaAmesHeader):
@@ -622,78 +637,77 @@ class EbasNasaAmesFile(NasaAmesHeader):
         """
         logger.info(f"Reading NASA Ames file:\n{nasa_ames_file}")
         lc = 0  # line counter
-        dc = 0  # data block line counter
         mc = 0  # meta block counter
         END_VAR_DEF = np.nan  # will be set (info stored in header)
-        IN_DATA = False
-        data = []
         self.file = nasa_ames_file
-        for line in open(nasa_ames_file):
-            if IN_DATA:  # in data block (end of file)
-                try:
-                    data.append(tuple(float(x.strip()) for x in line.strip().split()))
-                    # data.append([float(x.strip()) for x in line.strip().split()])
-                except Exception as e:
-                    logger.warning(f"EbasNasaAmesFile: Failed to read data row {dc}. Reason: {e}")
-                dc += 1
-            elif lc < self._NUM_FIXLINES:  # in header section (before column definitions)
-                try:
-                    val = self._H_FIXLINES_CONV[lc](line)
-                    attr = self._H_FIXLINES_YIELD[lc]
-                    if isinstance(attr, list):
-                        for i, attr_id in enumerate(attr):
-                            self[attr_id] = val[i]
-                    else:
-                        self[attr] = val
-                except Exception as e:
-                    msg = f"Failed to read header row {lc}.\n{line}\nError msg: {repr(e)}"
-                    if lc in self._HEAD_ROWS_MANDATORY:
-                        raise NasaAmesReadError(f"Fatal: {msg}")
-                    else:
-                        logger.warning(msg)
-            else:  # behind header section and before data definition (contains column defs and meta info)
-                if mc == 0:  # still in column definition
-                    END_VAR_DEF = self._NUM_FIXLINES + self.num_cols_dependent - 1
-                    NUM_HEAD_LINES = self.num_head_lines
+        with open(nasa_ames_file) as f:
+            for line in f:
+                if lc < self._NUM_FIXLINES:  # in header section (before column definitions)
                     try:
-                        self.var_defs.append(self._read_vardef_line(line))
-                    except Exception as e:
-                        logger.warning(repr(e))
-
-                elif lc < END_VAR_DEF:
-                    self.var_defs.append(self._read_vardef_line(line))
-
-                elif lc == NUM_HEAD_LINES - 1:
-                    IN_DATA = True
-                    self._data_header = h = [x.strip() for x in line.split()]
-                    # append information of first two columns to variable
-                    # definition array.
-                    self._var_defs.insert(
-                        0, EbasColDef(name=h[0], is_flag=False, is_var=False, unit=self.time_unit)
-                    )
-                    self._var_defs.insert(
-                        1, EbasColDef(name=h[1], is_flag=False, is_var=False, unit=self.time_unit)
-                    )
-                    if only_head:
-                        return
-                    logger.debug("REACHED DATA BLOCK")
-                elif lc >= END_VAR_DEF + 2:
-                    try:
-                        name, val = line.split(
-                            ":", 1
-                        )  # Adding maxpslit=1 incase colon appears in url
-                        key = name.strip().lower().replace(" ", "_")
-                        self.meta[key] = val.strip()
+                        val = self._H_FIXLINES_CONV[lc](line)
+                        attr = self._H_FIXLINES_YIELD[lc]
+                        if isinstance(attr, list):
+                            for i, attr_id in enumerate(attr):
+                                self[attr_id] = val[i]
+                        else:
+                            self[attr] = val
                     except Exception as e:
-                        logger.warning(
-                            f"Failed to read line no. {lc}.\n{line}\nError msg: {repr(e)}\n"
-                        )
-                else:
-                    logger.debug(f"Ignoring line no. {lc}: {line}")
-                mc += 1
-            lc += 1
+                        msg = f"Failed to read header row {lc}.\n{line}\nError msg: {repr(e)}"
+                        if lc in self._HEAD_ROWS_MANDATORY:
+                            raise NasaAmesReadError(f"Fatal: {msg}")
+                        else:
+                            logger.warning(msg)
+                else:  # behind header section and before data definition (contains column defs and meta info)
+                    if mc == 0:  # still in column definition
+                        END_VAR_DEF = self._NUM_FIXLINES + self.num_cols_dependent - 1
+                        NUM_HEAD_LINES = self.num_head_lines
+                        try:
+                            self.var_defs.append(self._read_vardef_line(line))
+                        except Exception as e:
+                            logger.warning(repr(e))
+
+                    elif lc < END_VAR_DEF:
+                        self.var_defs.append(self._read_vardef_line(line))
 
-        data = np.asarray(data)
+                    elif lc == NUM_HEAD_LINES - 1:
+                        self._data_header = h = [x.strip() for x in line.split()]
+                        # append information of first two columns to variable
+                        # definition array.
+                        self._var_defs.insert(
+                            0,
+                            EbasColDef(
+                                name=h[0], is_flag=False, is_var=False, unit=self.time_unit
+                            ),
+                        )
+                        self._var_defs.insert(
+                            1,
+                            EbasColDef(
+                                name=h[1], is_flag=False, is_var=False, unit=self.time_unit
+                            ),
+                        )
+                        if only_head:
+                            return
+                        logger.debug("REACHED DATA BLOCK")
+                        # header ends here, the rest of the file is the data block
+                        data = self._read_data_block(f.readlines())
+                        break
+                    elif lc >= END_VAR_DEF + 2:
+                        try:
+                            name, val = line.split(
+                                ":", 1
+                            )  # Adding maxpslit=1 incase colon appears in url
+                            key = name.strip().lower().replace(" ", "_")
+                            self.meta[key] = val.strip()
+                        except Exception as e:
+                            logger.warning(
+                                f"Failed to read line no. {lc}.\n{line}\nError msg: {repr(e)}\n"
+                            )
+                    else:
+                        logger.debug(f"Ignoring line no. {lc}: {line}")
+                    mc += 1
+                lc += 1
+            else:
+                raise NasaAmesReadError(f"Could not find data block in {nasa_ames_file}")
 
         data[:, 1:] = data[:, 1:] * np.asarray(self.mul_factors)
 
@@ -718,6 +732,63 @@ class EbasNasaAmesFile(NasaAmesHeader):
         if quality_check:
             self._quality_check()
 
+    def _read_data_block(self, lines):
+        """Convert lines of data block into 2D numpy array
+
+        The whole block is parsed in one call of :func:`numpy.loadtxt`. If
+        this fails (e.g. due to malformed rows), the block is parsed line by
+        line using :func:`_read_data_block_lines`, which skips and reports
+        rows that cannot be read.
+
+        Parameters
+        ----------
+        lines : list
+            lines of data block
+
+        Returns
+        -------
+        ndarray
+            data array (rows are timestamps, columns as in
+            :attr:`data_header`)
+        """
+        if not any(line.strip() for line in lines):
+            return np.empty((0, len(self._data_header)))
+        try:
+            return np.loadtxt(lines, dtype=float, comments=None, ndmin=2)
+        except ValueError as e:
+            logger.info(
+                f"Failed to read data block of {self.file} in one go ({repr(e)}), "
+                f"reading line by line"
+            )
+        return self._read_data_block_lines(lines)
+
+    @staticmethod
+    def _read_data_block_lines(lines):
+        """Convert lines of data block into 2D numpy array, line by line
+
+        Rows that cannot be converted are skipped and a warning is logged that
+        contains the row number (relative to start of data block).
+
+        Parameters
+        ----------
+        lines : list
+            lines of data block
+
+        Returns
+        -------
+        ndarray
+            data array
+        """
+        data = []
+        for dc, line in enumerate(lines):
+            if not line.strip():
+                continue
+            try:
+                data.append(tuple(float(x.strip()) for x in line.strip().split()))
+            except Exception as e:
+                logger.warning(f"EbasNasaAmesFile: Failed to read data row {dc}. Reason: {e}")
+        return np.asarray(data)
+
     def _read_vardef_line(self, line_from_file):
         """Import variable definition line from NASA Ames file"""
         spl = [x.strip() for x in line_from_file.split(",")]
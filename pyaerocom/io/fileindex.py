@@ -0,0 +1,174 @@
+"""
+Persistent index of information derived from the content of data directories
+
+Searching data directories (e.g. finding all model files in a directory or
+all data directories in the search directories of the Aerocom database) can
+be slow on network storage. :class:`DirectoryIndex` stores the results of
+such searches on disk, keyed by the modification time of the directory, so
+that they can be reused across sessions and processes. Adding, removing or
+renaming entries of a directory changes its modification time, which
+invalidates the index entries of that directory automatically.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import time
+
+from pyaerocom import const
+
+logger = logging.getLogger(__name__)
+
+
+class DirectoryIndex:
+    """Persistent on-disk index of information about directory contents
+
+    Index files are stored in subdirectory ``file_index`` of
+    :attr:`pyaerocom.const.CACHEDIR`, one file per indexed directory. The
+    index is only used if caching is active (:attr:`pyaerocom.const.CACHING`).
+
+    Parameters
+    ----------
+    name : str
+        name of index (e.g. "gridded_fileinfo"), used to separate entries of
+        different applications for the same directory.
+    index_dir : str, optional
+        directory where index files are stored. Defaults to subdirectory
+        ``file_index`` of :attr:`pyaerocom.const.CACHEDIR`.
+
+    Example
+    -------
+    >>> index = DirectoryIndex("my_index")
+    >>> index.put("/path/to/data", "key", [1, 2, 3])  # doctest: +SKIP
+    >>> index.get("/path/to/data", "key")  # doctest: +SKIP
+    [1, 2, 3]
+    """
+
+    #: version of index files, index files with a different version are
+    #: ignored
+    __version__ = "1"
+
+    #: directories modified less than this number of seconds before an entry is
+    #: written are not indexed, since modifications within the resolution of
+    #: the file system timestamps (up to seconds on some network storages)
+    #: would not be detected
+    MIN_AGE_SECONDS = 2.0
+
+    def __init__(self, name: str, index_dir: str = None):
+        self.name = name
+        self._index_dir = index_dir
+
+    @property
+    def enabled(self) -> bool:
+        """Whether index is used (cf. :attr:`pyaerocom.const.CACHING`)"""
+        return bool(const.CACHING) and self.index_dir is not None
+
+    @property
+    def index_dir(self):
+        """Directory where index files are stored"""
+        if self._index_dir is not None:
+            return self._index_dir
+        cache_dir = const.CACHEDIR
+        if cache_dir is None:
+            return None
+        return os.path.join(cache_dir, "file_index")
+
+    def _index_file(self, directory: str) -> str:
+        directory = os.path.abspath(directory)
+        digest = hashlib.sha1(directory.encode()).hexdigest()
+        return os.path.join(self.index_dir, f"{self.name}_{digest}.pkl")
+
+    @staticmethod
+    def _mtime(directory: str):
+        try:
+            return os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+
+    def _read(self, fp: str) -> dict:
+        try:
+            with open(fp, "rb") as f:
+                content = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.info(f"Ignoring invalid index file {fp}: {repr(e)}")
+            return None
+        if not isinstance(content, dict) or content.get("version") != self.__version__:
+            return None
+        return content
+
+    def get(self, directory: str, key):
+        """Get indexed value for directory
+
+        Parameters
+        ----------
+        directory : str
+            indexed directory.
+        key
+            hashable key of value (e.g. a tuple of search settings).
+
+        Returns
+        -------
+        object
+            indexed value, or None, if no valid (up to date) entry is
+            available.
+        """
+        if not self.enabled:
+            return None
+        content = self._read(self._index_file(directory))
+        if content is None or content["mtime"] != self._mtime(directory):
+            return None
+        return content["entries"].get(key)
+
+    def put(self, directory: str, key, value) -> bool:
+        """Add value for directory to index
+
+        Parameters
+        ----------
+        directory : str
+            indexed directory.
+        key
+            hashable key of value (e.g. a tuple of search settings).
+        value
+            value to be stored (must be picklable).
+
+        Returns
+        -------
+        bool
+            True if value was written to the index, else False.
+        """
+        if not self.enabled:
+            return False
+        mtime = self._mtime(directory)
+        if mtime is None or time.time() - mtime / 1e9 < self.MIN_AGE_SECONDS:
+            return False
+        fp = self._index_file(directory)
+        content = self._read(fp)
+        if content is None or content["mtime"] != mtime:
+            content = dict(version=self.__version__, mtime=mtime, entries={})
+        content["entries"][key] = value
+        try:
+            os.makedirs(self.index_dir, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.index_dir, suffix=".tmp")
+        except OSError as e:
+            logger.info(f"Failed to write index file for {directory}: {repr(e)}")
+            return False
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(content, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, fp)
+        except Exception as e:
+            logger.info(f"Failed to write index file for {directory}: {repr(e)}")
+            os.remove(tmp)
+            return False
+        return True
+
+    def clear(self):
+        """Delete all index files of this index"""
+        if self.index_dir is None or not os.path.isdir(self.index_dir):
+            return
+        for fname in os.listdir(self.index_dir):
+            if fname.startswith(f"{self.name}_") and fname.endswith(".pkl"):
+                os.remove(os.path.join(self.index_dir, fname))
@@ -8,7 +8,10 @@ reading of Cubes, and some methods to perform quality checks of the data, e.g.
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from time import time
 
 import cf_units
 import iris
@@ -41,8 +44,14 @@ from pyaerocom.tstype import TsType
 
 logger = logging.getLogger(__name__)
 
+#: serialises calls of :func:`iris.load`, since the underlying netCDF / HDF5
+#: libraries are not thread-safe (and iris < 3.5 does not lock access to them)
+_IRIS_LOAD_LOCK = threading.Lock()
 
-def load_cubes_custom(files, var_name=None, file_convention=None, perform_fmt_checks=True):
+
+def load_cubes_custom(
+    files, var_name=None, file_convention=None, perform_fmt_checks=True, num_threads=None
+):
     """Load multiple NetCDF files into CubeList
 
     Note
@@ -64,6 +73,13 @@ def load_cubes_custom(files, var_name=None, file_convention=None, perform_fmt_ch
     perform_fmt_checks : bool
         if True, additional quality checks (and corrections) are (attempted to
         be) performed.
+    num_threads : int, optional
+        number of threads used to load the files concurrently. If None, the
+        value of :attr:`pyaerocom.grid_io.GridIO.LOAD_NUM_THREADS` is used.
+        The files are opened one at a time (cf. :func:`load_cube_custom`),
+        only the quality checks run concurrently. The order of the output is
+        the same as the order of the input files, irrespective of the number
+        of threads.
 
     Returns
     -------
@@ -73,27 +89,63 @@ def load_cubes_custom(files, var_name=None, file_convention=None, perform_fmt_ch
         list containing all files from which the input variable could be
         successfully loaded.
     """
+    if num_threads is None:
+        num_threads = const.GRID_IO.LOAD_NUM_THREADS
+    num_threads = max(1, min(int(num_threads), len(files)))
+
+    t0 = time()
+    load_args = (var_name, file_convention, perform_fmt_checks)
+    if num_threads == 1:
+        results = [_try_load_cube_timed(_file, *load_args) for _file in files]
+    else:
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            results = list(
+                executor.map(lambda _file: _try_load_cube_timed(_file, *load_args), files)
+            )
+
     cubes = []
     loaded_files = []
-    for i, _file in enumerate(files):
-        try:
-            cube = load_cube_custom(
-                file=_file,
-                var_name=var_name,
-                file_convention=file_convention,
-                perform_fmt_checks=perform_fmt_checks,
-            )
+    for _file, cube in zip(files, results):
+        if cube is not None:
             cubes.append(cube)
             loaded_files.append(_file)
-        except Exception:
-            msg = f"Failed to load {_file}. Reason: {format_exc()}"
-            logger.warning(msg)
-
-            if const.WRITE_FILEIO_ERR_LOG:
-                add_file_to_log(_file, msg)
+    logger.info(
+        f"Loaded {len(cubes)} of {len(files)} files in {time() - t0:.2f} s "
+        f"using {num_threads} thread(s)"
+    )
     return (cubes, loaded_files)
 
 
+def _try_load_cube_timed(file, var_name=None, file_convention=None, perform_fmt_checks=True):
+    """Load cube from file and log time needed for I/O and quality checks
+
+    Returns None (and logs a warning) if the file cannot be loaded.
+    """
+    if perform_fmt_checks is None:
+        perform_fmt_checks = const.GRID_IO.PERFORM_FMT_CHECKS
+    try:
+        t0 = time()
+        cube = load_cube_custom(
+            file=file,
+            var_name=var_name,
+            file_convention=file_convention,
+            perform_fmt_checks=False,
+        )
+        t1 = time()
+        if perform_fmt_checks:
+            cube = _cube_quality_check(cube, str(file), file_convention)
+        t2 = time()
+    except Exception:
+        msg = f"Failed to load {file}. Reason: {format_exc()}"
+        logger.warning(msg)
+
+        if const.WRITE_FILEIO_ERR_LOG:
+            add_file_to_log(file, msg)
+        return None
+    logger.debug(f"Loaded {file} (I/O: {t1 - t0:.3f} s, checks: {t2 - t1:.3f} s)")
+    return cube
+
+
 def load_cube_custom(file, var_name=None, file_convention=None, perform_fmt_checks=None):
     """Load netcdf file as iris.Cube
 
@@ -122,7 +174,10 @@ def load_cube_custom(file, var_name=None, file_convention=None, perform_fmt_chec
         file = str(file)  # iris load does not like PosixPath
     if perform_fmt_checks is None:
         perform_fmt_checks = const.GRID_IO.PERFORM_FMT_CHECKS
-    cube_list = iris.load(file)
+    # data is loaded lazily, and dimension coordinates (used in the quality
+    # checks) are loaded here, so no file access happens outside of the lock
+    with _IRIS_LOAD_LOCK:
+        cube_list = iris.load(file)
     cube = None
     if var_name is None:
         if not len(cube_list) == 1:
@@ -0,0 +1,267 @@
+"""
+Extraction of model data at station locations without loading full fields
+
+Colocation of gridded model data with station observations only requires the
+model values in the grid cells that contain the stations. The helpers in this
+module compute the nearest grid indices of a set of stations once and use
+them to index the (lazily opened) NetCDF variables, so that only the
+bounding box of the stations is read from disk, in blocks of
+:attr:`TIME_CHUNKS` time steps, instead of the full (time, lat, lon) fields. They are used by
+:func:`pyaerocom.io.ReadGridded.read_var_at_points` and
+:func:`pyaerocom.plugins.mscw_ctm.ReadMscwCtm.read_var_at_points`.
+"""
+import logging
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from pyaerocom import const
+from pyaerocom.exceptions import DataDimensionError, UnitConversionError
+from pyaerocom.units_helpers import UALIASES, get_unit_conversion_fac
+
+logger = logging.getLogger(__name__)
+
+#: name of station dimension in output arrays
+STATION_DIM = "station"
+
+#: default number of time steps read at once during point extraction
+TIME_CHUNKS = 240
+
+
+def find_latlon_dims(data):
+    """
+    Find names of latitude and longitude dimensions in xarray object
+
+    Parameters
+    ----------
+    data : xarray.DataArray or xarray.Dataset
+        input data.
+
+    Raises
+    ------
+    DataDimensionError
+        if no 1D latitude or longitude dimension can be found.
+
+    Returns
+    -------
+    str
+        name of latitude dimension
+    str
+        name of longitude dimension
+    """
+    found = []
+    for coord in ("lat", "lon"):
+        names = [coord] + list(const.COORDINFO[coord].aliases)
+        match = [name for name in names if name in data.dims]
+        if not match:
+            raise DataDimensionError(
+                f"Failed to find dimension for {coord} in {list(data.dims)}. "
+                f"Point extraction requires data on regular lat / lon grids"
+            )
+        found.append(match[0])
+    return tuple(found)
+
+
+def _half_steps(values):
+    """Half widths of first and last cell of sorted coordinate array"""
+    if len(values) < 2:
+        return 0.0, 0.0
+    return abs(values[1] - values[0]) / 2, abs(values[-1] - values[-2]) / 2
+
+
+def get_nearest_grid_indices(grid_lats, grid_lons, latitude, longitude):
+    """
+    Get indices of nearest grid cells for a set of coordinates
+
+    Parameters
+    ----------
+    grid_lats : array-like
+        1D array of grid latitudes (ascending or descending).
+    grid_lons : array-like
+        1D array of grid longitudes (ascending or descending, either in
+        -180 - 180 or 0 - 360 convention).
+    latitude : array-like
+        latitudes of stations.
+    longitude : array-like
+        longitudes of stations (any convention).
+
+    Returns
+    -------
+    ndarray
+        latitude indices of nearest grid cells
+    ndarray
+        longitude indices of nearest grid cells
+    ndarray
+        boolean mask that is False for coordinates that are outside of the
+        grid domain (their indices point to the closest cell at the domain
+        boundary).
+    """
+    grid_lats = np.asarray(grid_lats, dtype=float)
+    grid_lons = np.asarray(grid_lons, dtype=float)
+    latitude = np.asarray(latitude, dtype=float)
+    longitude = np.asarray(longitude, dtype=float)
+    if latitude.shape != longitude.shape or latitude.ndim != 1:
+        raise ValueError("latitude and longitude need to be 1D arrays of the same length")
+
+    lon0, lon1 = np.min(grid_lons), np.max(grid_lons)
+    lon_lo, lon_hi = _half_steps(np.sort(grid_lons))
+    step = 2 * max(lon_lo, lon_hi)
+    is_global = lon1 - lon0 + step >= 360 - 1e-6
+    if is_global:
+        # shift to grid range [lon0 - step / 2, lon0 - step / 2 + 360)
+        start = lon0 - step / 2
+        longitude = (longitude - start) % 360 + start
+    elif lon1 > 180:
+        longitude = longitude % 360
+    else:
+        longitude = (longitude + 180) % 360 - 180
+
+    lat_idx = pd.Index(grid_lats).get_indexer(latitude, method="nearest")
+    lon_idx = pd.Index(grid_lons).get_indexer(longitude, method="nearest")
+
+    lat_lo, lat_hi = _half_steps(np.sort(grid_lats))
+    in_domain = (latitude >= grid_lats.min() - lat_lo) & (latitude <= grid_lats.max() + lat_hi)
+    if not is_global:
+        in_domain &= (longitude >= lon0 - lon_lo) & (longitude <= lon1 + lon_hi)
+    return lat_idx, lon_idx, in_domain
+
+
+def extract_points(data, lat_idx, lon_idx, lat_dim, lon_dim):
+    """
+    Select grid cells at station indices
+
+    The data is first cropped to the bounding box of the stations (basic
+    slicing) and the station cells are then selected from the cropped data.
+    If `data` is opened lazily with dask chunks along the time dimension
+    (e.g. ``xarray.open_dataset(file, chunks={"time": 240})``), loading the
+    result reads only the bounding box of the stations from disk, one time
+    chunk at a time. The selected latitude / longitude coordinates are
+    renamed to ``grid_latitude`` and ``grid_longitude``.
+
+    Parameters
+    ----------
+    data : xarray.DataArray or xarray.Dataset
+        gridded data.
+    lat_idx : array-like
+        latitude indices of stations (cf. :func:`get_nearest_grid_indices`).
+    lon_idx : array-like
+        longitude indices of stations.
+    lat_dim : str
+        name of latitude dimension.
+    lon_dim : str
+        name of longitude dimension.
+
+    Returns
+    -------
+    xarray.DataArray or xarray.Dataset
+        data with lat / lon dimensions replaced by dimension ``station``
+    """
+    lat_idx = np.asarray(lat_idx)
+    lon_idx = np.asarray(lon_idx)
+    if len(lat_idx) == 0:
+        raise ValueError("need at least one station location")
+    lat0, lon0 = lat_idx.min(), lon_idx.min()
+    box = {
+        lat_dim: slice(lat0, lat_idx.max() + 1),
+        lon_dim: slice(lon0, lon_idx.max() + 1),
+    }
+    where = {
+        lat_dim: xr.DataArray(lat_idx - lat0, dims=STATION_DIM),
+        lon_dim: xr.DataArray(lon_idx - lon0, dims=STATION_DIM),
+    }
+    subset = data.isel(box).isel(where)
+    names = {lat_dim: "grid_latitude", lon_dim: "grid_longitude"}
+    return subset.rename({old: new for old, new in names.items() if old in subset.coords})
+
+
+def convert_points_unit(arr, var_name, ts_type=None):
+    """
+    Convert unit of extracted point data to AeroCom default unit
+
+    Same logic as :func:`pyaerocom.GriddedData.check_unit`: the unit string
+    is updated if it is equivalent to the AeroCom unit of the variable,
+    else the data is converted. If conversion fails, a warning is logged and
+    the data is returned unchanged.
+
+    Parameters
+    ----------
+    arr : xarray.DataArray
+        point data, ``units`` are taken from its attributes.
+    var_name : str
+        AeroCom variable name.
+    ts_type : str, optional
+        frequency of data (required for conversion of some rate variables).
+
+    Returns
+    -------
+    xarray.DataArray
+        data in AeroCom default unit (if conversion was possible)
+    """
+    to_unit = const.VARS[var_name].units
+    from_unit = arr.attrs.get("units")
+    if from_unit in UALIASES:
+        from_unit = UALIASES[from_unit]
+    if from_unit is None:
+        if to_unit == "1":
+            arr.attrs["units"] = to_unit
+        return arr
+    if from_unit == to_unit:
+        arr.attrs["units"] = to_unit
+        return arr
+    try:
+        fac = get_unit_conversion_fac(from_unit, to_unit, var_name, ts_type)
+    except (UnitConversionError, ValueError) as e:
+        logger.warning(f"Failed to convert unit from {from_unit} to {to_unit}. Reason: {e}")
+        arr.attrs["units"] = from_unit
+        return arr
+    attrs = dict(arr.attrs)
+    if fac != 1:
+        arr = arr * fac
+    attrs["units"] = to_unit
+    arr.attrs = attrs
+    return arr
+
+
+def finalise_points(arr, var_name, latitude, longitude, in_domain, **attrs):
+    """
+    Convert loaded point data into (time, station) output array
+
+    Stations outside the grid domain are set to NaN and the input station
+    coordinates are added as coordinates ``latitude`` and ``longitude`` of
+    the station dimension.
+
+    Parameters
+    ----------
+    arr : xarray.DataArray
+        loaded point data (cf. :func:`extract_points`).
+    var_name : str
+        name of output array.
+    latitude : array-like
+        input station latitudes.
+    longitude : array-like
+        input station longitudes.
+    in_domain : ndarray
+        mask of stations inside grid domain.
+    **attrs
+        additional attributes of output array (e.g. ts_type, data_id).
+
+    Returns
+    -------
+    xarray.DataArray
+        output array with first two dimensions (time, station)
+    """
+    if not in_domain.all():
+        arr = arr.where(xr.DataArray(in_domain, dims=STATION_DIM))
+    arr = arr.assign_coords(
+        {
+            STATION_DIM: np.arange(len(in_domain)),
+            "latitude": (STATION_DIM, np.asarray(latitude, dtype=float)),
+            "longitude": (STATION_DIM, np.asarray(longitude, dtype=float)),
+        }
+    )
+    arr = arr.transpose("time", STATION_DIM, ...)
+    arr.name = var_name
+    arr.attrs["var_name"] = var_name
+    arr.attrs.update(attrs)
+    return arr
@@ -8,7 +8,7 @@ import pandas as pd
 from pyaerocom.helpers import get_tot_number_of_seconds
 from pyaerocom.io.readungriddedbase import ReadUngriddedBase
 from pyaerocom.stationdata import StationData
-from pyaerocom.ungriddeddata import UngriddedData
+from pyaerocom.ungriddeddata import UngriddedDataBuilder
 from pyaerocom.units_helpers import convert_unit
 
 logger = logging.getLogger(__name__)
@@ -233,15 +233,7 @@ class ReadAasEtal(ReadUngriddedBase):
             vars_to_retrieve = self.DEFAULT_VARS
         elif isinstance(vars_to_retrieve, str):
             vars_to_retrieve = [vars_to_retrieve]
-        data_obj = UngriddedData()
-
-        meta_key = 0.0
-        idx = 0
-        varindex = -1
-
-        # assign metadata object
-        metadata = data_obj.metadata  # dict
-        meta_idx = data_obj.meta_idx  # dict
+        builder = UngriddedDataBuilder()
 
         for file in files:
             filename = os.path.basename(file)
@@ -252,69 +244,36 @@ class ReadAasEtal(ReadUngriddedBase):
                 continue
             stat_list = self.read_file(file, vars_to_retrieve=var_matches)
             for stat in stat_list:
-                # self.counter += 1
-                metadata[meta_key] = {}
-                metadata[meta_key].update(stat.get_meta())
-                metadata[meta_key].update(stat.get_station_coords())
-                metadata[meta_key]["data_id"] = self.data_id
-                metadata[meta_key]["ts_type"] = self.TS_TYPE
-                # metadata[meta_key]['variables'] = stat["variables"]
+                meta = {}
+                meta.update(stat.get_meta())
+                meta.update(stat.get_station_coords())
+                meta["data_id"] = self.data_id
+                meta["ts_type"] = self.TS_TYPE
                 # Is instrumentname
                 if "instrument_name" in stat and stat["instrument_name"] is not None:
                     instr = stat["instrument_name"]
                 else:
                     instr = self.INSTRUMENT_NAME
 
-                metadata[meta_key]["instrument_name"] = instr
-                metadata[meta_key]["data_revision"] = self.data_revision
-
-                # this is a list with indices of this station for each variable
-                # not sure yet, if we really need that or if it speeds up things
-                meta_idx[meta_key] = {}
-
-                num_times = len(stat["dtime"])
-                num_vars = len(stat["var_info"])
-                temp_vars = list(stat["var_info"])
-                tconv = stat["dtime"].astype("datetime64[s]")
-                times = np.float64(tconv)
-                totnum = num_times * num_vars
-
-                if (idx + totnum) >= data_obj._ROWNO:
-                    # This results in a error because it doesn't want to multiply empty with nan
-                    data_obj.add_chunk(totnum)
-
-                metadata[meta_key]["var_info"] = {}
-                for var_count, var in enumerate(temp_vars):
-
-                    values = stat[var]
-                    start = idx + var_count * num_times
-                    stop = start + num_times
-
-                    if not var in data_obj.var_idx:
-                        varindex += 1
-                        data_obj.var_idx[var] = varindex
-                        var_idx = varindex
-                    else:
-                        var_idx = data_obj.var_idx[var]
-
-                    metadata[meta_key]["var_info"][var] = stat["var_info"][var]
-
-                    data_obj._data[start:stop, data_obj._LATINDEX] = stat["latitude"]
-                    data_obj._data[start:stop, data_obj._LONINDEX] = stat["longitude"]
-                    data_obj._data[start:stop, data_obj._ALTITUDEINDEX] = stat["altitude"]
-                    data_obj._data[start:stop, data_obj._METADATAKEYINDEX] = meta_key
-
-                    # write data to data object
-                    data_obj._data[start:stop, data_obj._TIMEINDEX] = times
-                    data_obj._data[start:stop, data_obj._DATAINDEX] = values
-                    data_obj._data[start:stop, data_obj._VARINDEX] = var_idx
-
-                    meta_idx[meta_key][var] = np.arange(start, stop)
-
-                meta_key += 1
-                idx += totnum
-
-        data_obj._data = data_obj._data[:idx]
+                meta["instrument_name"] = instr
+                meta["data_revision"] = self.data_revision
+                meta["var_info"] = {}
+                meta_key = builder.add_meta(meta)
+
+                times = stat["dtime"]
+                for var in stat["var_info"]:
+                    meta["var_info"][var] = stat["var_info"][var]
+                    builder.add_var(
+                        meta_key,
+                        var,
+                        times,
+                        stat[var],
+                        stat["latitude"],
+                        stat["longitude"],
+                        stat["altitude"],
+                    )
+
+        data_obj = builder.build()
         # sanity check
         data_obj._check_index()
         self.data = data_obj  # initalizing a pointer to it selves
@@ -1,11 +1,13 @@
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from glob import glob
 
 import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
+from pyaerocom import const
 from pyaerocom.exceptions import DataRetrievalError
 from pyaerocom.io import ReadUngriddedBase
 from pyaerocom.stationdata import StationData
@@ -26,7 +28,7 @@ class ReadAirNow(ReadUngriddedBase):
     _FILEMASK = f"/**/*{_FILETYPE}"
 
     #: Version log of this class (for caching)
-    __version__ = "0.07"
+    __version__ = "0.08"
 
     #: Column delimiter
     FILE_COL_DELIM = "|"
@@ -44,6 +46,10 @@ class ReadAirNow(ReadUngriddedBase):
         "institute",
     ]
 
+    #: dtypes of columns in data files that are not inferred (station IDs
+    #: are kept as strings, as in the station metadata file)
+    FILE_COL_DTYPES = {"date": str, "time": str, "station_id": str}
+
     #: Mapping of columns in station metadata file to pyaerocom standard
     STATION_META_MAP = {
         "aqsid": "station_id",
@@ -132,6 +138,9 @@ class ReadAirNow(ReadUngriddedBase):
         super().__init__(data_id=data_id, data_dir=data_dir)
         self.make_datetime64_array = np.vectorize(self._date_time_str_to_datetime64)
         self._station_metadata = None
+        #: number of threads used for reading of files (if None,
+        #: :attr:`pyaerocom.const.OBS_READ_NUM_WORKERS` is used)
+        self.num_workers = None
 
     @property
     def station_metadata(self):
@@ -161,6 +170,36 @@ class ReadAirNow(ReadUngriddedBase):
         # returns as datetime64[s]
         return np.datetime64(f"{yr}-{mm}-{dd}T{HH}:{MM}:00")
 
+    def _date_time_arrays_to_datetime64(self, dates, times):
+        """
+        Convert arrays of date and time strings into datetime64 array
+
+        Vectorised version of :func:`_date_time_str_to_datetime64`. Since
+        the files contain only few distinct dates and times, these are
+        parsed only once each.
+
+        Parameters
+        ----------
+        dates : array-like
+            date strings as mm/dd/yy as in data files
+        times : array-like
+            times of the day as HH:MM
+
+        Returns
+        -------
+        ndarray
+            datetime64[s] array
+        """
+        date_codes, dates = pd.factorize(np.asarray(dates))
+        time_codes, times = pd.factorize(np.asarray(times))
+        mdy = pd.Series(dates).str.split("/", expand=True).astype(int).values
+        hm = pd.Series(times).str.split(":", expand=True).astype(int).values
+        months = (self.BASEYEAR + mdy[:, 2] - 1970) * 12 + mdy[:, 0] - 1
+        days = months.astype("datetime64[M]").astype("datetime64[D]")
+        days = (days + (mdy[:, 1] - 1).astype("timedelta64[D]")).astype("datetime64[s]")
+        secs = (hm[:, 0] * 3600 + hm[:, 1] * 60).astype("timedelta64[s]")
+        return days[date_codes] + secs[time_codes]
+
     def _datetime64_from_filename(self, filepath):
         """
         Get timestamp from filename
@@ -280,13 +319,42 @@ class ReadAirNow(ReadUngriddedBase):
             DataFrame containing the file data
 
         """
-        df = pd.read_csv(file, sep=self.FILE_COL_DELIM, names=self.FILE_COL_NAMES)
+        df = pd.read_csv(
+            file,
+            sep=self.FILE_COL_DELIM,
+            names=self.FILE_COL_NAMES,
+            dtype=self.FILE_COL_DTYPES,
+        )
         return df
 
+    def _read_file_vars(self, file, file_vars):
+        """
+        Read one datafile and extract rows of input variables
+
+        Parameters
+        ----------
+        file : str
+            file path
+        file_vars : list
+            variable names as used in the data files (cf. :attr:`VAR_MAP`)
+
+        Returns
+        -------
+        pandas.DataFrame
+            rows of input variables
+        """
+        df = self._read_file(file)
+        return df[df["variable"].isin(file_vars)]
+
     def _read_files(self, files, vars_to_retrieve):
         """
         Read input variables from list of files
 
+        Note
+        ----
+        Files are read in a thread pool if :attr:`num_workers` (or
+        :attr:`pyaerocom.const.OBS_READ_NUM_WORKERS`) is larger than 1.
+
         Parameters
         ----------
         files : list
@@ -296,10 +364,8 @@ class ReadAirNow(ReadUngriddedBase):
 
         Raises
         ------
-        NotImplementedError
-            if several timezones are assigned to the same station
-        AttributeError
-            if data unit is unkown
+        DataRetrievalError
+            if none of the input variables can be found in the files
 
         Returns
         -------
@@ -308,36 +374,30 @@ class ReadAirNow(ReadUngriddedBase):
 
         """
         logger.info("Read AirNow data file(s)")
-        # initialize empty dataframe
-        varcol = self.FILE_COL_NAMES.index("variable")
-        arrs = []
-        for i in tqdm(range(len(files))):
-            fp = files[i]
-            filedata = self._read_file(fp)
-            arr = filedata.values
-
-            for i, var in enumerate(vars_to_retrieve):
-                cond = arr[:, varcol] == self.VAR_MAP[var]
-                if i == 0:
-                    mask = cond
-                else:
-                    mask = np.logical_or(mask, cond)
-            matches = mask.sum()
-            if matches:
-                vardata = arr[mask]
-                arrs.append(vardata)
-        if len(arrs) == 0:
+        file_vars = [self.VAR_MAP[var] for var in vars_to_retrieve]
+        num_workers = self.num_workers
+        if num_workers is None:
+            num_workers = const.OBS_READ_NUM_WORKERS
+        num_workers = max(1, min(num_workers, len(files)))
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            results = executor.map(lambda fp: self._read_file_vars(fp, file_vars), files)
+            dfs = [df for df in tqdm(results, total=len(files)) if len(df) > 0]
+        if len(dfs) == 0:
             raise DataRetrievalError("None of the input variables could be found in input list")
-        return self._filedata_to_statlist(arrs, vars_to_retrieve)
+        return self._filedata_to_statlist(dfs, vars_to_retrieve)
 
-    def _filedata_to_statlist(self, arrs, vars_to_retrieve):
+    def _filedata_to_statlist(self, dfs, vars_to_retrieve):
         """
         Convert loaded filedata into list of StationData objects
 
+        The rows of each variable are grouped by station ID in one go by
+        sorting them by station (keeping the order of the rows within each
+        station).
+
         Parameters
         ----------
-        arrs : list
-            list of numpy arrays extracted from each file
+        dfs : list
+            list of dataframes extracted from each file
             (see :func:`_read_files`).
         vars_to_retrieve : list
             list of variables to be retrieved from input data.
@@ -348,51 +408,43 @@ class ReadAirNow(ReadUngriddedBase):
             list of :class:`StationData` objects, one for each var and station.
 
         """
-        data = np.concatenate(arrs)
+        data = pd.concat(dfs, ignore_index=True)
 
-        logger.info("Converting filedata to list os StationData")
+        logger.info("Converting filedata to list of StationData")
         stat_meta = self.station_metadata
-        stat_ids = list(stat_meta)
-        varcol = self.FILE_COL_NAMES.index("variable")
-        statcol = self.FILE_COL_NAMES.index("station_id")
-        tzonecol = self.FILE_COL_NAMES.index("time_zone")
-        unitcol = self.FILE_COL_NAMES.index("unit")
-        valcol = self.FILE_COL_NAMES.index("value")
-
-        dtime = self.make_datetime64_array(data[:, 0], data[:, 1])
+
+        # timestamps in UTC
+        dtime = self._date_time_arrays_to_datetime64(data["date"], data["time"])
+        dtime += data["time_zone"].values.astype(int).astype("timedelta64[h]")
+        variables = data["variable"].values
+        stat_ids = data["station_id"].fillna("").values
+        unit_codes, units = pd.factorize(data["unit"])
+        values = data["value"].values
         stats = []
         for var in vars_to_retrieve:
-
-            # extract only variable data (should speed things up)
-            var_in_file = self.VAR_MAP[var]
-            mask = data[:, varcol] == var_in_file
-            subset = data[mask]
-            dtime_subset = dtime[mask]
-            statlist = np.unique(subset[:, statcol])
-            for stat_id in tqdm(statlist, desc=var):
-                if not stat_id in stat_ids:
+            mask = variables == self.VAR_MAP[var]
+            if not mask.any():
+                continue
+            statlist, stat_idx = np.unique(stat_ids[mask], return_inverse=True)
+            order = np.argsort(stat_idx, kind="stable")
+            counts = np.bincount(stat_idx, minlength=len(statlist))
+            stops = np.cumsum(counts)
+            var_dtime = dtime[mask][order]
+            var_vals = values[mask][order]
+            var_units = unit_codes[mask][order]
+            for stat_id, start, stop in zip(tqdm(statlist, desc=var), stops - counts, stops):
+                if not stat_id in stat_meta:
                     continue
-                statmask = subset[:, statcol] == stat_id
-                if statmask.sum() == 0:
-                    continue
-                statdata = subset[statmask]
-                timestamps = dtime_subset[statmask]
-                # timezone offsets
-                toffs = statdata[:, tzonecol].astype(int)
-                stat = StationData(**stat_meta[stat_id])
-
-                vals = statdata[:, valcol]
-                units = np.unique(statdata[:, unitcol])
+                unit_idx = np.unique(var_units[start:stop])
                 # errors that did not occur in v0 but that may occur
-                assert len(units) == 1
-                assert units[0] in self.UNIT_MAP
-                toffs = toffs.astype("timedelta64[h]")
-                timestamps += toffs
-                stat["dtime"] = timestamps
+                assert len(unit_idx) == 1
+                # missing units have code -1 (not an index into units)
+                assert unit_idx[0] >= 0 and units[unit_idx[0]] in self.UNIT_MAP
+                stat = StationData(**stat_meta[stat_id])
+                stat["dtime"] = var_dtime[start:stop]
                 stat["timezone"] = "UTC"
-                stat[var] = vals
-                unit = self.UNIT_MAP[units[0]]
-                stat["var_info"][var] = dict(units=unit)
+                stat[var] = var_vals[start:stop]
+                stat["var_info"][var] = dict(units=self.UNIT_MAP[units[unit_idx[0]]])
                 stats.append(stat)
         return stats
 
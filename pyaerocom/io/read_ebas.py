@@ -2,6 +2,7 @@ import fnmatch
 import logging
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 from geonum.atmosphere import T0_STD, p0
@@ -38,7 +39,7 @@ from pyaerocom.io.readungriddedbase import ReadUngriddedBase
 from pyaerocom.molmasses import get_molmass
 from pyaerocom.stationdata import StationData
 from pyaerocom.tstype import TsType
-from pyaerocom.ungriddeddata import UngriddedData
+from pyaerocom.ungriddeddata import UngriddedDataBuilder
 from pyaerocom.units_helpers import get_unit_conversion_fac
 
 logger = logging.getLogger(__name__)
@@ -280,6 +281,10 @@ class ReadEbas(ReadUngriddedBase):
     #: attributes
     IGNORE_COLS_CONTAIN = ["fraction", "artifact"]
 
+    #: each station metadata block is read from a single file (cf.
+    #: :class:`ReadUngriddedBase`)
+    SUPPORTS_INCREMENTAL_CACHE = True
+
     # list of all available resolution codes (extracted from SQLite database)
     # 1d 1h 1mo 1w 4w 30mn 2w 3mo 2d 3d 4d 12h 10mn 2h 5mn 6d 3h 15mn
 
@@ -326,6 +331,10 @@ class ReadEbas(ReadUngriddedBase):
 
         self._all_stats = None
 
+        #: number of worker processes used for reading of files (if None,
+        #: :attr:`pyaerocom.const.OBS_READ_NUM_WORKERS` is used)
+        self.num_workers = None
+
     @property
     def DEFAULT_VARS(self):
         """
@@ -591,6 +600,23 @@ class ReadEbas(ReadUngriddedBase):
             )
         return files
 
+    def get_source_files(self, vars_to_retrieve):
+        """Get list of all source files containing input variables
+
+        Used for incremental caching (cf. :class:`CacheHandlerUngridded`).
+
+        Parameters
+        ----------
+        vars_to_retrieve : list or str
+            list of variables
+
+        Returns
+        -------
+        list
+            list of file paths
+        """
+        return self.get_file_list(vars_to_retrieve)
+
     def _merge_auxvar_lists(self, aux_var, files_aux_req):
         """
         Merge lists of variables required for input aux_var
@@ -1693,55 +1719,67 @@ class ReadEbas(ReadUngriddedBase):
 
         return data
 
+    def _iter_read_files(self, files, files_contain):
+        """Iterate over input files and read them (in input order)
+
+        Parameters
+        ----------
+        files : list
+            list of file paths
+        files_contain : list
+            list of variables to be read from each file
+
+        Yields
+        ------
+        str
+            file path
+        StationData or Exception
+            data read from file or exception that was raised during reading
+        """
+        num_workers = self.num_workers
+        if num_workers is None:
+            num_workers = const.OBS_READ_NUM_WORKERS
+        num_workers = min(num_workers, len(files))
+        if num_workers <= 1:
+            for _file, contains in tqdm(zip(files, files_contain), total=len(files)):
+                try:
+                    yield _file, self.read_file(_file, vars_to_retrieve=contains)
+                except Exception as e:
+                    yield _file, e
+            return
+
+        logger.info(f"Reading {len(files)} EBAS files using {num_workers} processes")
+        # a couple of chunks per worker to balance load and limit IPC overhead
+        chunksize = max(1, len(files) // (num_workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_read_worker,
+            initargs=(self.data_id, self._opts),
+        ) as executor:
+            results = executor.map(_read_file_worker, files, files_contain, chunksize=chunksize)
+            yield from tqdm(zip(files, results), total=len(files))
+
     def _read_files(self, files, vars_to_retrieve, files_contain, constraints):
         """Helper that reads list of files into UngriddedData
 
         Note
         ----
         This method is not supposed to be called directly but is used in
-        :func:`read` and serves the purpose of parallel loading of data
+        :func:`read`. Files are read in parallel if :attr:`num_workers`
+        (or :attr:`pyaerocom.const.OBS_READ_NUM_WORKERS`) is larger than 1.
+        The output is the same as for serial reading.
         """
         self.files_failed = []
-        data_obj = UngriddedData(num_points=1000000)
+        builder = UngriddedDataBuilder()
 
-        # Add reading options to filter "history of UngriddedDataObject"
-        filters = self.readopts_default.filter_dict
-        filters.update(constraints)
-        data_obj._add_to_filter_history(filters)
-
-        meta_key = 0.0
-        idx = 0
-
-        # assign metadata object
-        metadata = data_obj.metadata
-        meta_idx = data_obj.meta_idx
-
-        # counter that is updated whenever a new variable appears during read
-        # (is used for attr. var_idx in UngriddedData object)
-        var_count_glob = -1
         logger.info(f"Reading EBAS data from {self.file_dir}")
         num_files = len(files)
-        for i in tqdm(range(num_files)):
-            _file = files[i]
-            contains = files_contain[i]
-            try:
-                station_data = self.read_file(_file, vars_to_retrieve=contains)
-
-            except (
-                NotInFileError,
-                EbasFileError,
-                TemporalResolutionError,
-                TemporalSamplingError,
-            ) as e:
-                self.files_failed.append(_file)
-                self.logger.warning(
-                    f"Skipping reading of EBAS NASA Ames file: {_file}. Reason: {repr(e)}"
-                )
-                continue
-            except Exception as e:
+        for _file, station_data in self._iter_read_files(files, files_contain):
+            if isinstance(station_data, Exception):
                 self.files_failed.append(_file)
                 logger.warning(
-                    f"Skipping reading of EBAS NASA Ames file: {_file}. Reason: {repr(e)}"
+                    f"Skipping reading of EBAS NASA Ames file: {_file}. "
+                    f"Reason: {repr(station_data)}"
                 )
                 continue
 
@@ -1749,84 +1787,68 @@ class ReadEbas(ReadUngriddedBase):
             # the location in the data set is time step dependent!
             # use the lat location here since we have to choose one location
             # in the time series plot
-            metadata[meta_key] = {}
-            metadata[meta_key].update(station_data.get_meta(add_none_vals=True))
+            meta = station_data.get_meta(add_none_vals=True)
 
             if "station_name_orig" in station_data:
-                metadata[meta_key]["station_name_orig"] = station_data["station_name_orig"]
+                meta["station_name_orig"] = station_data["station_name_orig"]
 
-            metadata[meta_key]["data_revision"] = self.data_revision
-            metadata[meta_key]["var_info"] = {}
-            # this is a list with indices of this station for each variable
-            # not sure yet, if we really need that or if it speeds up things
-            meta_idx[meta_key] = {}
-
-            num_times = len(station_data["dtime"])
+            meta["data_revision"] = self.data_revision
+            meta["var_info"] = {}
+            meta_key = builder.add_meta(meta)
 
             contains_vars = list(station_data.var_info)
             # access array containing time stamps
             # TODO: check using index instead (even though not a problem here
             # since all Aerocom data files are of type timeseries)
-            times = np.float64(station_data["dtime"])
+            times = station_data["dtime"]
 
             append_vars = [x for x in np.intersect1d(vars_to_retrieve, contains_vars)]
 
-            totnum = num_times * len(append_vars)
-
-            # check if size of data object needs to be extended
-            if (idx + totnum) >= data_obj._ROWNO:
-                # if totnum < data_obj._CHUNKSIZE, then the latter is used
-                data_obj.add_chunk(totnum)
-
-            for var_count, var in enumerate(append_vars):
-                # data values
-                values = station_data[var]
-
-                # get start / stop index for this data vector
-                start = idx + var_count * num_times
-                stop = start + num_times
+            for var in append_vars:
+                # data lon, lat and altitude are set to station locations
+                builder.add_var(
+                    meta_key,
+                    var,
+                    times,
+                    station_data[var],
+                    station_data["latitude"],
+                    station_data["longitude"],
+                    station_data["altitude"],
+                    data_flagged=station_data.data_flagged.get(var),
+                    data_err=station_data.data_err.get(var),
+                )
+                meta["var_info"][var] = {}
+                meta["var_info"][var].update(station_data["var_info"][var])
 
-                if not var in data_obj.var_idx:
-                    var_count_glob += 1
-                    var_idx = var_count_glob
-                    data_obj.var_idx[var] = var_idx
-                else:
-                    var_idx = data_obj.var_idx[var]
+            meta["variables"] = append_vars
 
-                # write common meta info for this station (data lon, lat and
-                # altitude are set to station locations)
-                data_obj._data[start:stop, data_obj._LATINDEX] = station_data["latitude"]
-                data_obj._data[start:stop, data_obj._LONINDEX] = station_data["longitude"]
-                data_obj._data[start:stop, data_obj._ALTITUDEINDEX] = station_data["altitude"]
-                data_obj._data[start:stop, data_obj._METADATAKEYINDEX] = meta_key
+        data_obj = builder.build()
 
-                # write data to data object
-                data_obj._data[start:stop, data_obj._TIMEINDEX] = times
+        # Add reading options to filter "history of UngriddedDataObject"
+        filters = self.readopts_default.filter_dict
+        filters.update(constraints)
+        data_obj._add_to_filter_history(filters)
 
-                data_obj._data[start:stop, data_obj._DATAINDEX] = values
+        num_failed = len(self.files_failed)
+        if num_failed > 0:
+            logger.warning(f"{num_failed} out of {num_files} could not be read...")
+        return data_obj
 
-                data_obj._data[start:stop, data_obj._VARINDEX] = var_idx
 
-                if var in station_data.data_flagged:
-                    invalid = station_data.data_flagged[var]
-                    data_obj._data[start:stop, data_obj._DATAFLAGINDEX] = invalid
-                if var in station_data.data_err:
-                    errs = station_data.data_err[var]
-                    data_obj._data[start:stop, data_obj._DATAERRINDEX] = errs
+#: instance of ReadEbas in worker processes of :func:`ReadEbas._iter_read_files`
+_WORKER_READER = None
 
-                var_info = station_data["var_info"][var]
-                metadata[meta_key]["var_info"][var] = {}
-                metadata[meta_key]["var_info"][var].update(var_info)
-                meta_idx[meta_key][var] = np.arange(start, stop)
 
-            metadata[meta_key]["variables"] = append_vars
-            idx += totnum
-            meta_key += 1
+def _init_read_worker(data_id, opts):
+    """Initialise reader in worker process for parallel reading of EBAS files"""
+    global _WORKER_READER
+    _WORKER_READER = ReadEbas(data_id=data_id)
+    _WORKER_READER._opts = opts
 
-        # shorten data_obj._data to the right number of points
-        data_obj._data = data_obj._data[:idx]
 
-        num_failed = len(self.files_failed)
-        if num_failed > 0:
-            logger.warning(f"{num_failed} out of {num_files} could not be read...")
-        return data_obj
+def _read_file_worker(filename, vars_to_retrieve):
+    """Read single EBAS file in worker process (exceptions are returned)"""
+    try:
+        return _WORKER_READER.read_file(filename, vars_to_retrieve=vars_to_retrieve)
+    except Exception as e:
+        return e
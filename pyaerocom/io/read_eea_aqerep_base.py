@@ -5,14 +5,14 @@ import gzip
 import logging
 import os
 import pathlib
-import shutil
-import tempfile
+from concurrent.futures import ProcessPoolExecutor
 
 import cf_units
 import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
+from pyaerocom import const
 from pyaerocom.exceptions import EEAv2FileError, TemporalResolutionError
 from pyaerocom.io.helpers import get_country_name_from_iso
 from pyaerocom.io.readungriddedbase import ReadUngriddedBase
@@ -38,7 +38,7 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
     _FILEMASK = "*.csv"
 
     #: Version log of this class (for caching)
-    __version__ = "0.08"
+    __version__ = "0.09"
 
     #: Column delimiter
     FILE_COL_DELIM = ","
@@ -159,10 +159,6 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
     #: there's no general instrument name in the data
     INSTRUMENT_NAME = "unknown"
 
-    #: max time steps to read per file (hourly data)
-    # to make numpy array allocation size static
-    MAX_LINES_TO_READ = 24 * 366
-
     #: file name of the metadata file
     #: this will be prepended with a data path later on
     # this file is in principe updated once a day.
@@ -212,6 +208,9 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
     def __init__(self, data_id=None, data_dir=None):
         super().__init__(data_id=data_id, data_dir=data_dir)
         self._metadata = None
+        #: number of worker processes used for reading of files (if None,
+        #: :attr:`pyaerocom.const.OBS_READ_NUM_WORKERS` is used)
+        self.num_workers = None
 
     @property
     def DEFAULT_VARS(self):
@@ -223,6 +222,97 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
         """Name of the dataset"""
         return self.data_id
 
+    @staticmethod
+    def _parse_times(times):
+        """Convert timestamps in data files into UTC
+
+        The timestamps (e.g. 2020-01-04 00:00:00 +01:00) are decoded
+        digit by digit on a fixed-width character array (no per-string
+        parsing).
+
+        Parameters
+        ----------
+        times : array-like
+            time strings as found in the data files
+
+        Returns
+        -------
+        ndarray
+            datetime64[s] array of UTC times, invalid strings are NaT
+        """
+        times = np.asarray(times, dtype="U26")
+        chars = times.view(np.uint32).reshape(len(times), 26).astype(np.int64)
+        digits = chars - ord("0")
+
+        def num(first, last):
+            out = np.zeros(len(times), dtype=np.int64)
+            for i in range(first, last):
+                out = out * 10 + digits[:, i]
+            return out
+
+        digit_cols = [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18, 21, 22, 24, 25]
+        valid = ((digits[:, digit_cols] >= 0) & (digits[:, digit_cols] <= 9)).all(axis=1)
+        valid &= np.isin(chars[:, 20], [ord("+"), ord("-")])
+        month, day = num(5, 7), num(8, 10)
+        valid &= (month >= 1) & (month <= 12) & (day >= 1) & (day <= 31)
+
+        months = np.where(valid, (num(0, 4) - 1970) * 12 + month - 1, 0)
+        dates = months.astype("datetime64[M]").astype("datetime64[D]")
+        dates = dates + np.where(valid, day - 1, 0).astype("timedelta64[D]")
+        offset = np.where(chars[:, 20] == ord("-"), -1, 1) * (
+            num(21, 23) * 3600 + num(24, 26) * 60
+        )
+        secs = num(11, 13) * 3600 + num(14, 16) * 60 + num(17, 19) - offset
+        out = dates.astype("datetime64[s]") + np.where(valid, secs, 0).astype("timedelta64[s]")
+        out[~valid] = np.datetime64("NaT")
+        return out
+
+    def _read_csv(self, filename, num_cols):
+        """Read columns of a data file into a DataFrame of strings
+
+        Gzipped files are decompressed on the fly. Input files can be either
+        UTF-8 or UTF-16 encoded.
+
+        Parameters
+        ----------
+        filename : str
+            Absolute path to filename to read.
+        num_cols : int
+            number of columns to be read (further columns are ignored, missing
+            trailing fields are set to empty strings)
+
+        Raises
+        ------
+        EEAv2FileError
+            if the file cannot be read or contains less than ``num_cols``
+            columns
+
+        Returns
+        -------
+        pandas.DataFrame
+            file content with lower case column names
+        """
+        for encoding in ("UTF-8", "UTF-16"):
+            try:
+                df = pd.read_csv(
+                    filename,
+                    sep=self.FILE_COL_DELIM,
+                    usecols=range(num_cols),
+                    dtype=str,
+                    na_filter=False,
+                    encoding=encoding,
+                    engine="c",
+                )
+                break
+            except UnicodeError:
+                continue
+            except Exception:
+                raise EEAv2FileError(f"Found corrupt file {filename}. consider deleting it")
+        else:
+            raise EEAv2FileError(f"Found corrupt file {filename}. consider deleting it")
+        df.columns = [col.lower().strip() for col in df.columns]
+        return df
+
     def read_file(self, filename, var_name, vars_as_series=False):
         """Read a single EEA file
 
@@ -250,14 +340,10 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
         # there's only one variable in the file
         aerocom_var_name = var_name
 
-        # Iterate over the lines of the file
         self.logger.info(f"Reading file {filename}")
-        file_delimiter = self.FILE_COL_DELIM
         # this lists the data to keep from the original read string
         # this becomes a time series
         file_indexes_to_keep = [11, 13, 14, 15, 16]
-        # used for line length control...
-        max_file_index_to_keep = max(file_indexes_to_keep)
         # this is some header information
         header_indexes_to_keep = [
             0,
@@ -270,101 +356,46 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
         # These are the indexes with a time and are stored as np.datetime64
         time_indexes = [13, 14]
 
-        # read the file
-        # enable alternative reading of .gz files here to save space on the file system
-        suffix = pathlib.Path(filename).suffix
-        if suffix == ".gz":
-            f_out = tempfile.NamedTemporaryFile(delete=False)
-            with gzip.open(filename, "r") as f_in:
-                shutil.copyfileobj(f_in, f_out)
-            read_filename = f_out.name
-            f_out.close()
-        else:
-            read_filename = filename
+        # DE,http://gdi.uba.de/arcgis/rest/services/inspire/DE.UBA.AQD,NET.DE_BB,STA.DE_DEBB054,DEBB054,SPO.DE_DEBB054_PM2_dataGroup1,SPP.DE_DEBB054_PM2_automatic_light-scat_Duration-30minute,SAM.DE_DEBB054_2,PM2.5,http://dd.eionet.europa.eu/vocabulary/aq/pollutant/6001,hour,3.2000000000,µg/m3,2020-01-04 00:00:00 +01:00,2020-01-04 01:00:00 +01:00,1,2
+        df = self._read_csv(filename, max(file_indexes_to_keep) + 1)
+        header = list(df.columns)
+        raw = df.values
 
-        # input files can be either UTF-8 or UTF-16 encoded
-        # try both
-        # files are max 3MB in size, so no big deal terms of RAM usage
-        try:
-            with open(read_filename) as f:
-                lines = f.readlines()
-        except UnicodeDecodeError:
-            with open(read_filename, encoding="UTF-16") as f:
-                lines = f.readlines()
-        except:
-            if suffix == ".gz":
-                os.remove(f_out.name)
-            raise EEAv2FileError(f"Found corrupt file {filename}. consider deleteing it")
-
-        # remove the temp file in case the input file was a gz file
-        if suffix == ".gz":
-            os.remove(f_out.name)
-
-        header = lines[0].lower().rstrip().split(file_delimiter)
-        # create output dict
-        if len(header) < max_file_index_to_keep:
-            raise EEAv2FileError(f"Found corrupt file {filename}. consider deleting it")
+        # Unfortunately there's a lot of corrupt files. Skip data lines that
+        # are too short (i.e. have no validity) or have invalid start times
+        times = {idx: self._parse_times(raw[:, idx]) for idx in time_indexes}
+        valid = (raw[:, 15] != "") & ~np.isnat(times[time_indexes[0]])
 
         data_dict = {}
         for idx in header_indexes_to_keep:
             data_dict[header[idx]] = ""
+        if valid.any():
+            first_row = raw[np.argmax(valid)]
+            for idx in header_indexes_to_keep:
+                if header[idx] != self.VAR_CODE_NAME:
+                    data_dict[header[idx]] = first_row[idx]
+                else:
+                    # extract the EEA var code from the URL noted in the data file
+                    data_dict[header[idx]] = first_row[idx].split("/")[-1]
 
         for idx in file_indexes_to_keep:
             if idx in time_indexes:
-                data_dict[header[idx]] = np.zeros(self.MAX_LINES_TO_READ, dtype="datetime64[s]")
+                data_dict[header[idx]] = times[idx][valid]
             else:
-                data_dict[header[idx]] = np.empty(self.MAX_LINES_TO_READ, dtype=np.float_)
+                # sometimes there's no value in the file. Set that to nan
+                data_dict[header[idx]] = pd.to_numeric(raw[valid, idx], errors="coerce").astype(
+                    np.float_
+                )
 
-        # read the data...
-        # DE,http://gdi.uba.de/arcgis/rest/services/inspire/DE.UBA.AQD,NET.DE_BB,STA.DE_DEBB054,DEBB054,SPO.DE_DEBB054_PM2_dataGroup1,SPP.DE_DEBB054_PM2_automatic_light-scat_Duration-30minute,SAM.DE_DEBB054_2,PM2.5,http://dd.eionet.europa.eu/vocabulary/aq/pollutant/6001,hour,3.2000000000,µg/m3,2020-01-04 00:00:00 +01:00,2020-01-04 01:00:00 +01:00,1,2
-        lineidx = 0
-        for line in lines[1:]:
-            rows = line.rstrip().split(file_delimiter)
-            # Unfortunately there's a lot of corrupt files
-            # skip data line if the # rows is not sufficient
-            if len(rows) < max_file_index_to_keep:
-                continue
-            if lineidx == 0:
-                for idx in header_indexes_to_keep:
-                    if header[idx] != self.VAR_CODE_NAME:
-                        data_dict[header[idx]] = rows[idx]
-                    else:
-                        # extract the EEA var code from the URL noted in the data file
-                        data_dict[header[idx]] = rows[idx].split("/")[-1]
-
-            for idx in file_indexes_to_keep:
-                # if the data is a time
-                if idx in time_indexes:
-                    # make the time string ISO compliant so that numpy can directly read it
-                    # this is not very time string forgiving but fast
-                    data_dict[header[idx]][lineidx] = np.datetime64(
-                        rows[idx][0:10] + "T" + rows[idx][11:19]
-                    )
-                    # due to the deprecation of the timezone interpretation after numpy 0.11
-                    # we have to substract the offset manually to get to UTC.
-                    # np.timedelta64 does not accept a float as parameter, only an integer.
-                    # Although there are time zones with a 30 minutes offset, these don't
-                    # exist in Europe, so just consider integer hours here for speed
-                    tz_offset = np.timedelta64(np.int64(rows[idx][20:23]), "h")
-                    data_dict[header[idx]][lineidx] = data_dict[header[idx]][lineidx] - tz_offset
-                else:
-                    # data is not a time
-                    # sometimes there's no value in the file. Set that to nan
-                    try:
-                        data_dict[header[idx]][lineidx] = np.float_(rows[idx])
-                    except (ValueError, IndexError):
-                        data_dict[header[idx]][lineidx] = np.nan
-
-            lineidx += 1
         # if the first line in the file was empty
         if data_dict["unitofmeasurement"] == "":
-            if rows[12] == "":
+            if len(raw) == 0 or raw[-1, 12] == "":
                 raise EEAv2FileError(
                     f"Unit of Measurment could not be inferred from EEA file {filename}"
                 )
             else:
                 # with loss of generality get the unitofmeasurement from the last row column 12 (which should be a kept header)
-                data_dict["unitofmeasurement"] = rows[12]
+                data_dict["unitofmeasurement"] = raw[-1, 12]
 
         unit_in_file = data_dict["unitofmeasurement"]
         # adjust the unit and apply conversion factor in case we read a variable noted in self.AUX_REQUIRES
@@ -408,34 +439,19 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
 
         # Sometimes the times in the data files are not ordered in time which causes problems when doing
         # time interpolations later on. Make sure that the data is ordered in time
-        diff_unsorted = np.diff(data_dict[self.START_TIME_NAME])
-        sort_flag = False
         # just assume hourly data for now
         time_diff = np.timedelta64(30, "m")
-        # np.min needs an array and fails with ValueError when a scalar is supplied
-        # this is the case for a single line file
-        try:
-            min_diff = np.min(diff_unsorted)
-        except ValueError:
-            min_diff = 0
-
-        if min_diff < 0:
-            # data needs to be sorted
-            ordered_idx = np.argsort(data_dict[self.START_TIME_NAME][:lineidx])
-            data_out["dtime"] = data_dict[self.START_TIME_NAME][ordered_idx] + time_diff
-            sort_flag = True
-        else:
-            data_out["dtime"] = data_dict[self.START_TIME_NAME][:lineidx] + time_diff
+        ordered_idx = np.argsort(data_dict[self.START_TIME_NAME], kind="stable")
+        data_out["dtime"] = data_dict[self.START_TIME_NAME][ordered_idx] + time_diff
 
         for key, value in data_dict.items():
+            if isinstance(value, np.ndarray):
+                value = value[ordered_idx]
             # adjust the variable name to aerocom standard
             if key != self.VAR_NAMES_FILE[aerocom_var_name]:
-                data_out[key] = value[:lineidx]
+                data_out[key] = value
             else:
-                if sort_flag:
-                    data_out[aerocom_var_name] = value[:lineidx][ordered_idx]
-                else:
-                    data_out[aerocom_var_name] = value[:lineidx]
+                data_out[aerocom_var_name] = value
 
         # convert data vectors to pandas.Series (if attribute
         # vars_as_series=True)
@@ -470,15 +486,11 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
         self.logger.warning(f"Reading file {filename}")
 
         struct_data = {}
+        # gzipped files are decompressed on the fly
         suffix = pathlib.Path(filename).suffix
-        if suffix == ".gz":
-            f_out = tempfile.NamedTemporaryFile(delete=False)
-            with gzip.open(filename, "r") as f_in:
-                shutil.copyfileobj(f_in, f_out)
-            filename = f_out.name
-            f_in.close()
-
-        with open(filename) as f:
+        opener = gzip.open if suffix == ".gz" else open
+
+        with opener(filename, "rt") as f:
             # read header...
             # Countrycode Timezone Namespace   AirQualityNetwork AirQualityStation AirQualityStationEoICode   AirQualityStationNatCode   SamplingPoint  SamplingProces Sample   AirPollutantCode  ObservationDateBegin ObservationDateEnd   Projection  Longitude   Latitude Altitude MeasurementType   AirQualityStationType   AirQualityStationArea   EquivalenceDemonstrated MeasurementEquipment InletHeight BuildingDistance  KerbDistance
             header = f.readline().lower().rstrip().split()
@@ -516,10 +528,6 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
                 lineidx += 1
 
         self.logger.info(f"Reading file {filename} done")
-        # remove the temp file in case the input file was a gz file
-        if suffix == ".gz":
-            f_out.close()
-            os.remove(f_out.name)
 
         return struct_data
 
@@ -565,6 +573,48 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
             #                                                   all_str))
         return files
 
+    def _iter_read_files(self, files, var_name):
+        """Iterate over input files and read them (in input order)
+
+        Parameters
+        ----------
+        files : list
+            list of file paths
+        var_name : str
+            variable to be read
+
+        Yields
+        ------
+        str
+            file path
+        StationData or Exception
+            data read from file or exception that was raised during reading
+        """
+        num_workers = self.num_workers
+        if num_workers is None:
+            num_workers = const.OBS_READ_NUM_WORKERS
+        num_workers = min(num_workers, len(files))
+        if num_workers <= 1:
+            for _file in tqdm(files):
+                try:
+                    yield _file, self.read_file(_file, var_name=var_name)
+                except Exception as e:
+                    yield _file, e
+            return
+
+        logger.info(f"Reading {len(files)} EEA files using {num_workers} processes")
+        # a couple of chunks per worker to balance load and limit IPC overhead
+        chunksize = max(1, len(files) // (num_workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_read_worker,
+            initargs=(type(self), self.data_id, self.data_dir),
+        ) as executor:
+            results = executor.map(
+                _read_file_worker, files, [var_name] * len(files), chunksize=chunksize
+            )
+            yield from tqdm(zip(files, results), total=len(files))
+
     def get_station_coords(self, meta_key):
         """
         get a station's coordinates
@@ -603,6 +653,12 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
             full qualified path to metadata file. If None, the default metadata
             file will be used
 
+        Note
+        ----
+        Files are read in parallel if :attr:`num_workers` (or
+        :attr:`pyaerocom.const.OBS_READ_NUM_WORKERS`) is larger than 1. The
+        output is the same as for serial reading.
+
         Returns
         -------
         UngriddedData
@@ -648,17 +704,16 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
         _country_dict = get_country_name_from_iso()
         logger.info("Reading files...")
 
-        for i in tqdm(range(len(files))):
-            _file = files[i]
-            try:
-                station_data = self.read_file(_file, var_name=var_name)
-            except EEAv2FileError:
+        for _file, station_data in self._iter_read_files(files, var_name):
+            if isinstance(station_data, EEAv2FileError):
                 self.logger.warning(f"file {_file} is corrupt! consider deleting it")
                 continue
-            except TemporalResolutionError as e:
+            elif isinstance(station_data, TemporalResolutionError):
                 self.logger.warning(f"{_file} has TemporalResolutionError")
-                logger.warning(f"{repr(e)}. Skipping file...")
+                logger.warning(f"{repr(station_data)}. Skipping file...")
                 continue
+            elif isinstance(station_data, Exception):
+                raise station_data
 
             # readfile might fail outside of the error captured by the try statement above
             if station_data is None:
@@ -738,3 +793,20 @@ class ReadEEAAQEREPBase(ReadUngriddedBase):
         self.files = files
 
         return data_obj
+
+
+_WORKER_READER = None
+
+
+def _init_read_worker(reader_cls, data_id, data_dir):
+    """Initialise reader in worker process for parallel reading of EEA files"""
+    global _WORKER_READER
+    _WORKER_READER = reader_cls(data_id=data_id, data_dir=data_dir)
+
+
+def _read_file_worker(filename, var_name):
+    """Read single EEA file in worker process (exceptions are returned)"""
+    try:
+        return _WORKER_READER.read_file(filename, var_name=var_name)
+    except Exception as e:
+        return e
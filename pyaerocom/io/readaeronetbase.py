@@ -14,7 +14,7 @@ from pyaerocom.helpers import varlist_aerocom
 from pyaerocom.io.readungriddedbase import ReadUngriddedBase
 from pyaerocom.mathutils import numbers_in_str
 from pyaerocom.time_config import TS_TYPES
-from pyaerocom.ungriddeddata import UngriddedData
+from pyaerocom.ungriddeddata import UngriddedDataBuilder
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +70,9 @@ class ReadAeronetBase(ReadUngriddedBase):
 
     IGNORE_META_KEYS = ["date", "time", "day_of_year"]
 
+    #: each station is read from a single file (cf. :class:`ReadUngriddedBase`)
+    SUPPORTS_INCREMENTAL_CACHE = True
+
     def __init__(self, data_id=None, data_dir=None):
         super().__init__(data_id=data_id, data_dir=data_dir)
 
@@ -356,15 +359,8 @@ class ReadAeronetBase(ReadUngriddedBase):
 
         self.read_failed = []
 
-        data_obj = UngriddedData()
-        meta_key = 0.0
-        idx = 0
-
-        # assign metadata object
-        metadata = data_obj.metadata
-        meta_idx = data_obj.meta_idx
+        builder = UngriddedDataBuilder()
 
-        num_vars = len(vars_to_retrieve)
         num_files = len(files)
         logger.info("Reading AERONET data")
         skipped = 0
@@ -406,42 +402,24 @@ class ReadAeronetBase(ReadUngriddedBase):
             meta["filename"] = _file
 
             meta.update(**common_meta)
-            # this is a list with indices of this station for each variable
-            # not sure yet, if we really need that or if it speeds up things
-            meta_idx[meta_key] = {}
-
-            num_times = len(station_data["dtime"])
+            meta_key = builder.add_meta(meta)
 
             # access array containing time stamps
             # TODO: check using index instead (even though not a problem here
             # since all Aerocom data files are of type timeseries)
-            times = np.float64(station_data["dtime"])
-
-            totnum = num_times * num_vars
-
-            # check if size of data object needs to be extended
-            if (idx + totnum) >= data_obj._ROWNO:
-                # if totnum < data_obj._CHUNKSIZE, then the latter is used
-                data_obj.add_chunk(totnum)
-
-            for var_idx, var in enumerate(vars_to_retrieve):
-                values = station_data[var]
-                start = idx + var_idx * num_times
-                stop = start + num_times
-
-                # write common meta info for this station (data lon, lat and
-                # altitude are set to station locations)
-                data_obj._data[start:stop, data_obj._LATINDEX] = station_data["latitude"]
-                data_obj._data[start:stop, data_obj._LONINDEX] = station_data["longitude"]
-                data_obj._data[start:stop, data_obj._ALTITUDEINDEX] = station_data["altitude"]
-                data_obj._data[start:stop, data_obj._METADATAKEYINDEX] = meta_key
-
-                # write data to data object
-                data_obj._data[start:stop, data_obj._TIMEINDEX] = times
-                data_obj._data[start:stop, data_obj._DATAINDEX] = values
-                data_obj._data[start:stop, data_obj._VARINDEX] = var_idx
-
-                meta_idx[meta_key][var] = np.arange(start, stop)
+            times = station_data["dtime"]
+
+            for var in vars_to_retrieve:
+                # data lon, lat and altitude are set to station locations
+                builder.add_var(
+                    meta_key,
+                    var,
+                    times,
+                    station_data[var],
+                    station_data["latitude"],
+                    station_data["longitude"],
+                    station_data["altitude"],
+                )
 
                 if var in station_data["var_info"]:
                     if "units" in station_data["var_info"][var]:
@@ -457,20 +435,13 @@ class ReadAeronetBase(ReadUngriddedBase):
                 else:
                     u = self.DEFAULT_UNIT
                 meta["var_info"][var] = dict(units=u)
-                if not var in data_obj.var_idx:
-                    data_obj.var_idx[var] = var_idx
-
-            idx += totnum
-            metadata[meta_key] = meta
-            meta_key = meta_key + 1.0
 
         if skipped:
             logger.warning(
                 f"{skipped} out of {len(files)} files have been skipped (for "
                 f"details see output)."
             )
-        # shorten data_obj._data to the right number of points
-        data_obj._data = data_obj._data[:idx]
+        data_obj = builder.build()
         # data_obj.data_revision[self.data_id] = self.data_revision
         self.data = data_obj
         return data_obj
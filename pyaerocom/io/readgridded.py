@@ -22,7 +22,13 @@ from pyaerocom.exceptions import (
     VarNotAvailableError,
 )
 from pyaerocom.griddeddata import GriddedData
-from pyaerocom.helpers import get_highest_resolution, isnumeric, sort_ts_types, to_pandas_timestamp
+from pyaerocom.helpers import (
+    get_highest_resolution,
+    isnumeric,
+    sort_ts_types,
+    start_stop,
+    to_pandas_timestamp,
+)
 from pyaerocom.io import AerocomBrowser
 from pyaerocom.io.aux_read_cubes import (
     add_cubes,
@@ -33,14 +39,26 @@ from pyaerocom.io.aux_read_cubes import (
     subtract_cubes,
 )
 from pyaerocom.io.fileconventions import FileConventionRead
+from pyaerocom.io.fileindex import DirectoryIndex
 from pyaerocom.io.helpers import add_file_to_log
 from pyaerocom.io.iris_io import concatenate_iris_cubes, load_cubes_custom
+from pyaerocom.io.point_extraction import (
+    TIME_CHUNKS,
+    convert_points_unit,
+    extract_points,
+    finalise_points,
+    find_latlon_dims,
+    get_nearest_grid_indices,
+)
 from pyaerocom.metastandards import AerocomDataID
 from pyaerocom.tstype import TsType
 from pyaerocom.variable import Variable
 
 logger = logging.getLogger(__name__)
 
+#: persistent index of file information extracted from model data directories
+_FILEINFO_INDEX = DirectoryIndex("gridded_fileinfo")
+
 
 class ReadGridded:
     """Class for reading gridded files using AeroCom file conventions
@@ -829,6 +847,22 @@ class ReadGridded:
         if self.data_dir is None:
             raise AttributeError("please set data_dir first")
 
+        index_key = (
+            self.file_type,
+            self.data_id,
+            update_file_convention,
+            tuple(sorted(vars(self.file_convention).items())),
+        )
+        indexed = _FILEINFO_INDEX.get(self.data_dir, index_key)
+        if indexed is not None:
+            logger.info(f"Using indexed file information for {self.data_dir}")
+            self.file_convention = indexed["file_convention"]
+            self.data_id = indexed["data_id"]
+            self._vars_2d = indexed["vars_2d"]
+            self._vars_3d = indexed["vars_3d"]
+            self.file_info = self._fileinfo_to_dataframe(indexed["result"])
+            return
+
         # get all files with correct ending
         files = glob(f"{self.data_dir}/*{self.file_type}")
         if len(files) == 0:
@@ -856,6 +890,18 @@ class ReadGridded:
         if len(df) == 0:
             raise DataCoverageError(f"No valid files could be found for {self.data_id}")
 
+        _FILEINFO_INDEX.put(
+            self.data_dir,
+            index_key,
+            dict(
+                file_convention=self.file_convention,
+                data_id=self.data_id,
+                vars_2d=self._vars_2d,
+                vars_3d=self._vars_3d,
+                result=result,
+            ),
+        )
+
     def filter_files(
         self,
         var_name=None,
@@ -1681,6 +1727,133 @@ class ReadGridded:
                 )
         return data
 
+    def read_var_at_points(
+        self,
+        var_name,
+        latitude,
+        longitude,
+        start=None,
+        stop=None,
+        ts_type=None,
+        experiment=None,
+        vert_which=None,
+        flex_ts_type=True,
+        prefer_longer=False,
+        try_convert_units=True,
+        time_chunks=None,
+    ):
+        """Read model data for a specific variable at station locations
+
+        Same file search as :func:`read_var`, but instead of loading the
+        full fields into a :class:`GriddedData` object, the nearest grid
+        cells of the input coordinates are computed once and only the
+        bounding box of the stations is read from each file, in chunks of
+        `time_chunks` time steps (cf. :mod:`pyaerocom.io.point_extraction`).
+        The files are read with :mod:`xarray`, i.e. without the format
+        checks and corrections applied in :func:`read_var`. Variables that
+        need to be computed from other variables are not supported.
+
+        Parameters
+        ----------
+        var_name : str
+            variable that is supposed to be read
+        latitude : array-like
+            latitudes of stations
+        longitude : array-like
+            longitudes of stations
+        start : Timestamp or str, optional
+            start time of data import
+        stop : Timestamp or str, optional
+            stop time of data import
+        ts_type : str
+            string specifying temporal resolution (cf. :func:`read_var`)
+        experiment : str
+            name of experiment (only relevant if this dataset contains more
+            than one experiment)
+        vert_which : str or dict, optional
+            valid AeroCom vertical info string encoded in name (cf.
+            :func:`read_var`)
+        flex_ts_type : bool
+            if True and if applicable, then another ts_type is used in case
+            the input ts_type is not available for this variable
+        prefer_longer : bool
+            if True and applicable, the ts_type resulting in the longer time
+            coverage will be preferred over other possible frequencies that
+            match the query.
+        try_convert_units : bool
+            if True, the data is converted to the AeroCom default unit of
+            the variable (if possible).
+        time_chunks : int, optional
+            number of time steps read at once, defaults to
+            :attr:`pyaerocom.io.point_extraction.TIME_CHUNKS`.
+
+        Returns
+        -------
+        xarray.DataArray
+            data with dimensions (time, station). Values of stations outside
+            the model domain are NaN.
+
+        Raises
+        ------
+        VarNotAvailableError
+            if variable is not available in the files of this dataset
+        DataQueryError
+            if no files match the query
+        """
+        vert_which, ts_type = self._eval_vert_which_and_ts_type(var_name, vert_which, ts_type)
+        var_to_read = self._get_var_to_read(var_name)
+        if self.ignore_vert_code:
+            vert_which = None
+        subset = self.filter_query(
+            var_to_read,
+            ts_type,
+            start,
+            stop,
+            experiment,
+            vert_which,
+            is_at_stations=False,
+            flex_ts_type=flex_ts_type,
+            prefer_longer=prefer_longer,
+        )
+        if len(subset) == 0:
+            raise DataQueryError("Could not find file match for query")
+        ts_type = self._get_meta_df(subset)["ts_type"]
+
+        chunks = {"time": time_chunks or TIME_CHUNKS}
+        arrs = []
+        indices = None
+        for fp in self._generate_file_paths(subset):
+            logger.info(f"Reading {var_to_read} at {len(latitude)} locations from {fp}")
+            with xr.open_dataset(fp, chunks=chunks) as ds:
+                if not var_to_read in ds.data_vars:
+                    raise VarNotAvailableError(f"Variable {var_to_read} not found in {fp}")
+                if indices is None:
+                    lat_dim, lon_dim = find_latlon_dims(ds[var_to_read])
+                    indices = get_nearest_grid_indices(
+                        ds[lat_dim].values, ds[lon_dim].values, latitude, longitude
+                    )
+                lat_idx, lon_idx, in_domain = indices
+                arr = extract_points(ds[var_to_read], lat_idx, lon_idx, lat_dim, lon_dim)
+                arrs.append(arr.load())
+
+        arr = arrs[0] if len(arrs) == 1 else xr.concat(arrs, dim="time").sortby("time")
+        if isinstance(arr.indexes["time"], xr.CFTimeIndex):
+            arr["time"] = arr.indexes["time"].to_datetimeindex(unsafe=True)
+        if start is not None:
+            start, stop = start_stop(start, stop)
+            arr = arr.sel(time=slice(start, stop))
+        if try_convert_units:
+            arr = convert_points_unit(arr, var_to_read, ts_type)
+        return finalise_points(
+            arr,
+            var_to_read,
+            latitude,
+            longitude,
+            in_domain,
+            ts_type=ts_type,
+            data_id=self.data_id,
+        )
+
     def check_constraint_valid(self, constraint):
         """
         Check if reading constraint is valid
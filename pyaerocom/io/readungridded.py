@@ -386,6 +386,19 @@ class ReadUngridded:
         data_read = None
         if len(vars_to_read) > 0:
 
+            # fingerprints of source files are taken before reading, so that
+            # files modified during reading are updated in the next run
+            source_files = {}
+            if not self.ignore_cache and cache.incremental_active:
+                for var in vars_to_read:
+                    try:
+                        source_files[var] = cache.source_file_info(reader.get_source_files([var]))
+                    except Exception as e:
+                        logger.warning(
+                            f"Failed to retrieve source files of {var}, cache file cannot be "
+                            f"updated incrementally. Error: {repr(e)}"
+                        )
+
             _loglevel = logger.level
             logger.setLevel(logging.INFO)
             data_read = reader.read(vars_to_read, **kwargs)
@@ -395,7 +408,7 @@ class ReadUngridded:
                 # write the cache file
                 if not self.ignore_cache:
                     try:
-                        cache.write(data_read, var)
+                        cache.write(data_read, var, source_files=source_files.get(var))
                     except Exception as e:
                         _caching = False
                         logger.warning(
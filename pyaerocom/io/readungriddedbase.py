@@ -50,6 +50,12 @@ class ReadUngriddedBase(abc.ABC):
 
     IGNORE_META_KEYS = []
 
+    #: If True, cached data of this reader can be updated incrementally when
+    #: source files change (cf. :class:`CacheHandlerUngridded`). Requires that
+    #: each metadata block is read from a single file (stored in metadata key
+    #: filename) and that :func:`read` accepts a list of files as input.
+    SUPPORTS_INCREMENTAL_CACHE = False
+
     _FILEMASK = "*.*"
 
     def __str__(self):
@@ -603,6 +609,23 @@ class ReadUngriddedBase(abc.ABC):
         self.files = files
         return files
 
+    def get_source_files(self, vars_to_retrieve):
+        """Get list of all source files containing input variables
+
+        Used for incremental caching (cf. :class:`CacheHandlerUngridded`).
+
+        Parameters
+        ----------
+        vars_to_retrieve : list
+            list of variables
+
+        Returns
+        -------
+        list
+            list of file paths
+        """
+        return self.get_file_list()
+
     def read_station(self, station_id_filename, **kwargs):
         """Read data from a single station into :class:`UngriddedData`
 
@@ -345,6 +345,204 @@ def calc_statistics(data, ref_data, lowlim=None, highlim=None, min_num_valid=1,
     return result
 
 
+def _grouped_pearson(x, y, groups, num_groups, weights=None):
+    """Pearson (or weighted) correlation coefficient for each group"""
+    if weights is None:
+        weights = np.ones_like(x)
+    wsum = np.bincount(groups, weights, num_groups)
+    avgx = np.bincount(groups, weights * x, num_groups) / wsum
+    avgy = np.bincount(groups, weights * y, num_groups) / wsum
+    dx, dy = x - avgx[groups], y - avgy[groups]
+    covxy = np.bincount(groups, weights * dx * dy, num_groups)
+    covxx = np.bincount(groups, weights * dx**2, num_groups)
+    covyy = np.bincount(groups, weights * dy**2, num_groups)
+    return np.clip(covxy / np.sqrt(covxx * covyy), -1, 1)
+
+
+def _grouped_rank(x, groups):
+    """Rank data within groups (ties get average rank, like scipy.stats.rankdata)"""
+    order = np.lexsort((x, groups))
+    xs, gs = x[order], groups[order]
+    new_run = np.ones(len(xs), dtype=bool)
+    new_run[1:] = (xs[1:] != xs[:-1]) | (gs[1:] != gs[:-1])
+    new_group = np.ones(len(xs), dtype=bool)
+    new_group[1:] = gs[1:] != gs[:-1]
+    pos = np.arange(len(xs))
+    group_start = np.maximum.accumulate(np.where(new_group, pos, 0))
+    run_id = np.cumsum(new_run) - 1
+    run_start = pos[new_run]
+    run_end = np.append(run_start[1:], len(xs))
+    # average of 1-based positions within group of each run of equal values
+    avg_rank = (run_start + run_end - 1) / 2 + 1
+    ranks = np.empty(len(xs))
+    ranks[order] = avg_rank[run_id] - group_start
+    return ranks
+
+
+@ignore_warnings(
+    RuntimeWarning,
+    "An input array is constant",
+    "invalid value encountered",
+    "divide by zero encountered",
+)
+def calc_statistics_grouped(
+    data,
+    ref_data,
+    groups,
+    num_groups=None,
+    lowlim=None,
+    highlim=None,
+    min_num_valid=1,
+    weights=None,
+):
+    """Calc statistical properties for groups of data points
+
+    Computes the same statistical parameters as :func:`calc_statistics`
+    for each group of data points defined by the input group indices (e.g.
+    all data points belonging to one month), where all groups are processed
+    in one go. The result for each group is the same as calling
+    :func:`calc_statistics` with the data points of that group (except
+    for floating point rounding and for groups without valid data after
+    applying `lowlim` and `highlim`, which result in NaN instead of an
+    error).
+
+    Parameters
+    ----------
+    data : ndarray
+        array containing data, that is supposed to be compared with reference
+        data
+    ref_data : ndarray
+        array containing data, that is used to compare `data` array with
+    groups : ndarray
+        array of same shape as `data` containing the index of the group
+        each data point belongs to. Negative indices are ignored.
+    num_groups : int, optional
+        number of groups. If None, the maximum group index + 1 is used.
+    lowlim : float
+        lower end of considered value range (cf. :func:`calc_statistics`)
+    highlim : float
+        upper end of considered value range (cf. :func:`calc_statistics`)
+    min_num_valid : int
+        minimum number of valid measurements required to compute statistical
+        parameters.
+    weights : ndarray, optional
+        array of same shape as `data` containing weights for each data point.
+
+    Returns
+    -------
+    list
+        list of dictionaries containing computed statistics for each group
+        (cf. :func:`calc_statistics`)
+
+    Raises
+    ------
+    ValueError
+        if input arrays are not one dimensional or of different length
+    """
+    data = np.asarray(data, dtype=float)
+    ref_data = np.asarray(ref_data, dtype=float)
+    groups = np.asarray(groups, dtype=int)
+
+    if not data.ndim == ref_data.ndim == groups.ndim == 1:
+        raise ValueError("Invalid input. Data arrays must be one dimensional")
+    elif not len(data) == len(ref_data) == len(groups):
+        raise ValueError("Invalid input. Data arrays must have the same length")
+    if num_groups is None:
+        num_groups = groups.max() + 1 if len(groups) else 0
+    weighted = False if weights is None else True
+    if weighted:
+        weights = np.asarray(weights, dtype=float)
+
+    ingroup = groups >= 0
+    totnum = np.bincount(groups[ingroup], minlength=num_groups)
+
+    mask = ingroup & ~np.isnan(ref_data) & ~np.isnan(data)
+    data, ref_data, groups = data[mask], ref_data[mask], groups[mask]
+    num_valid = np.bincount(groups, minlength=num_groups)
+
+    def mean_and_std(values):
+        mean = np.bincount(groups, values, num_groups) / num_valid
+        var = np.bincount(groups, (values - mean[groups]) ** 2, num_groups) / num_valid
+        return mean, np.sqrt(var)
+
+    ref_mean, ref_std = mean_and_std(ref_data)
+    data_mean, data_std = mean_and_std(data)
+
+    if weighted:
+        weights = weights[mask]
+        wmax = np.zeros(num_groups)
+        np.maximum.at(wmax, groups, weights)
+        weights = weights / wmax[groups]
+
+    valid = np.ones(len(data), dtype=bool)
+    if lowlim is not None:
+        valid &= (data > lowlim) & (ref_data > lowlim)
+    if highlim is not None:
+        valid &= (data < highlim) & (ref_data < highlim)
+    data, ref_data, groups = data[valid], ref_data[valid], groups[valid]
+    w = weights[valid] if weighted else np.ones(len(data))
+
+    difference = data - ref_data
+    wsum = np.bincount(groups, w, num_groups)
+    rms = np.sqrt(np.bincount(groups, w * difference**2, num_groups) / wsum)
+
+    corr_ok = num_valid > 1
+    R = np.where(corr_ok, _grouped_pearson(data, ref_data, groups, num_groups, w), np.nan)
+    R_spearman = _grouped_pearson(
+        _grouped_rank(data, groups), _grouped_rank(ref_data, groups), groups, num_groups
+    )
+    R_spearman = np.where(corr_ok, R_spearman, np.nan)
+    R_kendall = np.full(num_groups, np.nan)
+    order = np.argsort(groups, kind="stable")
+    bounds = np.cumsum(np.bincount(groups, minlength=num_groups))
+    for idx, (low, high) in enumerate(zip(np.append(0, bounds[:-1]), bounds)):
+        if corr_ok[idx] and high - low > 1:
+            sub = order[low:high]
+            R_kendall[idx] = kendalltau(data[sub], ref_data[sub])[0]
+
+    sum_diff = np.bincount(groups, w * difference, num_groups)
+    sum_refdata = np.bincount(groups, w * ref_data, num_groups)
+    nmb = np.where(sum_diff == 0, 0.0, np.nan)
+    nonzero = sum_refdata != 0
+    nmb[nonzero] = sum_diff[nonzero] / sum_refdata[nonzero]
+
+    sum_data_refdata = data + ref_data
+    ok = ~np.isnan(sum_data_refdata)
+    num_points = np.bincount(groups[ok], minlength=num_groups)
+    tmp = difference[ok] / sum_data_refdata[ok]
+    mnmb = 2.0 / num_points * np.bincount(groups[ok], w[ok] * tmp, num_groups)
+    fge = 2.0 / num_points * np.bincount(groups[ok], w[ok] * np.abs(tmp), num_groups)
+
+    results = []
+    for idx in range(num_groups):
+        result = {}
+        result["totnum"] = float(totnum[idx])
+        result["num_valid"] = float(num_valid[idx])
+        result["refdata_mean"] = ref_mean[idx]
+        result["refdata_std"] = ref_std[idx]
+        result["data_mean"] = data_mean[idx]
+        result["data_std"] = data_std[idx]
+        result["weighted"] = weighted
+        if not num_valid[idx] >= min_num_valid:
+            for key in ("rms", "nmb", "mnmb", "fge", "R", "R_spearman"):
+                result[key] = np.nan
+            results.append(result)
+            continue
+        if weighted:
+            result[
+                "NOTE"
+            ] = "Weights were not applied to FGE and kendall and spearman corr (not implemented)"
+        result["rms"] = rms[idx]
+        result["R"] = R[idx]
+        result["R_spearman"] = R_spearman[idx]
+        result["R_kendall"] = R_kendall[idx]
+        result["nmb"] = nmb[idx]
+        result["mnmb"] = mnmb[idx]
+        result["fge"] = fge[idx]
+        results.append(result)
+    return results
+
+
 def closest_index(num_array, value):
     """Returns index in number array that is closest to input value"""
     return np.argmin(np.abs(np.asarray(num_array) - value))
@@ -9,6 +9,14 @@ import xarray as xr
 from pyaerocom import const
 from pyaerocom.exceptions import VarNotAvailableError
 from pyaerocom.griddeddata import GriddedData
+from pyaerocom.io.point_extraction import (
+    TIME_CHUNKS,
+    convert_points_unit,
+    extract_points,
+    finalise_points,
+    find_latlon_dims,
+    get_nearest_grid_indices,
+)
 from pyaerocom.units_helpers import UALIASES
 
 from .additional_variables import (
@@ -54,6 +62,9 @@ class ReadMscwCtm:
         string ID of model (e.g. "AATSR_SU_v4.3","CAM5.3-Oslo_CTRL2016")
     data_dir : str, optional
         Base directory of EMEP data, containing one or more netcdf files
+    time_chunks : int, optional
+        chunk size along the time dimension used when opening the data files
+        (cf. :attr:`time_chunks`).
 
     Attributes
     ----------
@@ -160,7 +171,7 @@ class ReadMscwCtm:
 
     DEFAULT_FILE_NAME = "Base_day.nc"
 
-    def __init__(self, data_id=None, data_dir=None):
+    def __init__(self, data_id=None, data_dir=None, time_chunks=None):
         self._data_dir = None
         # opened dataset (for performance boost), will be reset if data_dir is
         # changed
@@ -174,6 +185,9 @@ class ReadMscwCtm:
 
         self.var_map = emep_variables()
 
+        self._time_chunks = None
+        self.time_chunks = time_chunks
+
         if data_dir is not None:
             if not isinstance(data_dir, str) or not os.path.exists(data_dir):
                 raise FileNotFoundError(f"{data_dir}")
@@ -369,6 +383,29 @@ class ReadMscwCtm:
             raise ValueError("needs to be list of strings")
         self._filepaths = value
 
+    @property
+    def time_chunks(self):
+        """
+        Chunk size along time dimension of loaded data (int or None)
+
+        The data files are opened lazily as dask-backed arrays and the data
+        stays lazy in the :class:`GriddedData` objects returned by
+        :func:`read_var` until the values are accessed (e.g. when extracting
+        time series). If None, each file is loaded as one chunk. Otherwise,
+        the data is split into chunks of `time_chunks` time steps, so that
+        only parts of e.g. a year of hourly data need to be held in memory
+        at a time.
+        """
+        return self._time_chunks
+
+    @time_chunks.setter
+    def time_chunks(self, val):
+        if val is not None and (not isinstance(val, int) or val < 1):
+            raise ValueError(f"time_chunks needs to be a positive integer or None, got {val}")
+        if val != self._time_chunks:
+            self._time_chunks = val
+            self._filedata = None
+
     @property
     def filedata(self):
         """
@@ -488,7 +525,8 @@ class ReadMscwCtm:
         if len(fps) > 1 and ts_type == "hourly":
             raise ValueError(f"ts_type {ts_type} can not be hourly when using multiple years")
         logger.info(f"Opening {fps}")
-        ds = xr.open_mfdataset(fps)
+        chunks = None if self.time_chunks is None else {"time": self.time_chunks}
+        ds = xr.open_mfdataset(fps, chunks=chunks)
 
         self._filedata = ds
 
@@ -568,7 +606,7 @@ class ReadMscwCtm:
                 return fname
         raise ValueError(f"failed to infer filename from input ts_type={ts_type}")
 
-    def _compute_var(self, var_name_aerocom, ts_type):
+    def _compute_var(self, var_name_aerocom, ts_type, filedata=None):
         """Compute auxiliary variable
 
         Like :func:`read_var` but for auxiliary variables
@@ -580,6 +618,8 @@ class ReadMscwCtm:
             variable that are supposed to be read
         ts_type : str
             string specifying temporal resolution.
+        filedata : xarray.Dataset, optional
+            data to compute variable from, defaults to :attr:`filedata`.
 
         Returns
         -------
@@ -592,12 +632,12 @@ class ReadMscwCtm:
         aux_func = self.AUX_FUNS[var_name_aerocom]
         logger.info(f"computing {var_name_aerocom} from {req} using {aux_func}")
         for aux_var in self.AUX_REQUIRES[var_name_aerocom]:
-            arr = self._load_var(aux_var, ts_type)
+            arr = self._load_var(aux_var, ts_type, filedata)
             temp_arrs.append(arr)
 
         return aux_func(*temp_arrs)
 
-    def _load_var(self, var_name_aerocom, ts_type):
+    def _load_var(self, var_name_aerocom, ts_type, filedata=None):
         """
         Load variable data as :class:`xarray.DataArray`.
 
@@ -610,6 +650,8 @@ class ReadMscwCtm:
             variable name
         ts_type : str
             desired frequency
+        filedata : xarray.Dataset, optional
+            data to load variable from, defaults to :attr:`filedata`.
 
         Raises
         ------
@@ -623,16 +665,18 @@ class ReadMscwCtm:
 
         """
         if var_name_aerocom in self.var_map:  # can be read
-            return self._read_var_from_file(var_name_aerocom, ts_type)
+            return self._read_var_from_file(var_name_aerocom, ts_type, filedata)
         elif var_name_aerocom in self.AUX_REQUIRES:
-            return self._compute_var(var_name_aerocom, ts_type)
+            return self._compute_var(var_name_aerocom, ts_type, filedata)
         raise VarNotAvailableError(
             f"Variable {var_name_aerocom} is not supported"
         )  # pragma: no cover
 
-    def read_var(self, var_name, ts_type=None, **kwargs):
+    def read_var(self, var_name, ts_type=None, time_chunks=None, **kwargs):
         """Load data for given variable.
 
+        The data is not loaded into memory, cf. :attr:`time_chunks`.
+
         Parameters
         ----------
         var_name : str
@@ -640,6 +684,8 @@ class ReadMscwCtm:
         ts_type : str
             Temporal resolution of data to read. Supported are
             "hourly", "daily", "monthly" , "yearly".
+        time_chunks : int, optional
+            if provided, :attr:`time_chunks` is updated before reading.
 
         Returns
         -------
@@ -647,6 +693,8 @@ class ReadMscwCtm:
         """
         if not self.has_var(var_name):
             raise VarNotAvailableError(var_name)
+        if time_chunks is not None:
+            self.time_chunks = time_chunks
         var = const.VARS[var_name]
         var_name_aerocom = var.var_name_aerocom
 
@@ -694,7 +742,78 @@ class ReadMscwCtm:
                 del gridded.metadata[metadata]
         return gridded
 
-    def _read_var_from_file(self, var_name_aerocom, ts_type):
+    def read_var_at_points(self, var_name, latitude, longitude, ts_type=None):
+        """Read data for given variable at station locations
+
+        Unlike :func:`read_var`, the fields are not loaded completely. The
+        nearest grid cells of the input coordinates are computed once and
+        each (yearly) file is opened lazily and indexed at these cells, so
+        only the bounding box of the stations is read from disk, in chunks
+        of :attr:`time_chunks` time steps (cf.
+        :mod:`pyaerocom.io.point_extraction`). Auxiliary variables are
+        computed from the extracted point data.
+
+        Parameters
+        ----------
+        var_name : str
+            Variable to be read
+        latitude : array-like
+            latitudes of stations
+        longitude : array-like
+            longitudes of stations
+        ts_type : str
+            Temporal resolution of data to read. Supported are
+            "hourly", "daily", "monthly" , "yearly".
+
+        Returns
+        -------
+        xarray.DataArray
+            data with dimensions (time, station), in AeroCom default unit.
+            Values of stations outside the model domain are NaN.
+        """
+        if not self.has_var(var_name):
+            raise VarNotAvailableError(var_name)
+        var_name_aerocom = const.VARS[var_name].var_name_aerocom
+
+        if self.data_dir is None:  # pragma: no cover
+            raise ValueError("data_dir must be set before reading.")
+        elif self.filename is None and ts_type is None:  # pragma: no cover
+            raise ValueError("please specify ts_type")
+        elif ts_type is not None:
+            self.filename = self.filename_from_ts_type(ts_type)
+        ts_type = self.ts_type
+
+        yrs = self._get_yrs_from_filepaths()
+        fps = self._clean_filepaths(self.filepaths, yrs, ts_type)
+
+        chunks = {"time": self.time_chunks or TIME_CHUNKS}
+        arrs = []
+        indices = None
+        for fp in fps:
+            logger.info(f"Reading {var_name_aerocom} at {len(latitude)} locations from {fp}")
+            with xr.open_dataset(fp, chunks=chunks) as ds:
+                if indices is None:
+                    lat_dim, lon_dim = find_latlon_dims(ds)
+                    indices = get_nearest_grid_indices(
+                        ds[lat_dim].values, ds[lon_dim].values, latitude, longitude
+                    )
+                lat_idx, lon_idx, in_domain = indices
+                points = extract_points(ds, lat_idx, lon_idx, lat_dim, lon_dim)
+                arrs.append(self._load_var(var_name_aerocom, ts_type, points).load())
+
+        arr = arrs[0] if len(arrs) == 1 else xr.concat(arrs, dim="time")
+        arr = convert_points_unit(arr, var_name_aerocom, ts_type)
+        return finalise_points(
+            arr,
+            var_name_aerocom,
+            latitude,
+            longitude,
+            in_domain,
+            ts_type=ts_type,
+            data_id=self.data_id,
+        )
+
+    def _read_var_from_file(self, var_name_aerocom, ts_type, filedata=None):
         """
         Read variable data from file as :class:`xarray.DataArray`.
 
@@ -706,6 +825,8 @@ class ReadMscwCtm:
             variable name
         ts_type : str
             desired frequency
+        filedata : xarray.Dataset, optional
+            data to read variable from, defaults to :attr:`filedata`.
 
         Raises
         ------
@@ -721,7 +842,8 @@ class ReadMscwCtm:
         emep_var = self.var_map[var_name_aerocom]
 
         try:
-            filedata = self.filedata
+            if filedata is None:
+                filedata = self.filedata
             data = filedata[emep_var]
 
         except KeyError:
@@ -1,9 +1,11 @@
 """
 This module contains functionality related to regions in pyaerocom
 """
+from functools import lru_cache
 from typing import List, Optional
 
 import numpy as np
+import xarray as xr
 
 from pyaerocom._lowlevel_helpers import BrowseDict
 from pyaerocom.config import ALL_REGION_NAME
@@ -161,6 +163,35 @@ class Region(BrowseDict):
             lon_ok = False  # safeguard
         return lat_ok * lon_ok
 
+    def contains_coordinates(self, lats, lons):
+        """Check if input lat/lon coordinates are contained in region
+
+        Vectorised version of :func:`contains_coordinate`.
+
+        Parameters
+        ----------
+        lats : array-like
+            latitudes of coordinates
+        lons : array-like
+            longitudes of coordinates
+
+        Returns
+        -------
+        ndarray
+            boolean array, True where coordinate is contained in this region
+        """
+        lats, lons = np.asarray(lats), np.asarray(lons)
+        lat_lb, lat_ub = self.lat_range
+        lon_lb, lon_ub = self.lon_range
+        lat_ok = (lat_lb <= lats) & (lats <= lat_ub)
+        if lon_lb < lon_ub:
+            lon_ok = (lon_lb <= lons) & (lons <= lon_ub)
+        elif lon_ub < lon_lb:
+            lon_ok = (lons < lon_ub) | (lons > lon_lb)
+        else:
+            lon_ok = np.zeros(lons.shape, dtype=bool)
+        return lat_ok & lon_ok
+
     def mask_available(self):
         if not self.is_htap():
             return False
@@ -323,6 +354,30 @@ def get_all_default_regions():
     return get_old_aerocom_default_regions()
 
 
+def _in_region(rname, contained, on_ocean):
+    """Check if coordinate(s) belong to a region
+
+    Parameters
+    ----------
+    rname : str
+        region ID
+    contained : bool or ndarray
+        whether coordinate(s) are contained in the lat / lon range of the region
+    on_ocean : bool or ndarray
+        whether coordinate(s) are on the ocean (according to the OCN mask)
+
+    Returns
+    -------
+    bool or ndarray
+        True where coordinate belongs to the region
+    """
+    # OCN needs special handling determined by the rname, not hardcoded to return OCN b/c of HTAP issues
+    result = np.logical_and(contained, np.logical_not(on_ocean))
+    if rname == "OCN":
+        result = np.logical_or(result, on_ocean)
+    return result
+
+
 #: ToDO: check how to handle methods properly with HTAP regions...
 def get_regions_coord(lat, lon, regions=None):
     """Get the region that contains an input coordinate
@@ -355,10 +410,7 @@ def get_regions_coord(lat, lon, regions=None):
     for rname, reg in regions.items():
         if rname == ALL_REGION_NAME:  # always True for ALL_REGION_NAME
             continue
-        # OCN needs special handling determined by the rname, not hardcoded to return OCN b/c of HTAP issues
-        if reg.contains_coordinate(lat, lon) and not on_ocean:
-            matches.append(rname)
-        if rname == "OCN" and on_ocean:
+        if _in_region(rname, reg.contains_coordinate(lat, lon), on_ocean):
             matches.append(rname)
     if len(matches) == 0:
         matches.append(ALL_REGION_NAME)
@@ -393,3 +445,95 @@ def find_closest_region_coord(
     matches.sort(key=lambda id: regions[id].distance_to_center(lat, lon))
 
     return matches
+
+
+class _RegionSetup:
+    """Hashable wrapper of a dictionary of regions (used for memoization)"""
+
+    def __init__(self, regions: dict):
+        self.regions = regions
+        self.key = tuple(
+            (rname, tuple(reg.lat_range), tuple(reg.lon_range))
+            if rname != ALL_REGION_NAME
+            else (rname,)
+            for rname, reg in regions.items()
+        )
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __eq__(self, other):
+        return isinstance(other, _RegionSetup) and self.key == other.key
+
+
+@lru_cache(maxsize=32)
+def _find_closest_region_coords(setup: _RegionSetup, coords: tuple) -> tuple:
+    """Sorted region IDs for unique coordinates (cached helper, see below)"""
+    regions = setup.regions
+    lats, lons = np.asarray(coords, dtype=float).reshape(-1, 2).T
+    check = [rname for rname in regions if rname != ALL_REGION_NAME]
+    contained = {}
+    if check:
+        ocean_mask = load_region_mask_xr("OCN")
+        on_ocean = ocean_mask.sel(
+            latitude=xr.DataArray(lats), longitude=xr.DataArray(lons), method="nearest"
+        ).values.astype(bool)
+        for rname in check:
+            contained[rname] = _in_region(
+                rname, regions[rname].contains_coordinates(lats, lons), on_ocean
+            )
+    result = []
+    for j, (lat, lon) in enumerate(coords):
+        matches = [rname for rname in check if contained[rname][j]]
+        if len(matches) == 0:
+            matches.append(ALL_REGION_NAME)
+        elif len(matches) > 1:
+            matches.sort(key=lambda id: regions[id].distance_to_center(lat, lon))
+        result.append(tuple(matches))
+    return tuple(result)
+
+
+def clear_region_cache() -> None:
+    """Clear memoized results of :func:`find_closest_region_coords`"""
+    _find_closest_region_coords.cache_clear()
+
+
+def find_closest_region_coords(
+    lats,
+    lons,
+    regions: Optional[dict] = None,
+) -> List[List[str]]:
+    """Finds lists of regions sorted by their center closest to input coordinates
+
+    Vectorised version of :func:`find_closest_region_coord`, which samples
+    the ocean mask only once for all input coordinates. Results of the most
+    recent calls are memoized per region setup, so that repeated calls with
+    the same coordinates (e.g. for the sites in different colocated data
+    files) are cheap. Use :func:`clear_region_cache` to free the memory.
+
+    Parameters
+    ----------
+    lats : array-like
+        latitudes of coordinates
+    lons : array-like
+        longitudes of coordinates
+    regions : dict, optional
+        dictionary containing instances of :class:`Region` as values, which
+        are considered. If None, then all default regions are used.
+
+    Returns
+    -------
+    list[list[str]]
+        sorted lists of region IDs of identified regions for each coordinate
+    """
+    if regions is None:
+        regions = get_all_default_regions()
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    if not lats.shape == lons.shape or lats.ndim != 1:
+        raise ValueError("lats and lons need to be 1D arrays of the same length")
+
+    coords = list(zip(lats.tolist(), lons.tolist()))
+    unique = tuple(dict.fromkeys(coords))
+    found = dict(zip(unique, _find_closest_region_coords(_RegionSetup(regions), unique)))
+    return [list(found[coord]) for coord in coords]
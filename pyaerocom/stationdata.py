@@ -1504,3 +1504,60 @@ class StationData(StationMetaData):
             s += series
 
         return s
+
+
+def convert_unit_stations(stats, var_name, to_unit):
+    """Convert unit of a variable in multiple StationData objects
+
+    Vectorised alternative to calling :func:`StationData.convert_unit` for
+    each station: stations are grouped by current unit and frequency of the
+    variable, the conversion factor is computed once per group and the time
+    series of all stations in a group are converted in one multiplication.
+
+    Parameters
+    ----------
+    stats : list
+        list of :class:`StationData` objects
+    var_name : str
+        name of variable
+    to_unit : str
+        new unit
+
+    Raises
+    ------
+    MetaDataError
+        if variable unit cannot be accessed in one of the stations
+    UnitConversionError
+        if conversion failed
+    """
+    groups = {}
+    for stat in stats:
+        unit = stat.get_unit(var_name)
+        try:
+            tst = stat.get_var_ts_type(var_name)
+        except MetaDataError:
+            tst = None
+        groups.setdefault((unit, tst), []).append(stat)
+
+    for (unit, tst), group in groups.items():
+        fac = get_unit_conversion_fac(unit, to_unit, var_name, tst)
+        if fac != 1:
+            series = [stat for stat in group if np.ndim(stat[var_name]) == 1]
+            for stat in group:
+                if np.ndim(stat[var_name]) != 1:
+                    stat[var_name] = stat[var_name] * fac
+            if series:
+                data = [np.asarray(stat[var_name], dtype=float) for stat in series]
+                splits = np.cumsum([len(x) for x in data])[:-1]
+                converted = np.split(np.concatenate(data) * fac, splits)
+                for stat, vals in zip(series, converted):
+                    current = stat[var_name]
+                    if isinstance(current, pd.Series):
+                        vals = pd.Series(vals, index=current.index, name=current.name)
+                    stat[var_name] = vals
+        for stat in group:
+            stat.var_info[var_name]["units"] = to_unit
+        logger.info(
+            f"Successfully converted unit of variable {var_name} in {len(group)} stations "
+            f"from {unit} to {to_unit}"
+        )
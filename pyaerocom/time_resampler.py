@@ -17,7 +17,8 @@ class TimeResampler:
     """Object that can be use to resample timeseries data
 
     It supports hierarchical resampling of :class:`xarray.DataArray` objects
-    and :class:`pandas.Series` objects.
+    and :class:`pandas.Series` objects (or :class:`pandas.DataFrame` objects,
+    in which case each column is resampled individually).
 
     Hierarchical means, that resampling constraints can be applied for each
     level, that is, if hourly data is to be resampled to monthly, it may be
@@ -54,14 +55,14 @@ class TimeResampler:
 
     @input_data.setter
     def input_data(self, val):
-        if not isinstance(val, (pd.Series, xarr.DataArray)):
+        if not isinstance(val, (pd.Series, pd.DataFrame, xarr.DataArray)):
             raise ValueError("Invalid input: need Series or DataArray")
         self._input_data = val
 
     @property
     def fun(self):
         """Resamplig method (depends on input data type)"""
-        if isinstance(self.input_data, pd.Series):
+        if isinstance(self.input_data, (pd.Series, pd.DataFrame)):
             return resample_timeseries
         return resample_time_dataarray
 
@@ -139,6 +140,59 @@ class TimeResampler:
             idx.append(last_entry)
         return idx
 
+    def get_resample_steps(self, to_ts_type, from_ts_type=None, how=None, min_num_obs=None):
+        """Get resampling steps for input resampling constraints
+
+        Parameters
+        ----------
+        to_ts_type : TsType
+            output resolution
+        from_ts_type : TsType, optional
+            current temporal resolution of data (None if unknown)
+        how : str or dict
+            string specifying how the data is to be aggregated (cf.
+            :func:`resample`)
+        min_num_obs : dict or int, optional
+            minimum number of observations (cf. :func:`resample`)
+
+        Raises
+        ------
+        TemporalResolutionError
+            if `to_ts_type` is of higher resolution than `from_ts_type`
+
+        Returns
+        -------
+        list
+            list of 3-element tuples for each resampling step, containing
+            the pandas frequency string, the minimum number of observations
+            (or None) and the aggregator to be used.
+        """
+        if how is None:
+            how = "mean"
+        freq = to_ts_type.to_pandas_freq()
+        if from_ts_type is None:  # native == unknown
+            return [(freq, None, how)]
+        elif to_ts_type > from_ts_type:
+            raise TemporalResolutionError(
+                f"Cannot resample time-series from {from_ts_type} to {to_ts_type}"
+            )
+        elif to_ts_type == from_ts_type:
+            logger.info(
+                f"Input time frequency {to_ts_type.val} equals current frequency of data. "
+                f"Resampling will be applied anyways which will introduce NaN values "
+                f"at missing time stamps"
+            )
+            return [(freq, None, "mean")]
+        elif min_num_obs is None:
+            if not isinstance(how, str):
+                raise ValueError(
+                    f"Temporal resampling without constraints can only use string type "
+                    f"argument how (e.g. how=mean). Got {how}"
+                )
+            return [(freq, None, how)]
+        _idx = self._gen_idx(from_ts_type, to_ts_type, min_num_obs, how)
+        return [(TsType(to).to_pandas_freq(), mno, rshow) for to, mno, rshow in _idx]
+
     def resample(
         self, to_ts_type, input_data=None, from_ts_type=None, how=None, min_num_obs=None, **kwargs
     ):
@@ -148,7 +202,7 @@ class TimeResampler:
         ----------
         to_ts_type : str or TsType
             output resolution
-        input_data : pandas.Series or xarray.DataArray
+        input_data : pandas.Series or pandas.DataFrame or xarray.DataArray
             data to be resampled
         from_ts_type : str or TsType, optional
             current temporal resolution of data
@@ -171,17 +225,12 @@ class TimeResampler:
 
         Returns
         -------
-        pandas.Series or xarray.DataArray
+        pandas.Series or pandas.DataFrame or xarray.DataArray
             resampled data object
         """
         if how is None:
             how = "mean"
 
-        if how in self.AGGRS_UNIT_PRESERVE:
-            self._last_units_preserved = True
-        else:
-            self._last_units_preserved = False
-
         if not isinstance(to_ts_type, TsType):
             to_ts_type = TsType(to_ts_type)
 
@@ -202,44 +251,9 @@ class TimeResampler:
 
         self.last_setup = dict(min_num_obs=min_num_obs, how=how)
 
-        if from_ts_type is None:  # native == unknown
-            freq = to_ts_type.to_pandas_freq()
-            data_out = self.fun(self.input_data, freq=freq, how=how, **kwargs)
-        elif to_ts_type > from_ts_type:
-            raise TemporalResolutionError(
-                f"Cannot resample time-series from {from_ts_type} to {to_ts_type}"
-            )
-        elif to_ts_type == from_ts_type:
-            logger.info(
-                f"Input time frequency {to_ts_type.val} equals current frequency of data. "
-                f"Resampling will be applied anyways which will introduce NaN values "
-                f"at missing time stamps"
-            )
-
-            freq = to_ts_type.to_pandas_freq()
-            self._last_units_preserved = True
-            data_out = self.fun(self.input_data, freq=freq, how="mean", **kwargs)
-
-        elif min_num_obs is None:
-            freq = to_ts_type.to_pandas_freq()
-            if not isinstance(how, str):
-                raise ValueError(
-                    f"Temporal resampling without constraints can only use string type "
-                    f"argument how (e.g. how=mean). Got {how}"
-                )
-
-            data_out = self.fun(self.input_data, freq=freq, how=how, **kwargs)
-        else:
-            _idx = self._gen_idx(from_ts_type, to_ts_type, min_num_obs, how)
-            data_out = self.input_data
-            aggrs = []
-            for to_ts_type, mno, rshow in _idx:
-                freq = TsType(to_ts_type).to_pandas_freq()
-                data_out = self.fun(data_out, freq=freq, how=rshow, min_num_obs=mno, **kwargs)
-                aggrs.append(rshow)
-
-            if all([x in self.AGGRS_UNIT_PRESERVE for x in aggrs]):
-                self._last_units_preserved = True
-            else:
-                self._last_units_preserved = False
+        steps = self.get_resample_steps(to_ts_type, from_ts_type, how, min_num_obs)
+        data_out = self.input_data
+        for freq, mno, rshow in steps:
+            data_out = self.fun(data_out, freq=freq, how=rshow, min_num_obs=mno, **kwargs)
+        self._last_units_preserved = all(x in self.AGGRS_UNIT_PRESERVE for _, _, x in steps)
         return data_out
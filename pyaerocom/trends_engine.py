@@ -8,10 +8,13 @@ from scipy.stats.mstats import theilslopes
 from pyaerocom.trends_helpers import (
     _compute_trend_error,
     _get_yearly,
+    _get_yearly_batch,
     _init_period_dates,
     _init_trends_result_dict,
+    _mann_kendall_batch,
     _start_season,
     _start_stop_period,
+    _theil_sen_batch,
 )
 
 
@@ -103,10 +106,6 @@ class TrendsEngine:
         if not len(vals) >= min_num_yrs:
             return result
 
-        result["y_mean"] = np.nanmean(vals)
-        result["y_min"] = np.nanmin(vals)
-        result["y_max"] = np.nanmax(vals)
-
         # Mann / Kendall test
         [tau, pval] = kendalltau(x=num_dates_data, y=vals)
 
@@ -114,6 +113,162 @@ class TrendsEngine:
             y=vals, x=num_dates_data, alpha=slope_confidence
         )
 
+        TrendsEngine._add_fit_results(
+            result,
+            start_year,
+            vals,
+            num_dates_data,
+            num_dates_period,
+            pval,
+            slope,
+            yoffs,
+            slope_low,
+            slope_up,
+        )
+        return result
+
+    @staticmethod
+    def compute_trends(
+        data, ts_type, start_year, stop_year, min_num_yrs, season=None, slope_confidence=None
+    ):
+        """
+        Compute trends of several timeseries at once
+
+        Batched version of :func:`compute_trend`: the yearly values of all
+        series are computed together and the Mann-Kendall test and Theil-Sen
+        slopes are computed for all series at once, using vectorised
+        pairwise differences of the (years, series) matrix.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            input timeseries data, one column per series
+        ts_type : str
+            frequency of input data (must be monthly or yearly)
+        start_year : int or str
+            start of period for trend
+        stop_year : int or str
+            end of period for trend
+        min_num_yrs : int
+            minimum number of years for trend computation
+        season : str, optional
+            which season to use, defaults to whole year (no season)
+        slope_confidence : float, optional
+            confidence of slope, between 0 and 1, defaults to 0.68.
+
+        Returns
+        -------
+        list
+            trends results (dict) for each column of input data, same as
+            returned by :func:`compute_trend` for the individual columns
+        """
+        if season is None:
+            season = "all"
+        if slope_confidence is None:
+            slope_confidence = 0.68
+        if not ts_type in ["yearly", "monthly"]:
+            raise ValueError(ts_type)
+
+        start_str = _start_season(season, start_year)
+        stop_str = str(stop_year)
+        data = data.loc[start_str:stop_str]
+
+        results = []
+        for _ in range(data.shape[1]):
+            result = _init_trends_result_dict(start_year)
+            result["period"] = f"{start_year}-{stop_year}"
+            result["season"] = season
+            results.append(result)
+        if len(data) == 0:
+            return results
+
+        (start_date, stop_date, period_index, num_dates_period) = _init_period_dates(
+            start_year, stop_year, season
+        )
+
+        if ts_type == "monthly":
+            data = _get_yearly_batch(data, season, start_year)
+
+        dates = data.index.values
+        values = data.values.astype(float)
+
+        # get period filter mask
+        tmask = np.logical_and(dates >= start_date, dates <= stop_date)
+        num_dates = dates[tmask].astype("datetime64[Y]").astype(np.float64)
+        vals = values[tmask]
+        valid = ~np.isnan(vals)
+        num_valid = valid.sum(axis=0)
+
+        fit = num_valid >= min_num_yrs
+        (_, pvals) = _mann_kendall_batch(num_dates, vals[:, fit])
+        (slopes, yoffs, slopes_low, slopes_up) = _theil_sen_batch(
+            num_dates, vals[:, fit], alpha=slope_confidence
+        )
+
+        fit_idx = np.cumsum(fit) - 1
+        for i, result in enumerate(results):
+            result["data"] = data.iloc[:, i].rename(None)
+            result["n"] = int(num_valid[i])
+            if not fit[i]:
+                continue
+            j = fit_idx[i]
+            TrendsEngine._add_fit_results(
+                result,
+                start_year,
+                vals[valid[:, i], i],
+                num_dates[valid[:, i]],
+                num_dates_period,
+                pvals[j],
+                slopes[j],
+                yoffs[j],
+                slopes_low[j],
+                slopes_up[j],
+            )
+        return results
+
+    @staticmethod
+    def _add_fit_results(
+        result,
+        start_year,
+        vals,
+        num_dates_data,
+        num_dates_period,
+        pval,
+        slope,
+        yoffs,
+        slope_low,
+        slope_up,
+    ):
+        """
+        Add results of Mann-Kendall test and Theil-Sen fit to result dict
+
+        Parameters
+        ----------
+        result : dict
+            trends result dict (cf. :func:`compute_trend`), updated in place
+        start_year : int or str
+            start of period for trend
+        vals : ndarray
+            valid (yearly) values used for the fit
+        num_dates_data : ndarray
+            numerical dates (years) of `vals`
+        num_dates_period : ndarray
+            numerical dates (years) of whole period
+        pval : float
+            p-value of Mann-Kendall test
+        slope : float
+            Theil-Sen slope
+        yoffs : float
+            intercept of Theil-Sen fit
+        slope_low : float
+            lower bound of slope confidence interval
+        slope_up : float
+            upper bound of slope confidence interval
+        """
+        result["y_mean"] = np.nanmean(vals)
+        result["y_min"] = np.nanmin(vals)
+        result["y_max"] = np.nanmax(vals)
+
         # estimate error of slope at input confidence level
         slope_err = np.mean([abs(slope - slope_low), abs(slope - slope_up)])
 
@@ -177,8 +332,6 @@ class TrendsEngine:
         result[f"slp_{start_year}_err"] = tperr
         result[f"reg0_{start_year}"] = v0p
 
-        return result
-
 
 class TrendPlotter:  # pragma: no cover
     def __init__(self):
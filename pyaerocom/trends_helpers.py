@@ -6,9 +6,13 @@ Note
 Most methods here are private and not to be used directly. Please use
 :class:`TrendsEngine` instead.
 """
+import math
+from functools import lru_cache
+
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from scipy.stats import norm
 
 SEASONS = {"spring": [3, 4, 5], "summer": [6, 7, 8], "autumn": [9, 10, 11], "winter": [12, 1, 2]}
 
@@ -246,6 +250,258 @@ def _get_yearly(data, seas, start_yr):
     return pd.Series(values, index=dates)
 
 
+def _get_yearly_batch(data, seas, start_yr):
+    """Same as :func:`_get_yearly` for all columns of a DataFrame at once"""
+    dates = []
+    values = []
+    yrs = np.unique(data.index.year)
+    for yr in yrs:
+        if yr < start_yr:  # winter
+            continue
+
+        if seas == "all":  # yearly trends
+            subset = data.loc[str(yr)]
+        else:
+            start = _start_season(seas, yr)
+            stop = _end_season(seas, yr)
+            subset = data.loc[start:stop]
+
+        val = np.full(data.shape[1], np.nan)
+        if len(subset) > 0 and not (seas == "all" and len(_get_unique_seasons(subset.index)) != 4):
+            # series as rows, so that sums are computed the same way as for
+            # individual series in _get_yearly
+            vals = np.ascontiguousarray(subset.values.T)
+            mask = np.isnan(vals)
+            cnt = np.sum(~mask, axis=1, dtype=np.intp)
+            tot = np.sum(np.where(mask, 0, vals), axis=1)
+            ok = cnt > 0
+            val[ok] = tot[ok] / cnt[ok]
+
+        dates.append(_mid_season(seas, yr))
+        values.append(val)
+
+    if not values:
+        return pd.DataFrame(columns=data.columns, dtype=float)
+    return pd.DataFrame(values, index=dates, columns=data.columns)
+
+
+def _sort_valid(values):
+    """Sort columns of 2D array, NaNs last, and count valid values"""
+    return np.sort(values, axis=0), np.sum(~np.isnan(values), axis=0)
+
+
+def _median_sorted(sorted_vals, num):
+    """Median of columns of sorted array containing `num` valid values"""
+    cols = np.arange(sorted_vals.shape[1])
+    lo = np.clip((num - 1) // 2, 0, None)
+    hi = np.clip(num // 2, 0, len(sorted_vals) - 1)
+    median = (sorted_vals[lo, cols] + sorted_vals[hi, cols]) / 2
+    return np.where(num > 0, median, np.nan)
+
+
+def _tie_stats(sorted_vals):
+    """Tie statistics of columns of sorted array (cf. scipy.stats.kendalltau)
+
+    Returns
+    -------
+    ndarray
+        number of tied pairs
+    ndarray
+        sum of k(k-1)(k-2) over groups of k tied values
+    ndarray
+        sum of k(k-1)(2k+5) over groups of k tied values
+    """
+    num = sorted_vals.shape[1]
+    ties = np.zeros((3, num), dtype=np.int64)
+    has_ties = (sorted_vals[1:] == sorted_vals[:-1]).any(axis=0)
+    for i in np.flatnonzero(has_ties):
+        col = sorted_vals[:, i]
+        _, cnt = np.unique(col[~np.isnan(col)], return_counts=True)
+        cnt = cnt[cnt > 1].astype(np.int64)
+        ties[:, i] = (
+            (cnt * (cnt - 1) // 2).sum(),
+            (cnt * (cnt - 1) * (cnt - 2)).sum(),
+            (cnt * (cnt - 1) * (2 * cnt + 5)).sum(),
+        )
+    return ties
+
+
+@lru_cache(maxsize=None)
+def _kendall_p_exact(n, c):
+    """Exact two-sided p-value of Kendall tau (cf. scipy.stats.kendalltau)
+
+    Parameters
+    ----------
+    n : int
+        number of values
+    c : int
+        number of concordant (or discordant) pairs
+
+    Returns
+    -------
+    float
+        p-value
+    """
+    c = int(min(c, (n * (n - 1)) // 2 - c))
+    if n <= 2:
+        prob = 1.0
+    elif c == 0:
+        prob = 2.0 / math.factorial(n) if n < 171 else 0.0
+    elif c == 1:
+        prob = 2.0 / math.factorial(n - 1) if n < 172 else 0.0
+    elif 4 * c == n * (n - 1):
+        prob = 1.0
+    elif n < 171:
+        new = np.zeros(c + 1)
+        new[0:2] = 1.0
+        for j in range(3, n + 1):
+            new = np.cumsum(new)
+            if j <= c:
+                new[j:] -= new[: c + 1 - j]
+        prob = 2.0 * np.sum(new) / math.factorial(n)
+    else:
+        new = np.zeros(c + 1)
+        new[0:2] = 1.0
+        for j in range(3, n + 1):
+            new = np.cumsum(new) / j
+            if j <= c:
+                new[j:] -= new[: c + 1 - j]
+        prob = np.sum(new)
+    return float(np.clip(prob, 0, 1))
+
+
+def _prepare_batch(x, y):
+    """Sort x (1D) and rows of y (2D) by x and compute differences of all pairs
+
+    Returns
+    -------
+    ndarray
+        x values of valid data for each series (NaN where y is NaN), sorted
+    ndarray
+        y values, sorted by x
+    ndarray
+        differences of x values of all pairs i < j, shape (pairs,)
+    ndarray
+        differences of y values of all pairs i < j, shape (pairs, series)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    order = np.argsort(x, kind="mergesort")
+    x, y = x[order], y[order]
+    i, j = np.triu_indices(len(x), k=1)
+    x_valid = np.where(np.isnan(y), np.nan, x[:, np.newaxis])
+    return x_valid, y, x[j] - x[i], y[j] - y[i]
+
+
+def _mann_kendall_batch(x, y):
+    """Mann-Kendall test for several series at once
+
+    Same result as :func:`scipy.stats.kendalltau` (variant b, method auto)
+    applied to each column of `y` after removal of NaNs.
+
+    Parameters
+    ----------
+    x : ndarray
+        1D array of x values (e.g. years), shape (n,)
+    y : ndarray
+        2D array of values, shape (n, number of series), may contain NaNs
+
+    Returns
+    -------
+    ndarray
+        Kendall tau of each series
+    ndarray
+        two-sided p-value of each series
+    """
+    x_valid, y, dx, dy = _prepare_batch(x, y)
+    size = np.sum(~np.isnan(y), axis=0).astype(np.int64)
+    tot = size * (size - 1) // 2
+    # x is sorted, so discordant pairs have dx > 0 and dy < 0
+    dis = np.sum((dx[:, np.newaxis] > 0) & (dy < 0), axis=0).astype(np.int64)
+    ntie = np.sum((dx[:, np.newaxis] == 0) & (dy == 0), axis=0).astype(np.int64)
+    xtie, x0, x1 = _tie_stats(np.sort(x_valid, axis=0))
+    ytie, y0, y1 = _tie_stats(np.sort(y, axis=0))
+
+    con_minus_dis = tot - xtie - ytie + ntie - 2 * dis
+    with np.errstate(invalid="ignore", divide="ignore"):
+        tau = con_minus_dis / np.sqrt(tot - xtie) / np.sqrt(tot - ytie)
+        tau = np.minimum(1.0, np.maximum(-1.0, tau))
+
+        m = size * (size - 1.0)
+        var = (
+            (m * (2 * size + 5) - x1 - y1) / 18
+            + (2 * xtie * ytie) / m
+            + x0 * y0 / (9 * m * (size - 2))
+        )
+        z = con_minus_dis / np.sqrt(var)
+        pval = 2 * norm.sf(np.abs(z))
+
+    exact = (xtie == 0) & (ytie == 0) & ((size <= 33) | (np.minimum(dis, tot - dis) <= 1))
+    for i in np.flatnonzero(exact & (tot > 0)):
+        pval[i] = _kendall_p_exact(int(size[i]), int(tot[i] - dis[i]))
+    invalid = (tot == 0) | (xtie == tot) | (ytie == tot)
+    tau[invalid] = np.nan
+    pval[invalid] = np.nan
+    return tau, pval
+
+
+def _theil_sen_batch(x, y, alpha):
+    """Theil-Sen slope estimate for several series at once
+
+    Same result as :func:`scipy.stats.mstats.theilslopes` applied to each
+    column of `y` after removal of NaNs.
+
+    Parameters
+    ----------
+    x : ndarray
+        1D array of x values (e.g. years), shape (n,)
+    y : ndarray
+        2D array of values, shape (n, number of series), may contain NaNs
+    alpha : float
+        confidence degree of slope confidence interval, between 0 and 1
+
+    Returns
+    -------
+    ndarray
+        slope of each series
+    ndarray
+        intercept of each series
+    ndarray
+        lower bound of slope confidence interval of each series
+    ndarray
+        upper bound of slope confidence interval of each series
+    """
+    x_valid, y, dx, dy = _prepare_batch(x, y)
+    # only pairs with different x values are used
+    dx = np.where(dx > 0, dx, np.nan)
+    slopes, nt = _sort_valid(dy / dx[:, np.newaxis])
+    medslope = _median_sorted(slopes, nt)
+
+    y_sorted, ny = _sort_valid(y)
+    x_sorted, _ = _sort_valid(x_valid)
+    medinter = _median_sorted(y_sorted, ny) - medslope * _median_sorted(x_sorted, ny)
+
+    if alpha > 0.5:
+        alpha = 1.0 - alpha
+    z = norm.ppf(alpha / 2.0)
+    x1 = _tie_stats(x_sorted)[2]
+    y1 = _tie_stats(y_sorted)[2]
+    sigsq = 1 / 18.0 * (ny * (ny - 1) * (2 * ny + 5) - x1 - y1)
+    with np.errstate(invalid="ignore"):
+        sigma = np.sqrt(sigsq)
+    low = np.full(len(nt), np.nan)
+    high = np.full(len(nt), np.nan)
+    cols = np.flatnonzero((nt > 0) & np.isfinite(sigma))
+    upper = np.minimum(np.round((nt[cols] - z * sigma[cols]) / 2.0).astype(int), nt[cols] - 1)
+    lower = np.maximum(np.round((nt[cols] + z * sigma[cols]) / 2.0).astype(int) - 1, 0)
+    # indices beyond the number of slopes are invalid (cf. scipy)
+    ok = (upper >= 0) & (lower < nt[cols])
+    cols, lower, upper = cols[ok], lower[ok], upper[ok]
+    low[cols] = slopes[lower, cols]
+    high[cols] = slopes[upper, cols]
+    return medslope, medinter, low, high
+
+
 def _init_period_dates(start_year, stop_year, season):
     start_date = _mid_season(season, start_year)
     stop_date = _mid_season(season, stop_year)
@@ -11,6 +11,7 @@ import pandas as pd
 
 from pyaerocom import const
 from pyaerocom._lowlevel_helpers import merge_dicts
+from pyaerocom.columnar_array import ColumnarArray
 from pyaerocom.combine_vardata_ungridded import combine_vardata_ungridded
 from pyaerocom.exceptions import (
     DataCoverageError,
@@ -18,6 +19,7 @@ from pyaerocom.exceptions import (
     MetaDataError,
     StationCoordinateError,
     StationNotFoundError,
+    TemporalResolutionError,
     TimeMatchError,
     VarNotAvailableError,
 )
@@ -124,6 +126,33 @@ class UngriddedData:
     _STOPTIMEINDEX = 10  # can be used to store stop time of acq.
     _TRASHINDEX = 11  # index where invalid data can be moved to (e.g. when outliers are removed)
 
+    #: storage dtypes of columns if data is stored column-wise (cf.
+    #: :class:`ColumnarArray`). Additional index columns are stored as float64.
+    _COLUMN_DTYPES = {
+        _METADATAKEYINDEX: "int32",
+        _TIMEINDEX: "datetime64[s]",
+        _LATINDEX: "float64",
+        _LONINDEX: "float64",
+        _ALTITUDEINDEX: "float32",
+        _VARINDEX: "int32",
+        _DATAINDEX: "float32",
+        _DATAHEIGHTINDEX: "float32",
+        _DATAERRINDEX: "float32",
+        _DATAFLAGINDEX: "float32",
+        _STOPTIMEINDEX: "datetime64[s]",
+        _TRASHINDEX: "float32",
+    }
+
+    #: columns that are only allocated when they contain data if data is
+    #: stored column-wise
+    _OPTIONAL_COLUMNS = [
+        _DATAHEIGHTINDEX,
+        _DATAERRINDEX,
+        _DATAFLAGINDEX,
+        _STOPTIMEINDEX,
+        _TRASHINDEX,
+    ]
+
     # The following number denotes the kept precision after the decimal dot of
     # the location (e.g denotes lat = 300.12345)
     # used to code lat and long in a single number for a uniqueness test
@@ -132,11 +161,22 @@ class UngriddedData:
 
     STANDARD_META_KEYS = STANDARD_META_KEYS
 
+    #: aggregators supported by :func:`to_station_arrays`
+    _STATION_ARRAYS_AGGREGATORS = ["mean", "median", "sum", "min", "max"]
+
+    #: metadata keys for which inverted indices (value -> metadata indices)
+    #: are used to speed up station lookups and :func:`filter_by_meta`
+    INDEXED_META_KEYS = ["station_name", "data_id", "instrument_name", "country", "ts_type"]
+
+    # lazily built inverted indices of metadata (cf. _get_meta_index)
+    _meta_index = None
+    _meta_index_sig = None
+
     @property
     def _ROWNO(self):
         return self._data.shape[0]
 
-    def __init__(self, num_points=None, add_cols=None):
+    def __init__(self, num_points=None, add_cols=None, columnar=False):
 
         if num_points is None:
             num_points = self._CHUNKSIZE
@@ -145,7 +185,10 @@ class UngriddedData:
         self._index = self._init_index(add_cols)
 
         # keep private, this is not supposed to be used by the user
-        self._data = np.full([num_points, self._COLNO], np.nan)
+        if columnar:
+            self._data = ColumnarArray(num_points, *self._get_column_dtypes())
+        else:
+            self._data = np.full([num_points, self._COLNO], np.nan)
 
         self.metadata = {}
         # single value data revision is deprecated
@@ -272,46 +315,26 @@ class UngriddedData:
             raise ValueError(f"Invalid input for add_meta_keys {add_meta_keys}... need list")
         if isinstance(stats, StationData):
             stats = [stats]
-        data_obj = UngriddedData(num_points=1000000)
-
-        meta_key = 0.0
-        idx = 0
-
-        metadata = data_obj.metadata
-        meta_idx = data_obj.meta_idx
+        builder = UngriddedDataBuilder()
 
-        var_count_glob = -1
         for stat in stats:
             if isinstance(stat, dict):
                 stat = StationData(**stat)
             elif not isinstance(stat, StationData):
                 raise ValueError("Need instances of StationData or dicts")
-            metadata[meta_key] = {}
-            metadata[meta_key].update(
-                stat.get_meta(force_single_value=False, quality_check=False, add_none_vals=True)
-            )
+            meta = stat.get_meta(force_single_value=False, quality_check=False, add_none_vals=True)
             for key in add_meta_keys:
                 try:
                     val = stat[key]
                 except KeyError:
                     val = "undefined"
 
-                metadata[meta_key][key] = val
-
-            metadata[meta_key]["var_info"] = {}
+                meta[key] = val
 
-            meta_idx[meta_key] = {}
-
-            append_vars = list(stat.var_info)
-
-            for var in append_vars:
-                if not var in data_obj.var_idx:
-                    var_count_glob += 1
-                    var_idx = var_count_glob
-                    data_obj.var_idx[var] = var_idx
-                else:
-                    var_idx = data_obj.var_idx[var]
+            meta["var_info"] = {}
+            meta_key = builder.add_meta(meta)
 
+            for var in stat.var_info:
                 vardata = stat[var]
 
                 if isinstance(vardata, pd.Series):
@@ -320,55 +343,23 @@ class UngriddedData:
                 else:
                     times = stat["dtime"]
                     values = vardata
-                    if not len(times) == len(values):
-                        raise ValueError
-
-                times = np.asarray([np.datetime64(x, "s") for x in times])
-                times = np.float64(times)
-
-                num_times = len(times)
-                # check if size of data object needs to be extended
-                if (idx + num_times) >= data_obj._ROWNO:
-                    # if totnum < data_obj._CHUNKSIZE, then the latter is used
-                    data_obj.add_chunk(num_times)
 
-                start = idx
-                stop = start + num_times
-
-                # write common meta info for this station (data lon, lat and
-                # altitude are set to station locations)
-                data_obj._data[start:stop, data_obj._LATINDEX] = stat["latitude"]
-                data_obj._data[start:stop, data_obj._LONINDEX] = stat["longitude"]
-                data_obj._data[start:stop, data_obj._ALTITUDEINDEX] = stat["altitude"]
-                data_obj._data[start:stop, data_obj._METADATAKEYINDEX] = meta_key
-
-                # write data to data object
-                data_obj._data[start:stop, data_obj._TIMEINDEX] = times
-
-                data_obj._data[start:stop, data_obj._DATAINDEX] = values
-
-                data_obj._data[start:stop, data_obj._VARINDEX] = var_idx
-
-                if var in stat.data_flagged:
-                    invalid = stat.data_flagged[var]
-                    data_obj._data[start:stop, data_obj._DATAFLAGINDEX] = invalid
-
-                if var in stat.data_err:
-                    errs = stat.data_err[var]
-                    data_obj._data[start:stop, data_obj._DATAERRINDEX] = errs
-
-                var_info = stat["var_info"][var]
-                metadata[meta_key]["var_info"][var] = {}
-                metadata[meta_key]["var_info"][var].update(var_info)
-                meta_idx[meta_key][var] = np.arange(start, stop)
-
-                idx += num_times
-
-            meta_key += 1
-
-        # shorten data_obj._data to the right number of points
-        data_obj._data = data_obj._data[:idx]
+                # data lon, lat and altitude are set to station locations
+                builder.add_var(
+                    meta_key,
+                    var,
+                    times,
+                    values,
+                    stat["latitude"],
+                    stat["longitude"],
+                    stat["altitude"],
+                    data_flagged=stat.data_flagged.get(var),
+                    data_err=stat.data_err.get(var),
+                )
+                meta["var_info"][var] = {}
+                meta["var_info"][var].update(stat["var_info"][var])
 
+        data_obj = builder.build()
         data_obj._check_index()
 
         return data_obj
@@ -440,6 +431,66 @@ class UngriddedData:
     def _COLNO(self):
         return len(self._index)
 
+    @property
+    def is_columnar(self):
+        """Boolean specifying whether data is stored column-wise
+
+        See :func:`to_columnar` for details.
+        """
+        return isinstance(self._data, ColumnarArray)
+
+    def _get_column_dtypes(self):
+        """Storage dtypes and optional columns for column-wise data storage"""
+        dtypes = [self._COLUMN_DTYPES.get(idx, "float64") for idx in range(self._COLNO)]
+        optional = [idx for idx in range(self._COLNO) if idx not in self._COLUMN_DTYPES]
+        return dtypes, self._OPTIONAL_COLUMNS + optional
+
+    def to_columnar(self, inplace=False):
+        """Store data column-wise using compact dtypes
+
+        The data array is converted into a :class:`ColumnarArray` which stores
+        indices as int32, data values as float32 and timestamps as
+        datetime64[s] (cf. :attr:`_COLUMN_DTYPES`), and which only allocates
+        memory for optional columns (e.g. data errors, flags or stop times)
+        if they contain data. Compared to the default float64 array this
+        reduces the memory footprint by more than a factor of 2. Access to
+        the data array works as before but values are cast to the column
+        dtypes on assignment (e.g. data values are stored with single
+        precision).
+
+        Parameters
+        ----------
+        inplace : bool
+            if True, this object is modified, else a copy is converted
+
+        Returns
+        -------
+        UngriddedData
+            data object with column-wise data storage
+        """
+        obj = self if inplace else self.copy()
+        if not obj.is_columnar:
+            obj._data = ColumnarArray.from_array(obj._data, *obj._get_column_dtypes())
+        return obj
+
+    def to_dense(self, inplace=False):
+        """Store data in a 2D float64 array (reverts :func:`to_columnar`)
+
+        Parameters
+        ----------
+        inplace : bool
+            if True, this object is modified, else a copy is converted
+
+        Returns
+        -------
+        UngriddedData
+            data object with data stored in a 2D numpy array
+        """
+        obj = self if inplace else self.copy()
+        if obj.is_columnar:
+            obj._data = np.asarray(obj._data)
+        return obj
+
     @property
     def has_flag_data(self):
         """Boolean specifying whether this object contains flag data"""
@@ -461,8 +512,9 @@ class UngriddedData:
         """
         from copy import deepcopy
 
-        new = UngriddedData()
-        new._data = np.copy(self._data)
+        new = UngriddedData(num_points=0)
+        new._index = self._index.copy()
+        new._data = self._data.copy()
         new.metadata = deepcopy(self.metadata)
         new.data_revision = self.data_revision
         new.meta_idx = deepcopy(self.meta_idx)
@@ -641,10 +693,75 @@ class UngriddedData:
         """
         if size is None or size < self._chunksize:
             size = self._chunksize
-        chunk = np.full([size, self._COLNO], np.nan)
-        self._data = np.append(self._data, chunk, axis=0)
+        if self.is_columnar:
+            self._data.append_rows(size)
+        else:
+            chunk = np.full([size, self._COLNO], np.nan)
+            self._data = np.append(self._data, chunk, axis=0)
         logger.info(f"adding chunk, new array size ({self._data.shape})")
 
+    def _get_meta_index(self):
+        """Container for inverted indices of :attr:`metadata`
+
+        The index is rebuilt if :attr:`metadata` is replaced or if metadata
+        blocks are added or removed. In-place modifications of indexed
+        metadata values require a call to :func:`invalidate_meta_index`.
+
+        Returns
+        -------
+        dict
+            key ``_pos`` maps metadata indices to their position in
+            :attr:`metadata`, all other keys are metadata keys for which an
+            inverted index was created (cf. :func:`_get_meta_key_index`).
+        """
+        sig = (id(self.metadata), len(self.metadata))
+        if self._meta_index is None or self._meta_index_sig != sig:
+            self._meta_index = {"_pos": {idx: i for i, idx in enumerate(self.metadata)}}
+            self._meta_index_sig = sig
+        return self._meta_index
+
+    def _get_meta_key_index(self, key):
+        """Inverted index for a metadata key
+
+        Parameters
+        ----------
+        key : str
+            metadata key (e.g. station_name)
+
+        Returns
+        -------
+        dict or None
+            keys are unique values of input metadata key, values are lists of
+            metadata indices (in order of :attr:`metadata`) that contain that
+            value. None, if metadata values are not hashable (e.g. lists).
+        """
+        index = self._get_meta_index()
+        if not key in index:
+            key_index = {}
+            try:
+                for idx, meta in self.metadata.items():
+                    if key in meta:
+                        key_index.setdefault(meta[key], []).append(idx)
+            except TypeError:  # unhashable values
+                key_index = None
+            index[key] = key_index
+        return index[key]
+
+    def _sort_meta_indices(self, indices):
+        """Sort metadata indices according to their order in :attr:`metadata`"""
+        pos = self._get_meta_index()["_pos"]
+        return sorted(indices, key=pos.__getitem__)
+
+    def invalidate_meta_index(self):
+        """Reset inverted metadata indices
+
+        Needs to be called if values of :attr:`INDEXED_META_KEYS` are modified
+        in place in :attr:`metadata` (adding, removing or replacing whole
+        metadata blocks is detected automatically).
+        """
+        self._meta_index = None
+        self._meta_index_sig = None
+
     def _find_station_indices_wildcards(self, station_str):
         """Find indices of all metadata blocks matching input station name
 
@@ -664,10 +781,20 @@ class UngriddedData:
         StationNotFoundError
             if no such station exists in this data object
         """
-        idx = []
-        for i, meta in self.metadata.items():
-            if fnmatch.fnmatch(meta["station_name"], station_str):
-                idx.append(i)
+        names = self._get_meta_key_index("station_name")
+        if names is None:
+            idx = [
+                i
+                for i, meta in self.metadata.items()
+                if fnmatch.fnmatch(meta["station_name"], station_str)
+            ]
+        else:
+            # match unique station names only
+            idx = []
+            for name, indices in names.items():
+                if fnmatch.fnmatch(name, station_str):
+                    idx.extend(indices)
+            idx = self._sort_meta_indices(idx)
         if len(idx) == 0:
             raise StationNotFoundError(
                 f"No station available in UngriddedData that matches pattern {station_str}"
@@ -693,10 +820,11 @@ class UngriddedData:
         StationNotFoundError
             if no such station exists in this data object
         """
-        idx = []
-        for i, meta in self.metadata.items():
-            if meta["station_name"] == station_str:
-                idx.append(i)
+        names = self._get_meta_key_index("station_name")
+        if names is None:
+            idx = [i for i, meta in self.metadata.items() if meta["station_name"] == station_str]
+        else:
+            idx = list(names.get(station_str, []))
         if len(idx) == 0:
             raise StationNotFoundError(
                 f"No station available in UngriddedData that matches name {station_str}"
@@ -751,6 +879,8 @@ class UngriddedData:
                 meta["country_code"] = info[i]["country_code"]
                 meta_idx_updated.append(idx)
                 countries.append(country)
+        if meta_idx_updated:
+            self.invalidate_meta_index()
         return (meta_idx_updated, countries)
 
     @property
@@ -1260,6 +1390,194 @@ class UngriddedData:
                 out_data["failed"].append([idx, repr(e)])
         return out_data
 
+    def to_station_arrays(
+        self,
+        var_name,
+        ts_type,
+        start=None,
+        stop=None,
+        by_station_name=True,
+        how="mean",
+        min_num_obs=None,
+        add_meta_keys=None,
+    ):
+        """Extract time series of one variable at all stations as 2D array
+
+        Array-level alternative to :func:`to_station_data_all`, which does not
+        create :class:`StationData` objects for the individual stations. All
+        data points of the input variable within the time window are assigned
+        to periods of the output frequency and aggregated per station and
+        period, based on sorting of combined station and period indices.
+
+        Note
+        ----
+        Data is aggregated to the output frequency but not interpolated, hence
+        input data with a lower resolution than ``ts_type`` is not supported.
+        If ``by_station_name`` is True, all data points of metadata blocks
+        belonging to the same station are aggregated together (instead of
+        merging the time series as in :func:`to_station_data_all`). The
+        hierarchical resampling constraints used in :class:`TimeResampler`
+        are not applied, use ``min_num_obs`` instead.
+
+        Parameters
+        ----------
+        var_name : str
+            name of variable
+        ts_type : str
+            output frequency (e.g. daily, monthly)
+        start
+            start time, optional (if not None, input must be convertible into
+            pandas.Timestamp). If None, the first timestamp of the data is used.
+        stop
+            stop time, optional (if not None, input must be convertible into
+            pandas.Timestamp). If None, the last timestamp of the data is used.
+        by_station_name : bool
+            if True, metadata blocks are grouped by station name, else each
+            metadata block is treated as individual station
+        how : str
+            aggregator used for each period (mean, median, sum, min or max)
+        min_num_obs : int, optional
+            minimum number of valid data points in a period, periods with fewer
+            data points are set to NaN
+        add_meta_keys : list, optional
+            additional metadata keys to be returned as station arrays
+
+        Returns
+        -------
+        dict
+            dictionary containing following key / value pairs:
+
+                - data: 2D array of shape (time, station)
+                - time: start timestamps of periods (datetime64[s])
+                - station_name: array of station names
+                - latitude: array of station latitudes
+                - longitude: array of station longitudes
+                - altitude: array of station altitudes
+                - units: array of variable units of each station
+                - meta_idx: list of metadata indices of each station
+                - any additional keys specified in ``add_meta_keys``
+
+            Station metadata is taken from the first metadata block of each
+            station.
+
+        Raises
+        ------
+        ValueError
+            if input for ``how`` is invalid
+        VarNotAvailableError
+            if variable is not available in this object
+        DataCoverageError
+            if no valid data is available in the specified time window
+        TemporalResolutionError
+            if ``ts_type`` is invalid or if data with lower resolution than
+            ``ts_type`` is found
+        """
+        if not how in self._STATION_ARRAYS_AGGREGATORS:
+            raise ValueError(
+                f"Invalid input for how: {how}, choose from {self._STATION_ARRAYS_AGGREGATORS}"
+            )
+        if add_meta_keys is None:
+            add_meta_keys = []
+        if not var_name in self.var_idx:
+            raise VarNotAvailableError(f"No such variable {var_name} in UngriddedData")
+        to_ts_type = TsType(ts_type)
+        offset = pd.tseries.frequencies.to_offset(to_ts_type.to_pandas_freq())
+
+        rows = np.flatnonzero(self._data[:, self._VARINDEX] == self.var_idx[var_name])
+        vals = self._data[rows, self._DATAINDEX]
+        times = self._data[rows, self._TIMEINDEX].astype("datetime64[s]")
+        mask = ~np.isnan(vals) & ~np.isnat(times)
+        if start is not None or stop is not None:
+            start, stop = start_stop(start, stop)
+            start, stop = np.datetime64(start, "s"), np.datetime64(stop, "s")
+            mask &= (times >= start) & (times <= stop)
+        if not mask.any():
+            raise DataCoverageError(f"No valid data of {var_name} in specified time window")
+        rows, vals, times = rows[mask], vals[mask], times[mask]
+
+        # position of metadata block of each data point in metadata, and
+        # station index of each metadata block
+        meta_keys = np.asarray(list(self.metadata), dtype=np.float64)
+        sort_keys = np.argsort(meta_keys)
+        block_pos = sort_keys[
+            np.searchsorted(meta_keys, self._data[rows, self._METADATAKEYINDEX], sorter=sort_keys)
+        ]
+        blocks = np.unique(block_pos)
+        if by_station_name:
+            names = [self.metadata[meta_keys[pos]]["station_name"] for pos in blocks]
+            _, block_stat = np.unique(names, return_inverse=True)
+        else:
+            block_stat = np.arange(len(blocks))
+        stat_idx = block_stat[np.searchsorted(blocks, block_pos)]
+        num_stats = block_stat.max() + 1
+
+        for pos in blocks:
+            meta_ts_type = self.metadata[meta_keys[pos]].get("ts_type")
+            if TsType.valid(meta_ts_type) and TsType(meta_ts_type) < to_ts_type:
+                raise TemporalResolutionError(
+                    f"Cannot extract {to_ts_type} data of {var_name}, found {meta_ts_type} "
+                    f"data in metadata block {meta_keys[pos]}"
+                )
+
+        # output periods and period index of each data point
+        if start is None:
+            start, stop = times.min(), times.max()
+        first = pd.Timestamp(start)
+        if isinstance(offset, pd.offsets.Tick):
+            first = first.floor(offset)
+        else:
+            first = offset.rollback(first.normalize())
+        periods = pd.date_range(first, pd.Timestamp(stop), freq=offset).values
+        periods = periods.astype("datetime64[s]")
+        time_idx = np.searchsorted(periods, times, side="right") - 1
+
+        # sort data points by station and period and aggregate each group
+        group_key = stat_idx * len(periods) + time_idx
+        if how == "median":
+            order = np.lexsort((vals, group_key))
+        else:
+            order = np.argsort(group_key, kind="stable")
+        group_key, vals = group_key[order], vals[order]
+        group_start = np.flatnonzero(np.diff(group_key, prepend=-1))
+        counts = np.diff(np.append(group_start, len(group_key)))
+        if how == "median":
+            lower = vals[group_start + (counts - 1) // 2]
+            upper = vals[group_start + counts // 2]
+            result = (lower + upper) / 2
+        elif how == "min":
+            result = np.minimum.reduceat(vals, group_start)
+        elif how == "max":
+            result = np.maximum.reduceat(vals, group_start)
+        else:
+            result = np.add.reduceat(vals, group_start)
+            if how == "mean":
+                result = result / counts
+        if min_num_obs is not None:
+            result[counts < min_num_obs] = np.nan
+
+        group_key = group_key[group_start]
+        data = np.full((len(periods), num_stats), np.nan)
+        data[group_key % len(periods), group_key // len(periods)] = result
+
+        # station metadata
+        stat_meta_idx = [[] for _ in range(num_stats)]
+        for pos, stat in zip(blocks, block_stat):
+            stat_meta_idx[stat].append(float(meta_keys[pos]))
+        out = {
+            "data": data,
+            "time": periods,
+            "meta_idx": stat_meta_idx,
+        }
+        keys = ["station_name", "latitude", "longitude", "altitude"] + add_meta_keys
+        first_metas = [self.metadata[idx[0]] for idx in stat_meta_idx]
+        for key in keys:
+            default = np.nan if key in ("latitude", "longitude", "altitude") else None
+            out[key] = np.asarray([meta.get(key, default) for meta in first_metas])
+        out["units"] = np.asarray(
+            [meta.get("var_info", {}).get(var_name, {}).get("units") for meta in first_metas]
+        )
+        return out
+
     # TODO: check more general cases (i.e. no need to convert to StationData
     # if no time conversion is required)
     def get_variable_data(
@@ -1713,7 +2031,12 @@ class UngriddedData:
             raise ValueError(f"Invalid input for negate {negate}, need list or str or None")
         meta_matches = []
         totnum = 0
-        for meta_idx, meta in self.metadata.items():
+        candidates = self._find_meta_candidates(negate, *filters[:2])
+        if candidates is None:
+            items = self.metadata.items()
+        else:
+            items = ((idx, self.metadata[idx]) for idx in self._sort_meta_indices(candidates))
+        for meta_idx, meta in items:
             if self._check_filter_match(meta, negate, *filters):
                 meta_matches.append(meta_idx)
                 for var in meta["var_info"]:
@@ -1727,6 +2050,58 @@ class UngriddedData:
 
         return (meta_matches, totnum)
 
+    def _find_meta_candidates(self, negate, str_f, list_f):
+        """Preselect metadata blocks for filtering using inverted indices
+
+        Only (non-negated) string and list filters of
+        :attr:`INDEXED_META_KEYS` are considered. Wildcard patterns are
+        matched against the unique values of a metadata key.
+
+        Parameters
+        ----------
+        negate : list
+            negated meta keys
+        str_f : dict
+            string filters (cf. :func:`_init_meta_filters`)
+        list_f : dict
+            list filters (cf. :func:`_init_meta_filters`)
+
+        Returns
+        -------
+        set or None
+            metadata indices that may match the filters (superset of actual
+            matches) or None if no preselection was possible.
+        """
+        candidates = None
+        for filters in (str_f, list_f):
+            for key, filterval in filters.items():
+                if key in negate or not key in self.INDEXED_META_KEYS:
+                    continue
+                key_index = self._get_meta_key_index(key)
+                if key_index is None:
+                    continue
+                vals = [filterval] if isinstance(filterval, str) else list(filterval)
+                matches = set()
+                if isinstance(filterval, tuple):  # identical to metadata value
+                    matches.update(key_index.get(filterval, []))
+                for val in vals:
+                    try:
+                        matches.update(key_index.get(val, []))
+                    except TypeError:  # unhashable filter value
+                        pass
+                    if isinstance(val, str) and "*" in val:
+                        for metaval, indices in key_index.items():
+                            if isinstance(metaval, str) and fnmatch.fnmatch(metaval, val):
+                                matches.update(indices)
+                if not isinstance(filterval, str):
+                    # list filters do not reject non-string metadata values
+                    # (cf. _check_filter_match)
+                    for metaval, indices in key_index.items():
+                        if not isinstance(metaval, str):
+                            matches.update(indices)
+                candidates = matches if candidates is None else candidates & matches
+        return candidates
+
     def filter_altitude(self, alt_range):
         """Filter altitude range
 
@@ -1957,7 +2332,7 @@ class UngriddedData:
     def _new_from_meta_blocks(self, meta_indices, totnum_new):
         # make a new empty object with the right size (totnum_new)
 
-        new = UngriddedData(num_points=totnum_new)
+        new = UngriddedData(num_points=totnum_new, columnar=self.is_columnar)
 
         meta_idx_new = 0.0
         data_idx_new = 0
@@ -2099,7 +2474,7 @@ class UngriddedData:
                 "additional columns other than default columns"
             )
 
-        subset = UngriddedData(totnum)
+        subset = UngriddedData(totnum, columnar=self.is_columnar)
 
         subset.var_idx[var_name] = 0
         subset._index = self.index
@@ -2263,7 +2638,7 @@ class UngriddedData:
             ignore_keys = []
         sh = self.shape
         lst_meta_idx = self._find_common_meta(ignore_keys)
-        new = UngriddedData(num_points=self.shape[0])
+        new = UngriddedData(num_points=self.shape[0], columnar=self.is_columnar)
         didx = 0
         for i, idx_lst in enumerate(lst_meta_idx):
             _meta_check = {}
@@ -2365,7 +2740,10 @@ class UngriddedData:
                         obj.var_idx[var] = new_idx
                     else:
                         obj.var_idx[var] = idx
-            obj._data = np.vstack([obj._data, other._data])
+            if obj.is_columnar or other.is_columnar:
+                obj._data = ColumnarArray.concatenate([obj._data, other._data])
+            else:
+                obj._data = np.vstack([obj._data, other._data])
             obj.data_revision.update(other.data_revision)
         obj.filter_hist.update(other.filter_hist)
         obj._check_index()
@@ -2851,9 +3229,9 @@ class UngriddedData:
 
         Note
         ----
-        So far, only storage as pickled object via
-        `CacheHandlerUngridded` is supported, so input file_name must end
-        with .pkl
+        So far, only storage via `CacheHandlerUngridded` is supported, so
+        input file_name must end with .pkl (pickled object) or .mmap
+        (memory-mappable cache directory)
 
         Parameters
         ----------
@@ -2872,22 +3250,25 @@ class UngriddedData:
 
         if not os.path.exists(save_dir):
             raise FileNotFoundError(f"Directory does not exist: {save_dir}")
-        elif not file_name.endswith(".pkl"):
-            raise ValueError("Can only store files as pickle, file_name needs to have format .pkl")
+        elif not file_name.endswith(tuple(CacheHandlerUngridded.SUPPORTED_FORMATS.values())):
+            raise ValueError(
+                "Can only store files as pickle or mmap cache, file_name needs to "
+                "have format .pkl or .mmap"
+            )
         ch = CacheHandlerUngridded()
         return ch.write(self, var_or_file_name=file_name, cache_dir=save_dir)
 
     @staticmethod
     def from_cache(data_dir, file_name):
         """
-        Load pickled instance of `UngriddedData`
+        Load cached instance of `UngriddedData`
 
         Parameters
         ----------
         data_dir : str
-            directory where pickled object is stored
+            directory where cached object is stored
         file_name : str
-            file name of pickled object (needs to end with pkl)
+            file name of cached object (needs to end with pkl or mmap)
 
         Raises
         ------
@@ -3009,6 +3390,222 @@ class UngriddedData:
         return s
 
 
+class UngriddedDataBuilder:
+    """Helper for assembling :class:`UngriddedData` from single station data
+
+    Readers (and :func:`UngriddedData.from_station_data`) register the
+    metadata of each station via :func:`add_meta` and the data of each
+    variable of that station via :func:`add_var`. The data blocks are
+    collected and then written into the data array of the output object in
+    one go when calling :func:`build`, using precomputed row offsets. This
+    avoids growing the data array during reading (cf.
+    :func:`UngriddedData.add_chunk`) and converts timestamps in a vectorised
+    manner.
+
+    Example
+    -------
+    >>> builder = UngriddedDataBuilder()
+    >>> meta_key = builder.add_meta(dict(station_name="Bla", var_info={}))
+    >>> builder.add_var(meta_key, "od550aer", dtime, values, lat, lon, alt)
+    >>> data = builder.build()
+
+    Attributes
+    ----------
+    metadata : dict
+        metadata of output object (keys are metadata keys)
+    var_idx : dict
+        variable indices of output object, variables are numbered in the
+        order in which they are added
+    """
+
+    def __init__(self):
+        self.metadata = {}
+        self.var_idx = {}
+        self._meta_keys = []
+        self._blocks = []
+        self._num_points = 0
+        # timestamps of last block and their float representation (the same
+        # timestamps are usually added for all variables of a station)
+        self._last_times = (None, None)
+
+    @property
+    def num_points(self):
+        """Total number of data points (rows) that were added"""
+        return self._num_points
+
+    @staticmethod
+    def times_to_float(times):
+        """Convert timestamps to float (seconds since 1970-01-01)
+
+        Parameters
+        ----------
+        times : array-like
+            timestamps, may be numpy datetime64 array (of any resolution),
+            :class:`pandas.DatetimeIndex`, list of datetime objects or strings,
+            or float array (which is assumed to be in units of seconds
+            already).
+
+        Returns
+        -------
+        ndarray
+            float timestamps in units of seconds
+        """
+        if isinstance(times, pd.DatetimeIndex):
+            times = times.values
+        times = np.asarray(times)
+        if times.dtype.kind == "f":
+            return times
+        return times.astype("datetime64[s]").astype(np.float64)
+
+    def add_meta(self, meta):
+        """Register metadata block of a new station
+
+        Parameters
+        ----------
+        meta : dict
+            metadata of station
+
+        Returns
+        -------
+        float
+            metadata key of station, to be used in :func:`add_var`
+        """
+        meta_key = float(len(self._meta_keys))
+        self._meta_keys.append(meta_key)
+        self.metadata[meta_key] = meta
+        return meta_key
+
+    def add_var(
+        self,
+        meta_key,
+        var_name,
+        times,
+        values,
+        latitude,
+        longitude,
+        altitude,
+        data_flagged=None,
+        data_err=None,
+    ):
+        """Add data of one variable of a station
+
+        Parameters
+        ----------
+        meta_key : float
+            metadata key of station (cf. :func:`add_meta`)
+        var_name : str
+            name of variable
+        times : array-like
+            timestamps of data (cf. :func:`times_to_float`)
+        values : array-like
+            data values
+        latitude : float or array-like
+            latitude of station (or of each data point)
+        longitude : float or array-like
+            longitude of station (or of each data point)
+        altitude : float or array-like
+            altitude of station (or of each data point)
+        data_flagged : array-like, optional
+            flags of data points (True if invalid)
+        data_err : array-like, optional
+            uncertainties of data points
+
+        Raises
+        ------
+        ValueError
+            if lengths of timestamps and data values do not match
+        """
+        if times is self._last_times[0]:
+            times_float = self._last_times[1]
+        else:
+            times_float = self.times_to_float(times)
+            self._last_times = (times, times_float)
+        values = np.asarray(values, dtype=np.float64)
+        if not len(times_float) == len(values):
+            raise ValueError(
+                f"Length mismatch of timestamps ({len(times_float)}) and data "
+                f"({len(values)}) of variable {var_name} in meta block {meta_key}"
+            )
+        if not var_name in self.var_idx:
+            self.var_idx[var_name] = len(self.var_idx)
+        self._blocks.append(
+            (
+                meta_key,
+                var_name,
+                times_float,
+                values,
+                (latitude, longitude, altitude),
+                data_flagged,
+                data_err,
+            )
+        )
+        self._num_points += len(values)
+
+    def build(self, columnar=False):
+        """Create :class:`UngriddedData` object from collected data
+
+        Parameters
+        ----------
+        columnar : bool
+            if True, data is stored column-wise in output object (cf.
+            :func:`UngriddedData.to_columnar`)
+
+        Returns
+        -------
+        UngriddedData
+            data object
+        """
+        data_obj = UngriddedData(num_points=self._num_points, columnar=columnar)
+        arr = data_obj._data
+
+        sizes = np.fromiter((len(b[3]) for b in self._blocks), int, len(self._blocks))
+        offsets = np.zeros(len(sizes) + 1, dtype=int)
+        np.cumsum(sizes, out=offsets[1:])
+
+        if len(self._blocks) > 0:
+            meta_keys, var_names, times, values, coords, flags, errs = zip(*self._blocks)
+            arr[:, data_obj._METADATAKEYINDEX] = np.repeat(meta_keys, sizes)
+            arr[:, data_obj._VARINDEX] = np.repeat([self.var_idx[v] for v in var_names], sizes)
+            arr[:, data_obj._TIMEINDEX] = np.concatenate(times)
+            arr[:, data_obj._DATAINDEX] = np.concatenate(values)
+            for col, idx in enumerate(
+                [data_obj._LATINDEX, data_obj._LONINDEX, data_obj._ALTITUDEINDEX]
+            ):
+                self._write_col(arr, idx, [c[col] for c in coords], sizes, offsets)
+            self._write_col(arr, data_obj._DATAFLAGINDEX, flags, sizes, offsets)
+            self._write_col(arr, data_obj._DATAERRINDEX, errs, sizes, offsets)
+
+        meta_idx = {meta_key: {} for meta_key in self._meta_keys}
+        for i, block in enumerate(self._blocks):
+            meta_idx[block[0]][block[1]] = np.arange(offsets[i], offsets[i + 1])
+
+        data_obj.metadata = self.metadata
+        data_obj.meta_idx = meta_idx
+        data_obj.var_idx = self.var_idx
+        return data_obj
+
+    @staticmethod
+    def _write_col(arr, col, vals, sizes, offsets):
+        """Write values of all blocks into column of data array
+
+        Values may be scalars (which are broadcast to the size of the
+        corresponding block), arrays or None (in which case the block is
+        left NaN).
+        """
+        if all(v is None for v in vals):
+            return
+        try:
+            scalars = np.asarray(vals, dtype=np.float64)
+        except (ValueError, TypeError):  # contains arrays
+            scalars = None
+        if scalars is not None and scalars.ndim == 1:
+            arr[:, col] = np.repeat(scalars, sizes)
+            return
+        for i, val in enumerate(vals):
+            if val is not None:
+                arr[offsets[i] : offsets[i + 1], col] = val
+
+
 def reduce_array_closest(arr_nominal, arr_to_be_reduced):
     test = sorted(arr_to_be_reduced)
     closest_idx = []
@@ -1,10 +1,12 @@
+from functools import lru_cache
+
 import pandas as pd
 from cf_units import Unit
 
 from pyaerocom.exceptions import UnitConversionError
 from pyaerocom.time_config import SI_TO_TS_TYPE
 from pyaerocom.tstype import TsType
-from pyaerocom.variable_helpers import get_variable
+from pyaerocom.variable_helpers import get_variable, parse_variables_ini
 
 #: default frequency for rates variables (e.g. deposition, precip)
 RATES_FREQ_DEFAULT = "d"
@@ -97,6 +99,18 @@ UALIASES = {
 }
 
 
+#: cache of conversion factors (or conversion errors), keys are
+#: (from_unit, to_unit, var_name, ts_type), cf. :func:`get_unit_conversion_fac`
+_UCONV_FAC_CACHE = {}
+_UCONV_FAC_CACHE_STATS = dict(hits=0, misses=0)
+
+
+@lru_cache(maxsize=None)
+def _get_unit(unit):
+    """Parsed :class:`cf_units.Unit` of input unit string (cached)"""
+    return Unit(unit)
+
+
 def _check_unit_endswith_freq(unit):
     """
     Check if input unit ends with an SI frequency string
@@ -233,7 +247,9 @@ def _unit_conversion_fac_si(from_unit, to_unit):
 
     """
     if isinstance(from_unit, str):
-        from_unit = Unit(from_unit)
+        from_unit = _get_unit(from_unit)
+    if isinstance(to_unit, str):
+        to_unit = _get_unit(to_unit)
     try:
         return from_unit.convert(1, to_unit)
     except ValueError:
@@ -275,7 +291,125 @@ def _get_unit_conversion_fac_helper(from_unit, to_unit, var_name=None):
     return _unit_conversion_fac_si(from_unit, to_unit) * pre_conv_fac
 
 
+def _cache_key(from_unit, to_unit, var_name, ts_type):
+    """Key for conversion factor cache or None if input is not cacheable"""
+    if isinstance(from_unit, Unit):
+        from_unit = str(from_unit)
+    if isinstance(to_unit, Unit):
+        to_unit = str(to_unit)
+    if not isinstance(from_unit, str) or not isinstance(to_unit, str):
+        return None
+    if ts_type is not None:
+        ts_type = str(ts_type)
+    return (from_unit, to_unit, var_name, ts_type)
+
+
 def get_unit_conversion_fac(from_unit, to_unit, var_name=None, ts_type=None):
+    """
+    Get multiplication factor for unit conversion
+
+    Results (including failed conversions) are cached, i.e. units are parsed
+    only once per combination of input arguments. See
+    :func:`get_unit_conversion_cache_info` and
+    :func:`clear_unit_conversion_cache`.
+
+    Parameters
+    ----------
+    from_unit : cf_units.Unit or str
+        input unit
+    to_unit : cf_units.Unit or str
+        output unit
+    var_name : str, optional
+        name of variable. If provided, and standard conversion with
+        :mod:`cf_units` fails, then custom unit conversion is attempted.
+    ts_type : str, optional
+        frequency of data. May be needed for conversion of rate variables
+        such as precip, deposition, etc, that may be defined implictly
+        without proper frequency specification in the unit string.
+
+    Raises
+    ------
+    UnitConversionError
+        if conversion fails
+
+    Returns
+    -------
+    float
+        multiplication factor to convert data with input unit to output unit
+    """
+    key = _cache_key(from_unit, to_unit, var_name, ts_type)
+    if key is None:
+        return _get_unit_conversion_fac(from_unit, to_unit, var_name, ts_type)
+    if not _UCONV_FAC_CACHE:
+        _prewarm_unit_conversion_cache()
+    if key in _UCONV_FAC_CACHE:
+        _UCONV_FAC_CACHE_STATS["hits"] += 1
+        fac = _UCONV_FAC_CACHE[key]
+    else:
+        _UCONV_FAC_CACHE_STATS["misses"] += 1
+        try:
+            fac = _get_unit_conversion_fac(from_unit, to_unit, var_name, ts_type)
+        except UnitConversionError as e:
+            fac = e
+        _UCONV_FAC_CACHE[key] = fac
+    if isinstance(fac, UnitConversionError):
+        raise UnitConversionError(str(fac))
+    return fac
+
+
+def _prewarm_unit_conversion_cache():
+    """Fill unit conversion cache with defaults
+
+    Parses all units defined in variables.ini and adds the custom conversion
+    factors defined in :attr:`UCONV_MUL_FACS` (and their aliases in
+    :attr:`UALIASES`).
+    """
+    cfg = parse_variables_ini()
+    for section in cfg.sections():
+        unit = cfg[section].get("unit", fallback=None)
+        if unit is None or unit == "None":
+            continue
+        try:
+            _get_unit(unit)
+        except ValueError:  # not a valid cf unit
+            continue
+        _UCONV_FAC_CACHE[(unit, unit, None, None)] = 1.0
+    alias_units = {}
+    for alias, unit in UALIASES.items():
+        alias_units.setdefault(unit, []).append(alias)
+    for (var_name, from_unit), info in UCONV_MUL_FACS.iterrows():
+        for unit in [from_unit] + alias_units.get(from_unit, []):
+            try:
+                fac = _get_unit_conversion_fac(unit, info.to, var_name)
+            except UnitConversionError:
+                continue
+            _UCONV_FAC_CACHE[(unit, info.to, var_name, None)] = fac
+
+
+def get_unit_conversion_cache_info():
+    """
+    Statistics of unit conversion factor cache
+
+    Returns
+    -------
+    dict
+        number of cache hits and misses and current number of cached entries
+    """
+    return dict(**_UCONV_FAC_CACHE_STATS, size=len(_UCONV_FAC_CACHE))
+
+
+def clear_unit_conversion_cache():
+    """Remove all cached unit conversion factors and reset cache statistics
+
+    Needs to be called if :attr:`UCONV_MUL_FACS` or :attr:`UALIASES` are
+    modified.
+    """
+    _UCONV_FAC_CACHE.clear()
+    _UCONV_FAC_CACHE_STATS.update(hits=0, misses=0)
+
+
+def _get_unit_conversion_fac(from_unit, to_unit, var_name=None, ts_type=None):
+    """Uncached version of :func:`get_unit_conversion_fac`"""
     try:
         return _get_unit_conversion_fac_helper(from_unit, to_unit, var_name)
     except UnitConversionError:
@@ -7,13 +7,21 @@ from cf_units import Unit
 
 from pyaerocom.exceptions import VariableDefinitionError
 from pyaerocom.variable import Variable
-from pyaerocom.variable_helpers import parse_aliases_ini, parse_variables_ini
+from pyaerocom.variable_helpers import get_alias_maps, parse_variables_ini
 
 logger = logging.getLogger(__name__)
 
 
 class VarCollection:
-    """Variable access class based on variables.ini file"""
+    """Variable access class based on variables.ini file
+
+    Each :class:`Variable` is created only once (on first access) and then
+    cached in read-only form, i.e. repeated lookups like ``const.VARS[name]``
+    return the same instance without re-parsing the ini file. Callers that
+    need to modify a variable can request a copy via
+    ``get_var(var_name, copy=True)``. Cache statistics are available via
+    :func:`cache_info`.
+    """
 
     def __init__(self, var_ini):
         self._all_vars = None
@@ -24,9 +32,13 @@ class VarCollection:
         self._vars_added = {}
 
         self._cfg_parser = parse_variables_ini(var_ini)
-        self._alias_parser = parse_aliases_ini()
+        self._aliases, self._alias_families = get_alias_maps()
         self._idx = -1
 
+        self._cache = {}
+        self._hits = 0
+        self._misses = 0
+
     @property
     def all_vars(self):
         """List of all variables
@@ -119,15 +131,25 @@ class VarCollection:
         self._all_vars == all_vars
         if var_name in self._vars_added:
             del self._vars_added[var_name]
+        # cached aliases may point to the deleted variable
+        self.clear_cache()
 
-    def get_var(self, var_name):
+    def get_var(self, var_name, copy=False):
         """
         Get variable based on variable name
 
+        Note
+        ----
+        Variables defined in the ini file are returned as cached read-only
+        instances (cf. :attr:`Variable.read_only`). Use `copy=True` if the
+        returned variable is to be modified.
+
         Parameters
         ----------
         var_name : str
             name of variable
+        copy : bool
+            if True, a modifiable copy of the variable is returned.
 
         Raises
         ------
@@ -141,14 +163,55 @@ class VarCollection:
 
         """
         if var_name in self._vars_added:
-            return self._vars_added[var_name]
+            var = self._vars_added[var_name]
+        elif var_name in self._cache:
+            self._hits += 1
+            var = self._cache[var_name]
+        else:
+            self._misses += 1
+            var = self._make_var(var_name)
+            self._cache[var_name] = var
+        return var.copy() if copy else var
+
+    def _make_var(self, var_name):
+        """Create read-only variable from ini file"""
+        if not self._is_defined(var_name):
+            raise VariableDefinitionError(
+                f"Error (VarCollection): input variable {var_name} is not supported"
+            )
         var = Variable(var_name, cfg=self._cfg_parser)
         if not var.var_name_aerocom in self:
             raise VariableDefinitionError(
                 f"Error (VarCollection): input variable {var_name} is not supported"
             )
+        var.set_read_only()
         return var
 
+    def _is_defined(self, var_name):
+        """Check if variable name can be resolved via ini file or alias maps"""
+        var_name = Variable._check_input_var_name(var_name)
+        if var_name in self._cfg_parser or var_name in self._aliases:
+            return True
+        return any(var_name.startswith(fam) for fam in self._alias_families.values())
+
+    def cache_info(self):
+        """
+        Statistics of variable cache
+
+        Returns
+        -------
+        dict
+            number of cache hits and misses (i.e. variables that were created
+            from the ini file) and current number of cached variables
+        """
+        return dict(hits=self._hits, misses=self._misses, size=len(self._cache))
+
+    def clear_cache(self):
+        """Remove all cached variables and reset cache statistics"""
+        self._cache = {}
+        self._hits = 0
+        self._misses = 0
+
     def find(self, search_pattern):
         """Find all variables that match input search pattern
 
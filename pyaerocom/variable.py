@@ -2,6 +2,7 @@ import logging
 import warnings
 from ast import literal_eval
 from configparser import ConfigParser
+from copy import deepcopy
 
 import numpy as np
 
@@ -12,13 +13,7 @@ from pyaerocom.mathutils import make_binlist
 from pyaerocom.obs_io import OBS_WAVELENGTH_TOL_NM
 
 #: helper vor checking if variable name contains str 3d or 3D
-from pyaerocom.variable_helpers import (
-    _check_alias_family,
-    _read_alias_ini,
-    get_aliases,
-    parse_aliases_ini,
-    parse_variables_ini,
-)
+from pyaerocom.variable_helpers import get_aliases, parse_variables_ini, resolve_alias
 from pyaerocom.varnameinfo import VarNameInfo
 
 logger = logging.getLogger(__name__)
@@ -128,6 +123,8 @@ class Variable:
     # maybe used in config
     ALT_NAMES = {"unit": "units"}
 
+    _read_only = False
+
     plot_info_keys = [
         "scat_xlim",
         "scat_ylim",
@@ -402,11 +399,27 @@ class Variable:
 
     @staticmethod
     def _check_aliases(var_name):
-        ap = parse_aliases_ini()
-        aliases = _read_alias_ini(ap)
-        if var_name in aliases:
-            return aliases[var_name]
-        return _check_alias_family(var_name, ap)
+        return resolve_alias(var_name)
+
+    @property
+    def read_only(self):
+        """Boolean specifying whether this variable is read-only
+
+        Read-only variables are the shared instances handed out by
+        :class:`pyaerocom.varcollection.VarCollection` (i.e. ``const.VARS``).
+        Use :func:`copy` to get a modifiable copy.
+        """
+        return self._read_only
+
+    def set_read_only(self):
+        """Make this variable read-only (cannot be undone)"""
+        object.__setattr__(self, "_read_only", True)
+
+    def copy(self):
+        """Modifiable (deep) copy of this variable"""
+        new = deepcopy(self)
+        object.__setattr__(new, "_read_only", False)
+        return new
 
     def get_default_vert_code(self):
         """Get default vertical code for variable name"""
@@ -436,13 +449,16 @@ class Variable:
         """
         Calculate cmap discretisation bins from :attr:`vmin` and :attr:`vmax`
 
-        Sets value of :attr:`map_cbar_levels`
-
         Raises
         ------
         AttributeError
              if :attr:`vmin` and :attr:`vmax` are not defined
 
+        Returns
+        -------
+        list
+            levels
+
         """
         if self.minimum == self.VMIN_DEFAULT or self.maximum == self.VMAX_DEFAULT:
             raise AttributeError(
@@ -450,7 +466,7 @@ class Variable:
                 f"for variable {self.var_name} in "
                 f"order to retrieve cmap_bins"
             )
-        self.map_cbar_levels = make_binlist(self.minimum, self.maximum)
+        return make_binlist(self.minimum, self.maximum)
 
     def get_cmap_bins(self, infer_if_missing=True):
         """
@@ -460,7 +476,8 @@ class Variable:
         ----------
         infer_if_missing : bool
             if True and :attr:`map_cbar_levels` is not defined, try to infer
-            using :func:`_cmap_bins_from_vmin_vmax`.
+            using :func:`_cmap_bins_from_vmin_vmax` (the inferred levels are
+            not assigned to :attr:`map_cbar_levels`).
 
         Raises
         ------
@@ -475,7 +492,7 @@ class Variable:
         """
         if self.map_cbar_levels is None:
             if infer_if_missing:
-                self._cmap_bins_from_vmin_vmax()
+                return self._cmap_bins_from_vmin_vmax()
             else:
                 raise AttributeError(
                     f"map_cbar_levels is not defined for variable {self.var_name}"
@@ -540,7 +557,19 @@ class Variable:
             val = None
         self[key] = val
 
+    def _check_writable(self, key):
+        if self._read_only:
+            raise AttributeError(
+                f"Cannot set {key} of read-only variable {self.var_name}, "
+                f"please use a copy (e.g. const.VARS.get_var(var_name, copy=True))"
+            )
+
+    def __setattr__(self, key, val):
+        self._check_writable(key)
+        super().__setattr__(key, val)
+
     def __setitem__(self, key, val):
+        self._check_writable(key)
         self.__dict__[key] = val
 
     def __getitem__(self, key):
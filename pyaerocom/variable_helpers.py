@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from configparser import ConfigParser
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 from pyaerocom.data import resources
 from pyaerocom.exceptions import VariableDefinitionError
@@ -60,6 +62,57 @@ def _read_alias_ini(parser: ConfigParser | None = None):
     return aliases
 
 
+@lru_cache(maxsize=None)
+def get_alias_maps():
+    """Alias lookup tables of aliases.ini file
+
+    The file is parsed only once, the returned mappings are read-only.
+
+    Returns
+    -------
+    MappingProxyType
+        keys are aliases, values are corresponding AEROCOM variable names
+    MappingProxyType
+        keys are AEROCOM variable families (e.g. ``od``), values are the
+        corresponding alias families (section [alias_families])
+    """
+    parser = parse_aliases_ini()
+    aliases = _read_alias_ini(parser)
+    families = dict(parser["alias_families"])
+    return MappingProxyType(aliases), MappingProxyType(families)
+
+
+def resolve_alias(var_name: str) -> str:
+    """Get AEROCOM variable name for an alias
+
+    Parameters
+    ----------
+    var_name : str
+        alias variable name (e.g. ``od550csaer``)
+
+    Raises
+    ------
+    VariableDefinitionError
+        if input is neither a registered alias nor belongs to an alias family
+
+    Returns
+    -------
+    str
+        AEROCOM variable name
+    """
+    aliases, families = get_alias_maps()
+    if var_name in aliases:
+        return aliases[var_name]
+    for var_fam, alias_fam in families.items():
+        if var_name.startswith(alias_fam):
+            return var_name.replace(alias_fam, var_fam)
+    raise VariableDefinitionError(
+        "Input variable could not be identified as "
+        "belonging to either of the available alias "
+        "variable families"
+    )
+
+
 def get_aliases(var_name: str, parser: ConfigParser | None = None):
     """Get aliases for a certain variable"""
     if parser is None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import gzip
 import json
 from pathlib import Path
 
@@ -14,9 +15,11 @@ from pyaerocom.aeroval.coldatatojson_helpers import (
     _prepare_default_regions_json,
     _prepare_htap_regions_json,
     _prepare_regions_json_helper,
+    _to_json_compatible,
     _write_diurnal_week_stationdata_json,
     _write_site_data,
     _write_stationdata_json,
+    get_station_shard_file_name,
     get_stationfile_name,
 )
 from pyaerocom.region import get_all_default_region_ids
@@ -65,6 +68,60 @@ def test__write_site_data(tmp_path: Path):
     assert len(list(tmp_path.glob("*.json"))) == len(data)
 
 
+def test__to_json_compatible():
+    data = dict(
+        name="stat1",
+        lat=np.float64(1.123456789),
+        alt=np.nan,
+        num=np.int64(3),
+        obs=np.array([1.123456789, np.nan, np.inf], dtype=np.float32),
+        mod=[np.nan, 2.0],
+        date=np.array([1, 2]),
+        region=["EUROPE", "ALL"],
+        empty=[],
+        nested=[[1.0, 2.0], [3.0]],
+    )
+    result = _to_json_compatible(data)
+    assert result == dict(
+        name="stat1",
+        lat=1.12346,
+        alt=None,
+        num=3,
+        obs=[1.12346, None, None],
+        mod=[None, 2.0],
+        date=[1, 2],
+        region=["EUROPE", "ALL"],
+        empty=[],
+        nested=[[1.0, 2.0], [3.0]],
+    )
+    assert json.loads(json.dumps(result)) == result
+
+
+def test__write_site_data_compress_shard(tmp_path: Path):
+    data = [
+        dict(
+            model_name=f"model{n % 2}",
+            station_name=f"stat{n // 2}",
+            region=["EUROPE", "ALL"],
+            obs_name="obs",
+            var_name_web="var",
+            vert_code="Column",
+            daily_obs=np.array([n, np.nan]),
+        )
+        for n in range(4)
+    ]
+    _write_site_data(data[:3], str(tmp_path), compress=True, shard_by_region=True)
+    _write_site_data(data[3:], str(tmp_path), compress=True, shard_by_region=True)
+
+    fname = get_station_shard_file_name("EUROPE", "obs", "var", "Column")
+    assert [p.name for p in tmp_path.iterdir()] == [f"{fname}.gz"]
+    with gzip.open(tmp_path / f"{fname}.gz", "rt") as f:
+        content = json.load(f)
+    assert sorted(content) == ["model0", "model1"]
+    assert sorted(content["model1"]) == ["stat0", "stat1"]
+    assert content["model1"]["stat1"]["daily_obs"] == [3.0, None]
+
+
 def test__write_diurnal_week_stationdata_json(tmp_path: Path):
     data = dict(station_name="stat1", obs_name="obs1", var_name_web="var1", vert_code="Column")
     dirs = {"ts/diurnal": tmp_path}
@@ -10,12 +10,14 @@ from pyexpat.errors import XML_ERROR_PARAM_ENTITY_REF
 
 from pyaerocom import ColocatedData, TsType
 from pyaerocom.aeroval.coldatatojson_helpers import (
+    _calc_statistics_periods,
     _create_diurnal_weekly_data_object,
     _get_jsdate,
     _get_period_keys,
     _init_data_default_frequencies,
     _init_meta_glob,
     _make_trends,
+    _make_trends_batch,
     _map_indices,
     _process_statistics_timeseries,
     get_heatmap_filename,
@@ -111,6 +113,19 @@ def test__process_statistics_timeseries(
     assert mean_bias == pytest.approx(nmb_avg, abs=0.001, nan_ok=True)
 
 
+@pytest.mark.parametrize("coldataset", ["fake_3d"])
+def test__calc_statistics_periods(coldata: ColocatedData):
+    coldata.data[0, 5:20, 1:] = np.nan
+    to_idx = coldata.resample_time("yearly").data.time.values
+    stats = _calc_statistics_periods(coldata, to_idx, "Y")
+    assert len(stats) == len(to_idx) == 20
+    for year, result in zip(to_idx.astype("datetime64[Y]"), stats):
+        expected = ColocatedData(coldata.data.sel(time=str(year))).calc_statistics()
+        assert list(result) == list(expected)
+        for key, val in expected.items():
+            assert result[key] == pytest.approx(val, rel=1e-10, nan_ok=True)
+
+
 @pytest.mark.parametrize(
     "freq,region_ids,data_freq,exception,error",
     [
@@ -194,6 +209,34 @@ def test__make_trends(
     assert int(mod_trend["map_var"].split("_")[1]) == start
 
 
+@pytest.mark.parametrize(
+    "freq,season,start,stop,min_yrs",
+    [
+        ("yearly", "all", 2000, 2015, 7),
+        ("monthly", "JJA", 2010, 2015, 4),
+    ],
+)
+@pytest.mark.parametrize("coldataset", ["fake_3d_trends"])
+def test__make_trends_batch(
+    coldata: ColocatedData, freq: str, season: str, start: int, stop: int, min_yrs: int
+):
+    obs_vals = coldata.data.data[0]
+    mod_vals = coldata.data.data[1]
+    time = coldata.data.time
+
+    trends = _make_trends_batch(obs_vals, mod_vals, time, freq, season, start, stop, min_yrs)
+    assert len(trends) == obs_vals.shape[1]
+    for station, (obs_trend, mod_trend) in enumerate(trends):
+        expected = _make_trends(
+            obs_vals[:, station], mod_vals[:, station], time, freq, season, start, stop, min_yrs
+        )
+        assert obs_trend == expected[0]
+        assert mod_trend == expected[1]
+
+    with pytest.raises(AeroValTrendsError):
+        _make_trends_batch(obs_vals, mod_vals, time, freq, season, 2010, 2012, min_yrs)
+
+
 @pytest.mark.parametrize(
     "freq,season,min_yrs,exception,error",
     [
@@ -8,6 +8,7 @@ import pytest
 from pyaerocom import const
 from pyaerocom._lowlevel_helpers import read_json, write_json
 from pyaerocom.aeroval import ExperimentProcessor
+from pyaerocom.aeroval.coldatatojson_helpers import _dump_json_file, _read_json_file
 from pyaerocom.aeroval.experiment_output import ExperimentOutput, ProjectOutput
 from pyaerocom.aeroval.setupclasses import EvalSetup
 from tests.conftest import geojson_unavail
@@ -198,6 +199,23 @@ def test_ExperimentOutput_clean_json_files_EMPTY(dummy_expout: ExperimentOutput)
     assert len(modified) == 0
 
 
+@pytest.mark.parametrize("ext", [".json", ".json.gz"])
+def test_ExperimentOutput_clean_json_files_ts(tmp_path: Path, ext: str):
+    setup = EvalSetup(
+        proj_id="proj",
+        exp_id="exp",
+        json_basedir=str(tmp_path),
+        obs_cfg=dict(obs1=dict(obs_id="obs1", obs_vars=["od550aer"], obs_vert_type="Column")),
+        model_cfg=dict(mod1=dict(model_id="mod1")),
+    )
+    expout = ExperimentOutput(setup)
+    fp = str(Path(expout.out_dirs_json["ts"]) / f"stat_obs1-od550aer_Column{ext}")
+    _dump_json_file({"mod1": {"a": 1}, "mod2": {"a": 2}}, fp)
+    assert expout._get_json_output_files("ts") == [fp]
+    assert fp in expout.clean_json_files()
+    assert _read_json_file(fp) == {"mod1": {"a": 1}}
+
+
 @pytest.mark.skip(reason="needs revision")
 def test_ExperimentOutput__clean_modelmap_files(dummy_expout: ExperimentOutput):
     dummy_expout._clean_modelmap_files()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pyaerocom.aeroval.json_output_buffer import JsonOutputBuffer, update_nested_json
+
+
+def test_update_nested_json(tmp_path: Path):
+    (tmp_path / "hm").mkdir()
+    path = tmp_path / "hm" / "nested.json"
+    update_nested_json(path, {("a", "b", "c"): 1, ("a", "d"): None})
+    assert json.loads(path.read_text()) == {"a": {"b": {"c": 1}, "d": None}}
+
+    update_nested_json(path, {("a", "b", "c"): 2, ("x",): 3.0})
+    assert json.loads(path.read_text()) == {"a": {"b": {"c": 2}, "d": None}, "x": 3.0}
+    # neither temporary files nor lock files are left in the output directory
+    assert [p.name for p in path.parent.iterdir()] == ["nested.json"]
+    lock_file = tmp_path / ".hm.lock"
+    assert lock_file.exists()
+    assert lock_file.stat().st_mode & 0o777 == 0o666
+
+
+def test_update_nested_json_lock_file(tmp_path: Path):
+    path = tmp_path / "nested.json"
+    lock_file = tmp_path / "json.lock"
+    # e.g. lock file created by another user
+    lock_file.touch(mode=0o444)
+    update_nested_json(path, {("a",): 1}, lock_file)
+    assert json.loads(path.read_text()) == {"a": 1}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["json.lock", "nested.json"]
+
+
+def test_update_nested_json_concurrent(tmp_path: Path):
+    path = tmp_path / "nested.json"
+
+    def add(i):
+        update_nested_json(path, {("model", f"var{i}"): i}, tmp_path / "json.lock")
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(add, range(40)))
+
+    data = json.loads(path.read_text())
+    assert data["model"] == {f"var{i}": i for i in range(40)}
+
+
+def test_JsonOutputBuffer(tmp_path: Path):
+    hm_file = tmp_path / "hm.json"
+    ts_file = tmp_path / "ts.json"
+    buffer = JsonOutputBuffer(lock_file=tmp_path / "json.lock")
+    assert len(buffer) == 0
+
+    buffer.add_heatmap_entry(hm_file, {"value": 1}, "obs", "var", "Column", "mod1", "mvar")
+    buffer.add_heatmap_entry(hm_file, {"value": 2}, "obs", "var", "Column", "mod2", "mvar")
+    buffer.add_heatmap_entry(ts_file, {"value": 3}, "obs", "var", "Column", "mod1", "mvar")
+    # later entries for the same key replace earlier ones
+    buffer.add_heatmap_entry(hm_file, {"value": 4}, "obs", "var", "Column", "mod1", "mvar")
+    assert len(buffer) == 3
+    assert buffer.files == [str(hm_file), str(ts_file)]
+    assert not hm_file.exists()
+
+    written = buffer.flush()
+    assert written == [str(hm_file), str(ts_file)]
+    assert len(buffer) == 0
+
+    data = json.loads(hm_file.read_text())
+    assert data["var"]["obs"]["Column"] == {
+        "mod1": {"mvar": {"value": 4}},
+        "mod2": {"mvar": {"value": 2}},
+    }
+
+    # flushing again merges with existing file content
+    buffer.add_heatmap_entry(hm_file, {"value": 5}, "obs2", "var", "Column", "mod1", "mvar")
+    buffer.flush()
+    data = json.loads(hm_file.read_text())
+    assert data["var"]["obs"]["Column"]["mod1"]["mvar"] == {"value": 4}
+    assert data["var"]["obs2"]["Column"]["mod1"]["mvar"] == {"value": 5}
+
+    buffer.add_heatmap_entry(ts_file, {}, "obs", "var", "Column", "mod1", "mvar")
+    buffer.clear()
+    assert buffer.flush() == []
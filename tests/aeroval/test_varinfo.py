@@ -1,7 +1,19 @@
+from pyaerocom import const
 from pyaerocom.aeroval.varinfo_web import VarinfoWeb
+from pyaerocom.mathutils import make_binlist
 
 
 def test_varinfo_web():
     info = VarinfoWeb.from_dict({"var_name": "od550aer"})
     assert info
     assert info.var_name == "od550aer"
+
+
+def test_varinfo_web_cmap_bins_inferred():
+    # concpm10 has minimum and maximum but no map_cbar_levels in variables.ini
+    var = const.VARS["concpm10"]
+    assert var.read_only
+    assert var.map_cbar_levels is None
+    info = VarinfoWeb("concpm10")
+    assert info.cmap_bins == make_binlist(var.minimum, var.maximum)
+    assert var.map_cbar_levels is None
@@ -1,6 +1,12 @@
+import os
+from pathlib import Path
+
 import pytest
 
+from pyaerocom import const
+from pyaerocom.io import aerocom_browser
 from pyaerocom.io.aerocom_browser import AerocomBrowser
+from pyaerocom.io.fileindex import DirectoryIndex
 
 
 @pytest.mark.parametrize(
@@ -15,3 +21,21 @@ def test_find_data_dir(searchstr, endswith):
 
     data_dir = browser.find_data_dir(searchstr)
     assert data_dir.endswith(endswith)
+
+
+def test__list_subdirs(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(const, "_caching_active", True)
+    index = DirectoryIndex("test", str(tmp_path / "index"))
+    monkeypatch.setattr(aerocom_browser, "_SUBDIR_INDEX", index)
+    search_dir = tmp_path / "modeldata"
+    search_dir.mkdir()
+    (search_dir / "MODEL1").mkdir()
+    (search_dir / "file.txt").write_text("")
+    mtime = search_dir.stat().st_mtime - 60
+    os.utime(search_dir, (mtime, mtime))
+
+    assert aerocom_browser._list_subdirs(str(search_dir)) == ["MODEL1"]
+    assert index.get(str(search_dir), "subdirs") == ["MODEL1"]
+
+    (search_dir / "MODEL2").mkdir()
+    assert sorted(aerocom_browser._list_subdirs(str(search_dir))) == ["MODEL1", "MODEL2"]
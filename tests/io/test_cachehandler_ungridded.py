@@ -1,5 +1,7 @@
+import shutil
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from pyaerocom import UngriddedData
@@ -21,10 +23,14 @@ def test_cache_dir(cache_handler: CacheHandlerUngridded):
     assert comps[-3] == "MyPyaerocom"
 
 
+@pytest.mark.parametrize("file_name", ["test_manual_caching.pkl", "test_manual_caching.mmap"])
 def test_reload_custom(
-    cache_handler: CacheHandlerUngridded, aeronetsunv3lev2_subset: UngriddedData, tmp_path: Path
+    cache_handler: CacheHandlerUngridded,
+    aeronetsunv3lev2_subset: UngriddedData,
+    tmp_path: Path,
+    file_name: str,
 ):
-    path = tmp_path / "test_manual_caching.pkl"
+    path = tmp_path / file_name
     cache_handler.write(aeronetsunv3lev2_subset, var_or_file_name=path.name, cache_dir=path.parent)
     assert path.exists()
     cache_handler.check_and_load(var_or_file_name=path.name, cache_dir=path.parent)
@@ -48,3 +54,74 @@ def test_reload(
     reloaded = cache_handler.loaded_data["od550aer"]
     assert isinstance(reloaded, UngriddedData)
     assert reloaded.shape == subset.shape
+
+
+def test_reload_mmap(aeronetsunv3lev2_subset: UngriddedData, tmp_path: Path):
+    cache_handler = CacheHandlerUngridded(file_format="mmap")
+    path = tmp_path / "test_mmap.mmap"
+    cache_handler.write(aeronetsunv3lev2_subset, var_or_file_name=path.name, cache_dir=tmp_path)
+    assert path.is_dir()
+    assert cache_handler.check_and_load(var_or_file_name=path.name, cache_dir=tmp_path)
+
+    reloaded = cache_handler.loaded_data[path.name]
+    reloaded._check_index()
+    np.testing.assert_array_equal(reloaded._data, aeronetsunv3lev2_subset._data)
+    for meta_key, var_idx in aeronetsunv3lev2_subset.meta_idx.items():
+        for var, indices in var_idx.items():
+            np.testing.assert_array_equal(reloaded.meta_idx[meta_key][var], indices)
+    assert reloaded.var_idx == aeronetsunv3lev2_subset.var_idx
+
+    # loaded data is copy-on-write, the cache file remains unchanged
+    reloaded._data[:, reloaded._DATAINDEX] = -1
+    assert cache_handler.check_and_load(var_or_file_name=path.name, cache_dir=tmp_path)
+    data = cache_handler.loaded_data[path.name]._data
+    np.testing.assert_array_equal(data, aeronetsunv3lev2_subset._data)
+
+
+def test_load_pkl_fallback(
+    aeronetsunv3lev2_subset: UngriddedData, aeronet_sun_subset_reader: ReadAeronetSunV3
+):
+    cache_handler = CacheHandlerUngridded(aeronet_sun_subset_reader, file_format="pkl")
+    fp = cache_handler.write(aeronetsunv3lev2_subset, var_or_file_name="ang4487aer")
+    assert fp.endswith(".pkl")
+
+    cache_handler = CacheHandlerUngridded(aeronet_sun_subset_reader, file_format="mmap")
+    assert not Path(cache_handler.file_path("ang4487aer")).exists()
+    assert cache_handler.check_and_load(var_or_file_name="ang4487aer")
+    assert "ang4487aer" in cache_handler.loaded_data
+
+
+def test_invalid_file_format():
+    with pytest.raises(ValueError):
+        CacheHandlerUngridded(file_format="zarr")
+
+
+def test_incremental_update(aeronet_sun_subset_reader: ReadAeronetSunV3, tmp_path: Path):
+    data_dir = tmp_path / "data"
+    shutil.copytree(aeronet_sun_subset_reader.data_dir, data_dir)
+    reader = ReadAeronetSunV3(aeronet_sun_subset_reader.data_id, data_dir=str(data_dir))
+    files = reader.get_source_files(["od550aer"])
+    assert len(files) > 2
+
+    # cache data from all but the first file
+    added = Path(files[0])
+    added.rename(tmp_path / added.name)
+    cache_handler = CacheHandlerUngridded(reader, cache_dir=tmp_path, incremental=True)
+    assert cache_handler.incremental_active
+    source_files = cache_handler.source_file_info(files[1:])
+    cache_handler.write(
+        reader.read("od550aer", files=files[1:]), "od550aer", source_files=source_files
+    )
+
+    # add first file, remove second one
+    (tmp_path / added.name).rename(added)
+    Path(files[1]).unlink()
+
+    cache_handler = CacheHandlerUngridded(reader, cache_dir=tmp_path, incremental=True)
+    assert cache_handler.check_and_load("od550aer")
+    updated = cache_handler.loaded_data["od550aer"]
+    updated._check_index()
+
+    expected = reader.read("od550aer", files=reader.get_source_files(["od550aer"]))
+    assert updated.shape == expected.shape
+    assert sorted(updated.unique_station_names) == sorted(expected.unique_station_names)
@@ -1,7 +1,10 @@
+from __future__ import annotations
+
 import numpy as np
 import pytest
 
 from pyaerocom.io.ebas_nasa_ames import EbasColDef, EbasFlagCol, EbasNasaAmesFile, NasaAmesHeader
+from tests.fixtures.ebas import EBAS_FILEDIR, EBAS_FILES
 from tests.fixtures.ebas import loaded_nasa_ames_example as filedata
 
 
@@ -34,6 +37,24 @@ def test_EbasFlagCol_decoded(raw_data, decoded):
     assert (dc == decoded).all()
 
 
+def test_EbasFlagCol_decode_repetitive():
+    raw_data = np.tile([0, 0.456, 0.1004560, np.nan, 0.247999], 1000)
+    fc = EbasFlagCol(raw_data)
+    assert fc.decoded.shape == (5000, 3)
+    assert (fc.decoded[3::5] == 0).all()
+    assert (fc.decoded[4::5] == [247, 999, 0]).all()
+    assert (fc.valid == np.tile([True, False, True, True, False], 1000)).all()
+
+
+def test_EbasFlagCol__invalid_flags_lut():
+    lut = EbasFlagCol(np.asarray([0]))._invalid_flags_lut()
+    assert lut.shape == (1000,)
+    assert not lut[0]
+    assert not lut[100]
+    assert lut[456]
+    assert lut[999]
+
+
 def test_NasaAmesHeader_NUM_FIXLINES(head):
     assert head._NUM_FIXLINES == 13
 
@@ -150,3 +171,34 @@ def test_EbasColDef_get_wavelength_nm_error(filedata):
     with pytest.raises(KeyError) as e:
         filedata.var_defs[0].get_wavelength_nm()
     assert str(e.value) == "'Column variable starttime does not contain wavelength information'"
+
+
+def _data_block_lines(filedata: EbasNasaAmesFile) -> list[str]:
+    with open(filedata.file) as f:
+        return f.readlines()[filedata.num_head_lines :]
+
+
+def test_EbasNasaAmesFile__read_data_block(filedata: EbasNasaAmesFile):
+    lines = _data_block_lines(filedata)
+    data = filedata._read_data_block(lines)
+    assert data.shape == (8760, 24)
+    np.testing.assert_array_equal(data, filedata._read_data_block_lines(lines))
+
+
+def test_EbasNasaAmesFile__read_data_block_malformed(filedata: EbasNasaAmesFile, caplog):
+    lines = _data_block_lines(filedata)
+    lines[3] = lines[3].replace(" ", " bla ", 1)
+    data = filedata._read_data_block(lines)
+    assert data.shape == (8759, 24)
+    assert "Failed to read data row 3" in caplog.text
+
+
+@pytest.mark.parametrize("var_name", ["sc550dryaer", "conco3"])
+def test_EbasNasaAmesFile__read_data_block_files(var_name: str):
+    """bulk and line-by-line parsing of data block of bundled test files are equal"""
+    for files in EBAS_FILES[var_name].values():
+        filedata = EbasNasaAmesFile(EBAS_FILEDIR / files[0], only_head=True)
+        lines = _data_block_lines(filedata)
+        np.testing.assert_array_equal(
+            filedata._read_data_block(lines), filedata._read_data_block_lines(lines)
+        )
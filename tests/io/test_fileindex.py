@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pyaerocom import const
+from pyaerocom.io.fileindex import DirectoryIndex
+
+
+def _set_old_mtime(path: Path, age: float = 60):
+    mtime = path.stat().st_mtime - age
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def index(tmp_path: Path, monkeypatch) -> DirectoryIndex:
+    monkeypatch.setattr(const, "_caching_active", True)
+    return DirectoryIndex("test", index_dir=str(tmp_path / "index"))
+
+
+def test_DirectoryIndex(tmp_path: Path, index: DirectoryIndex):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    _set_old_mtime(data_dir)
+
+    assert index.get(str(data_dir), "key") is None
+    assert index.put(str(data_dir), "key", [1, 2])
+    assert index.put(str(data_dir), ("other", 1), {"a": 1})
+    assert index.get(str(data_dir), "key") == [1, 2]
+    assert index.get(str(data_dir), ("other", 1)) == {"a": 1}
+    assert index.get(str(data_dir), "unknown") is None
+    # index of other directory with same name is not affected
+    assert DirectoryIndex("test2", index.index_dir).get(str(data_dir), "key") is None
+
+    # modifying the directory invalidates the index
+    (data_dir / "new_file.nc").write_text("")
+    assert index.get(str(data_dir), "key") is None
+    # entries of recently modified directories are not stored
+    assert not index.put(str(data_dir), "key", [1, 2, 3])
+    _set_old_mtime(data_dir)
+    assert index.put(str(data_dir), "key", [1, 2, 3])
+    assert index.get(str(data_dir), "key") == [1, 2, 3]
+    assert index.get(str(data_dir), ("other", 1)) is None
+
+    index.clear()
+    assert index.get(str(data_dir), "key") is None
+
+
+def test_DirectoryIndex_disabled(tmp_path: Path, index: DirectoryIndex, monkeypatch):
+    _set_old_mtime(tmp_path)
+    monkeypatch.setattr(const, "_caching_active", False)
+    assert not index.enabled
+    assert not index.put(str(tmp_path), "key", 1)
+    assert index.get(str(tmp_path), "key") is None
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import time
 from pathlib import Path
 from typing import Type
 
 import numpy as np
 import pytest
-from iris import load
+from iris import load, save
 from iris.cube import Cube, CubeList
 from iris.exceptions import TranslationError
 
@@ -271,6 +272,43 @@ def test_load_cubes_custom(file_paths: list[Path], num_loaded: int):
     assert all(len(res) == num_loaded for res in result)
 
 
+@pytest.mark.parametrize("perform_fmt_checks", [False, True])
+@pytest.mark.parametrize("num_threads", [1, 3])
+def test_load_cubes_custom_threads(
+    tmp_path: Path, monkeypatch, num_threads: int, perform_fmt_checks: bool
+):
+    files = []
+    for year in range(2010, 2015):
+        # full years, so that the time dimension passes the format checks
+        daynum = 366 if year % 4 == 0 else 365
+        cube = make_dummy_cube_3D_daily(year=year, daynum=daynum, value=year)
+        cube.var_name = "od550aer"
+        path = tmp_path / f"aerocom3_TEST_od550aer_Column_{year}_daily.nc"
+        save(cube, str(path))
+        files.append(path)
+    files.insert(2, tmp_path / "missing.nc")
+
+    # netCDF files must not be opened concurrently
+    active, max_active = [], []
+
+    def load_checked(*args, **kwargs):
+        active.append(1)
+        max_active.append(len(active))
+        try:
+            time.sleep(0.01)
+            return load(*args, **kwargs)
+        finally:
+            active.pop()
+
+    monkeypatch.setattr(iris_io.iris, "load", load_checked)
+    cubes, loaded = iris_io.load_cubes_custom(
+        files, "od550aer", perform_fmt_checks=perform_fmt_checks, num_threads=num_threads
+    )
+    assert max(max_active) == 1
+    assert loaded == files[:2] + files[3:]
+    assert [float(cube.data.mean()) for cube in cubes] == list(range(2010, 2015))
+
+
 @pytest.mark.parametrize("defect", ["only_longname_dims"])
 def test_check_dim_coord_names_cube(cube: Cube):
     iris_io.check_dim_coord_names_cube(cube)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+from pyaerocom.exceptions import DataDimensionError
+from pyaerocom.io.point_extraction import (
+    convert_points_unit,
+    extract_points,
+    finalise_points,
+    find_latlon_dims,
+    get_nearest_grid_indices,
+)
+
+
+@pytest.fixture
+def grid() -> xr.DataArray:
+    time = pd.date_range("2010-01-01", periods=4, freq="D")
+    lats = np.arange(60, 30, -10.0)
+    lons = np.arange(-20, 40, 10.0)
+    data = np.arange(4 * len(lats) * len(lons), dtype=float).reshape(4, len(lats), len(lons))
+    return xr.DataArray(
+        data,
+        coords=dict(time=time, latitude=lats, longitude=lons),
+        dims=("time", "latitude", "longitude"),
+        attrs=dict(units="ug m-3"),
+    )
+
+
+@pytest.mark.parametrize(
+    "grid_lons,longitude,lon_idx,in_domain",
+    [
+        (np.arange(-175, 180, 10.0), [-179, 179, 5.1, 185], [0, 35, 18, 0], [1, 1, 1, 1]),
+        (np.arange(5, 360, 10.0), [-179, 359, 0.1, 185], [18, 35, 0, 18], [1, 1, 1, 1]),
+        (np.arange(-20, 40, 10.0), [-24, -26, 31, 350], [0, 0, 5, 1], [1, 0, 1, 1]),
+        (np.arange(200, 300, 10.0), [-150, -100, 100], [1, 6, 0], [1, 1, 0]),
+    ],
+)
+def test_get_nearest_grid_indices(grid_lons, longitude, lon_idx, in_domain):
+    latitude = np.zeros(len(longitude))
+    lat_idx, idx, mask = get_nearest_grid_indices([-10, 0, 10], grid_lons, latitude, longitude)
+    assert list(lat_idx) == [1] * len(longitude)
+    assert list(idx) == lon_idx
+    assert list(mask) == [bool(x) for x in in_domain]
+
+
+def test_get_nearest_grid_indices_lat():
+    lat_idx, _, mask = get_nearest_grid_indices([60, 50, 40], [0], [61, 44, 65.1, 34.9], [0] * 4)
+    assert list(lat_idx) == [0, 2, 0, 2]
+    assert list(mask) == [True, True, False, False]
+
+
+def test_get_nearest_grid_indices_error():
+    with pytest.raises(ValueError) as e:
+        get_nearest_grid_indices([0], [0], [1, 2], [1])
+    assert str(e.value) == "latitude and longitude need to be 1D arrays of the same length"
+
+
+def test_find_latlon_dims(grid: xr.DataArray):
+    assert find_latlon_dims(grid) == ("latitude", "longitude")
+    with pytest.raises(DataDimensionError):
+        find_latlon_dims(grid.isel(latitude=0))
+
+
+def test_extract_points(grid: xr.DataArray):
+    lat_idx, lon_idx = [2, 0, 1], [1, 4, 1]
+    points = extract_points(grid.chunk(time=2), lat_idx, lon_idx, "latitude", "longitude")
+    assert points.dims == ("time", "station")
+    assert list(points.grid_latitude.values) == [40, 60, 50]
+    assert list(points.grid_longitude.values) == [-10, 20, -10]
+    expected = [grid.values[:, i, j] for i, j in zip(lat_idx, lon_idx)]
+    np.testing.assert_array_equal(points.values, np.array(expected).T)
+
+
+def test_convert_points_unit(grid: xr.DataArray):
+    arr = convert_points_unit(grid.copy(), "concpm10")
+    assert arr.attrs["units"] == "ug m-3"
+    np.testing.assert_array_equal(arr.values, grid.values)
+
+    arr = convert_points_unit(grid.assign_attrs(units="mg m-3"), "concpm10")
+    assert arr.attrs["units"] == "ug m-3"
+    np.testing.assert_allclose(arr.values, grid.values * 1000)
+
+    arr = convert_points_unit(grid.assign_attrs(units="m"), "concpm10")
+    assert arr.attrs["units"] == "m"
+
+
+def test_finalise_points(grid: xr.DataArray):
+    points = extract_points(grid, [0, 1], [0, 1], "latitude", "longitude")
+    arr = finalise_points(
+        points.transpose(),
+        "concpm10",
+        [61, 48],
+        [-21, -8],
+        np.array([False, True]),
+        ts_type="daily",
+    )
+    assert arr.dims == ("time", "station")
+    assert arr.name == arr.attrs["var_name"] == "concpm10"
+    assert arr.attrs["ts_type"] == "daily"
+    assert list(arr.latitude.values) == [61, 48]
+    assert np.isnan(arr.values[:, 0]).all()
+    np.testing.assert_array_equal(arr.values[:, 1], grid.values[:, 1, 1])
@@ -26,7 +26,7 @@ def test__FILEMASK(reader: ReadAirNow):
 
 
 def test__version__(reader: ReadAirNow):
-    assert reader.__version__ == "0.07"
+    assert reader.__version__ == "0.08"
 
 
 def test_FILE_COL_DELIM(reader: ReadAirNow):
@@ -153,6 +153,14 @@ def test__date_time_str_to_datetime64(reader: ReadAirNow):
     assert str(dt) == "2020-10-23T13:55:00"
 
 
+def test__date_time_arrays_to_datetime64(reader: ReadAirNow):
+    dates = np.array(["10/23/20", "12/31/19", "10/23/20", "02/29/20"], dtype=object)
+    times = np.array(["13:55", "23:00", "00:05", "13:55"], dtype=object)
+    dt = reader._date_time_arrays_to_datetime64(dates, times)
+    assert dt.dtype == "datetime64[s]"
+    np.testing.assert_array_equal(dt, reader.make_datetime64_array(dates, times))
+
+
 @pytest.mark.parametrize(
     "filename,timestamp",
     [
@@ -360,6 +368,40 @@ def test__read_files_single_var(
     assert list(first_stat[var_name]) == first_vals
 
 
+def test__read_files_num_workers(reader: ReadAirNow):
+    files = reader.get_file_list()
+    stats = reader._read_files(files, ["concpm25", "vmro3"])
+    reader.num_workers = 3
+    try:
+        stats_threads = reader._read_files(files, ["concpm25", "vmro3"])
+    finally:
+        reader.num_workers = None
+    assert len(stats_threads) == len(stats)
+    for stat, stat_threads in zip(stats, stats_threads):
+        assert stat.station_id == stat_threads.station_id
+        np.testing.assert_array_equal(stat.dtime, stat_threads.dtime)
+
+
+def test__filedata_to_statlist_missing_unit(reader: ReadAirNow):
+    station_ids = list(reader.station_metadata)[:2]
+    data = pd.DataFrame(
+        dict(
+            date=["01/01/20", "01/01/20"],
+            time=["00:00", "00:00"],
+            station_id=station_ids,
+            time_zone=[0, 0],
+            variable=["PM2.5", "PM2.5"],
+            unit=["UG/M3", np.nan],
+            value=[1.0, 2.0],
+        )
+    )
+    stats = reader._filedata_to_statlist([data.iloc[:1]], ["concpm25"])
+    assert stats[0]["var_info"]["concpm25"]["units"] == "ug m-3"
+    # missing unit of 2nd station is not mistaken for the unit of the 1st one
+    with pytest.raises(AssertionError):
+        reader._filedata_to_statlist([data], ["concpm25"])
+
+
 def test__read_files_single_var_error(reader: ReadAirNow):
 
     files = reader.get_file_list()
@@ -635,3 +635,22 @@ def test_read_error(reader: ReadEbas, ebas_files: list[Path]):
     with pytest.raises(DataCoverageError) as e:
         reader.read("ac550aer", files=ebas_files)
     assert str(e.value) == "UngriddedData object appears to be empty"
+
+
+@pytest.mark.parametrize("file_vars", [["conco3", "concpm10"]])
+def test_read_parallel(ebas_files: list[Path]):
+    serial = ReadEbas("EBASSubset")
+    serial.num_workers = 1
+    data = serial.read(["conco3", "concpm10"], files=ebas_files)
+
+    parallel = ReadEbas("EBASSubset")
+    parallel.num_workers = 2
+    data_parallel = parallel.read(["conco3", "concpm10"], files=ebas_files)
+
+    assert parallel.files_failed == serial.files_failed
+    assert data_parallel.var_idx == data.var_idx
+    assert list(data_parallel.metadata) == list(data.metadata)
+    np.testing.assert_array_equal(data_parallel._data, data._data)
+    for meta_key, var_idx in data.meta_idx.items():
+        for var, indices in var_idx.items():
+            np.testing.assert_array_equal(data_parallel.meta_idx[meta_key][var], indices)
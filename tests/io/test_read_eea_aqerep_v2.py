@@ -1,5 +1,11 @@
+import gzip
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
 import pytest
 
+from pyaerocom.exceptions import EEAv2FileError
 from pyaerocom.io import ReadEEAAQEREP_V2
 from pyaerocom.stationdata import StationData
 from pyaerocom.ungriddeddata import UngriddedData
@@ -61,3 +67,74 @@ def test_read(reader):
             assert stat_data[var_name].mean() == pytest.approx(
                 station_means[var_name][stat_idx], TEST_RTOL
             )
+
+
+HEADER = (
+    "Countrycode,Namespace,AirQualityNetwork,AirQualityStation,AirQualityStationEoICode,"
+    "SamplingPoint,SamplingProcess,Sample,AirPollutant,AirPollutantCode,AveragingTime,"
+    "Concentration,UnitOfMeasurement,DatetimeBegin,DatetimeEnd,Validity,Verification"
+)
+
+
+def _data_line(start: str, value: str, validity: int = 1) -> str:
+    start = pd.Timestamp(start)
+    stop = start + pd.Timedelta("1h")
+    return (
+        "AT,AT.0008.20.AQ,NET.01,STA.01,AT10002,SPO.01,SPP.01,SAM.01,PM10,"
+        "http://dd.eionet.europa.eu/vocabulary/aq/pollutant/5,hour,"
+        f"{value},µg/m3,{start:%Y-%m-%d %H:%M:%S} +01:00,{stop:%Y-%m-%d %H:%M:%S} +01:00,"
+        f"{validity},1"
+    )
+
+
+@pytest.fixture
+def data_file(tmp_path: Path) -> Path:
+    # time steps are not ordered and the last line is not complete
+    lines = [
+        HEADER,
+        _data_line("2020-01-01 02:00", "3.5", validity=-1),
+        _data_line("2020-01-01 00:00", "1.5"),
+        _data_line("2020-01-01 01:00", "2.5"),
+        "AT,AT.0008.20.AQ,NET.01,STA.01,AT10002",
+    ]
+    path = tmp_path / "AT_5_01_2020_timeseries.csv.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as file:
+        file.write("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.mark.parametrize(
+    "time,expected",
+    [
+        ("2020-01-04 00:00:00 +01:00", "2020-01-03T23:00:00"),
+        ("2020-06-01 00:00:00 -03:30", "2020-06-01T03:30:00"),
+        ("2020-13-01 00:00:00 +01:00", "NaT"),
+        ("", "NaT"),
+    ],
+)
+def test__parse_times(time: str, expected: str):
+    result = ReadEEAAQEREP_V2._parse_times(np.asarray([time]))
+    assert result[0] == np.datetime64(expected, "s") or (expected == "NaT" and np.isnat(result[0]))
+
+
+def test_read_file(tmp_path: Path, data_file: Path):
+    reader = ReadEEAAQEREP_V2(data_dir=str(tmp_path))
+    data = reader.read_file(str(data_file), "concpm10")
+    assert data["station_id"] == "STA.01"
+    assert data["ts_type"] == "hourly"
+    assert data["var_info"]["concpm10"]["units"] == "ug m-3"
+    # all columns are sorted by time and time is at the middle of the interval
+    np.testing.assert_array_equal(data["concpm10"], [1.5, 2.5, 3.5])
+    np.testing.assert_array_equal(data["validity"], [1, 1, -1])
+    np.testing.assert_array_equal(
+        data["dtime"],
+        np.array(["2019-12-31T23:30", "2020-01-01T00:30", "2020-01-01T01:30"], "datetime64[s]"),
+    )
+
+
+def test_read_file_error(tmp_path: Path):
+    path = tmp_path / "AT_5_01_2020_timeseries.csv.gz"
+    path.write_text("not compressed")
+    reader = ReadEEAAQEREP_V2(data_dir=str(tmp_path))
+    with pytest.raises(EEAv2FileError):
+        reader.read_file(str(path), "concpm10")
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import pytest
+import xarray as xr
 
-from pyaerocom import GriddedData
+from pyaerocom import GriddedData, const
 from pyaerocom.exceptions import VarNotAvailableError
+from pyaerocom.io import readgridded
+from pyaerocom.io.fileindex import DirectoryIndex
 from pyaerocom.io.readgridded import ReadGridded
 from tests.conftest import TEST_RTOL, lustre_unavail
 from tests.fixtures.tm5 import TM5_DATA_PATH
@@ -239,3 +243,74 @@ def test_read_vars(reader_reanalysis: ReadGridded):
 def test_read_climatology_file(reader_tm5: ReadGridded):
     data = reader_tm5.read_var("abs550aer", start=9999)
     assert isinstance(data, GriddedData)
+
+
+def test_search_all_files_index(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(const, "_caching_active", True)
+    monkeypatch.setattr(
+        readgridded, "_FILEINFO_INDEX", DirectoryIndex("test", str(tmp_path / "index"))
+    )
+    data_dir = tmp_path / "MODEL"
+    data_dir.mkdir()
+    for year in (2010, 2011):
+        for var in ("od550aer", "ec550dryaer"):
+            (data_dir / f"aerocom3_MODEL_{var}_Column_{year}_monthly.nc").write_bytes(b"")
+    mtime = data_dir.stat().st_mtime - 60
+    os.utime(data_dir, (mtime, mtime))
+
+    reader = ReadGridded(data_dir=str(data_dir))
+    assert reader.data_id == "MODEL"
+
+    def fail(*args, **kwargs):
+        raise AssertionError("data directory should not be searched")
+
+    monkeypatch.setattr(readgridded, "glob", fail)
+    indexed = ReadGridded(data_dir=str(data_dir))
+    assert indexed.data_id == "MODEL"
+    assert indexed.vars_filename == reader.vars_filename == ["ec550dryaer", "od550aer"]
+    pd.testing.assert_frame_equal(indexed.file_info, reader.file_info)
+
+
+def test_read_var_at_points(tmp_path: Path):
+    data_dir = tmp_path / "MODEL"
+    data_dir.mkdir()
+    rng = np.random.default_rng(42)
+    lats = np.arange(-88.5, 90, 3.0)
+    lons = np.arange(1, 360, 2.0)
+    for year in (2010, 2011):
+        time = pd.date_range(f"{year}-01-01", f"{year}-12-31", freq="D")
+        arr = xr.DataArray(
+            rng.random((len(time), len(lats), len(lons))) * 1e-9,
+            coords=dict(time=time, lat=lats, lon=lons),
+            dims=("time", "lat", "lon"),
+            name="concpm10",
+            attrs=dict(units="kg m-3"),
+        )
+        arr.lat.attrs.update(standard_name="latitude", units="degrees_north")
+        arr.lon.attrs.update(standard_name="longitude", units="degrees_east")
+        arr.to_netcdf(data_dir / f"aerocom3_MODEL_concpm10_Surface_{year}_daily.nc")
+
+    lat, lon = [10.2, -60, 89.9, 45], [-170.4, 0.1, 359.5, 7.3]
+    reader = ReadGridded(data_dir=str(data_dir))
+    points = reader.read_var_at_points("concpm10", lat, lon, start=2010, stop=2012)
+    assert points.dims == ("time", "station")
+    assert points.shape == (730, 4)
+    assert points.attrs["units"] == "ug m-3"
+    assert points.attrs["ts_type"] == "daily"
+
+    data = reader.read_var("concpm10", start=2010, stop=2012)
+    # to_time_series ignores coordinates beyond the outermost cell centres
+    expected = data.to_time_series(latitude=lat, longitude=lon)
+    assert len(expected) == 3
+    for i, stat in zip([0, 1, 3], expected):
+        np.testing.assert_allclose(points.values[:, i], stat.concpm10.values)
+        np.testing.assert_array_equal(points.time.values, stat.concpm10.index.values)
+    assert points.grid_latitude.values[2] == 88.5
+    assert np.isfinite(points.values[:, 2]).all()
+
+    points = reader.read_var_at_points("concpm10", lat, lon, start=2011, try_convert_units=False)
+    assert points.shape == (365, 4)
+    assert points.attrs["units"] == "kg m-3"
+
+    with pytest.raises(VarNotAvailableError):
+        reader.read_var_at_points("od550aer", lat, lon)
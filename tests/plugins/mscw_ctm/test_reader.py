@@ -5,12 +5,14 @@ from pathlib import Path
 from typing import Type
 
 import cf_units
+import numpy as np
 import pytest
 import xarray as xr
 
 import pyaerocom.exceptions as exc
 from pyaerocom import get_variable
 from pyaerocom.griddeddata import GriddedData
+from pyaerocom.helpers import extract_latlon_dataarray
 from pyaerocom.plugins.mscw_ctm.reader import ReadEMEP, ReadMscwCtm
 from tests.conftest import TEST_RTOL
 from tests.fixtures.mscw_ctm import create_fake_MSCWCtm_data
@@ -606,6 +608,27 @@ def test_read_emep_year_defined_twice(tmp_path: Path):
     assert "is already found:" in str(e.value)
 
 
+def test_read_emep_time_chunks(tmp_path: Path):
+    data_path = emep_data_path(tmp_path, "hour", vars_and_units={"concpm10": "ug m-3"})
+    reader = ReadMscwCtm(data_dir=str(data_path / "2017"), time_chunks=100)
+    data = reader.read_var("concpm10", ts_type="hourly")
+    assert data.cube.has_lazy_data()
+    assert data.cube.lazy_data().chunks[0][:2] == (100, 100)
+
+    data = reader.read_var("concpm10", ts_type="hourly", time_chunks=500)
+    assert reader.time_chunks == 500
+    assert data.cube.lazy_data().chunks[0][0] == 500
+    assert data.cube.has_lazy_data()
+    assert data.cube.data.mean() == pytest.approx(1)
+
+
+@pytest.mark.parametrize("time_chunks", [0, 1.5, "100"])
+def test_ReadMscwCtm_time_chunks_error(time_chunks):
+    with pytest.raises(ValueError) as e:
+        ReadMscwCtm(time_chunks=time_chunks)
+    assert str(e.value).startswith("time_chunks needs to be a positive integer or None")
+
+
 @pytest.mark.parametrize(
     "year,freq,num",
     [
@@ -674,3 +697,31 @@ def test_ts_types(data_path: Path, year: str, freq: list[str]):
     reader.data_dir = str(data_path / year)
     ts_types = reader.ts_types
     assert len(ts_types) == len(freq)
+
+
+def test_ReadMscwCtm_read_var_at_points(tmp_path: Path):
+    reader = ReadMscwCtm()
+    arr = create_fake_MSCWCtm_data(year="2017", tst="daily")
+    arr.values = np.random.default_rng(42).random(arr.shape)
+    ds = xr.Dataset()
+    for var_name, fac in [("concno3c", 1), ("concno3f", 2)]:
+        ds[reader.var_map[var_name]] = arr * fac
+        ds[reader.var_map[var_name]].attrs.update(units="ug m-3")
+    path = tmp_path / "emep" / "2017" / "Base_day.nc"
+    path.parent.mkdir(parents=True)
+    ds.to_netcdf(path)
+
+    # last station is outside of the model domain
+    lats, lons = [40, 55.3, 81.9, 10], [-20, 10, 89, 0]
+    reader = ReadMscwCtm(data_dir=str(path.parent))
+    points = reader.read_var_at_points("concno3", lats, lons, ts_type="daily")
+    assert points.dims == ("time", "station")
+    assert points.shape == (365, 4)
+    assert points.attrs["units"] == "ug m-3"
+    assert points.attrs["ts_type"] == "daily"
+    assert list(points.latitude.values) == lats
+
+    full = reader.read_var("concno3", ts_type="daily")
+    expected = extract_latlon_dataarray(full.to_xarray(), lats[:3], lons[:3], check_domain=False)
+    np.testing.assert_allclose(points.values[:, :3], expected.values)
+    assert np.isnan(points.values[:, 3]).all()
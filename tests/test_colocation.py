@@ -4,9 +4,10 @@ import pandas as pd
 import pytest
 from cf_units import Unit
 
-from pyaerocom import GriddedData, const, helpers
+from pyaerocom import GriddedData, UngriddedData, colocation, const, helpers
 from pyaerocom.colocateddata import ColocatedData
 from pyaerocom.colocation import (
+    _batched_colocation_possible,
     _colocate_site_data_helper,
     _colocate_site_data_helper_timecol,
     _regrid_gridded,
@@ -252,6 +253,112 @@ def test_colocate_gridded_gridded_same(data_tm5):
     assert stats["R_spearman"] == 1
 
 
+@pytest.mark.parametrize(
+    "colocate_time,use_climatology_ref,resample_how,result",
+    [
+        (False, False, None, True),
+        (False, False, "mean", True),
+        (False, False, {"monthly": {"daily": "max"}}, True),
+        (True, False, None, False),
+        (False, True, None, False),
+        (False, False, "blaa", False),
+        (False, False, {"monthly": "max"}, False),
+    ],
+)
+def test__batched_colocation_possible(
+    fake_gridded_daily, colocate_time, use_climatology_ref, resample_how, result
+):
+    possible = _batched_colocation_possible(
+        fake_gridded_daily, colocate_time, use_climatology_ref, resample_how
+    )
+    assert possible == result
+
+
+@pytest.fixture(scope="module")
+def fake_gridded_daily() -> GriddedData:
+    rng = np.random.default_rng(42)
+    lats = np.arange(-87.5, 90, 5.0)
+    lons = np.arange(-177.5, 180, 5.0)
+    values = rng.random((365, len(lats), len(lons)))
+    cube = iris.cube.Cube(values, var_name="concpm10", units="ug m-3")
+    cube.add_dim_coord(
+        iris.coords.DimCoord(
+            np.arange(365),
+            var_name="time",
+            standard_name="time",
+            units=Unit("days since 2010-01-01 00:00", calendar="gregorian"),
+        ),
+        0,
+    )
+    cube.add_dim_coord(
+        iris.coords.DimCoord(lats, var_name="lat", standard_name="latitude", units="degrees"),
+        1,
+    )
+    cube.add_dim_coord(
+        iris.coords.DimCoord(lons, var_name="lon", standard_name="longitude", units="degrees"),
+        2,
+    )
+    cube.attributes["ts_type"] = "daily"
+    data = GriddedData(cube)
+    data.metadata["data_id"] = "fakemodel"
+    return data
+
+
+@pytest.fixture(scope="module")
+def fake_ungridded_mixed() -> UngriddedData:
+    rng = np.random.default_rng(42)
+    setups = [
+        ("2010-01-01", "2010-12-31 23:00", "h", "hourly"),
+        ("2010-02-03", "2010-11-20", "d", "daily"),
+        ("2010-03-01 05:00", "2010-06-30", "h", "hourly"),
+        ("2009-12-01", "2011-02-01", "d", "daily"),
+    ]
+    stats = []
+    for i in range(12):
+        start, stop, freq, ts_type = setups[i % 4]
+        meta = {
+            "station_name": f"station{i}",
+            "latitude": rng.uniform(-80, 80),
+            "longitude": rng.uniform(-170, 170),
+            "altitude": 0.0,
+            "data_id": "fakeobs",
+            "ts_type": ts_type,
+        }
+        stat = create_fake_station_data(
+            "concpm10", {"concpm10": {"units": "ug m-3"}}, 1, start, stop, freq, meta
+        )
+        vals = rng.random(len(stat["dtime"])) * 10
+        vals[rng.random(len(vals)) < 0.3] = np.nan
+        stat["concpm10"] = vals
+        stats.append(stat)
+    return UngriddedData.from_station_data(stats)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(ts_type="daily"),
+        dict(ts_type="monthly"),
+        dict(ts_type="monthly", resample_how="sum"),
+        dict(ts_type="monthly", min_num_obs={"monthly": {"daily": 20}, "daily": {"hourly": 12}}),
+        dict(ts_type="daily", min_num_obs=3, harmonise_units=True),
+        dict(ts_type="yearly"),
+    ],
+)
+@pytest.mark.filterwarnings("ignore:.*the `loffset` parameter:FutureWarning")
+def test_colocate_gridded_ungridded_batched(
+    monkeypatch, fake_gridded_daily, fake_ungridded_mixed, kwargs
+):
+    batched = colocate_gridded_ungridded(fake_gridded_daily, fake_ungridded_mixed, **kwargs)
+    monkeypatch.setattr(colocation, "_batched_colocation_possible", lambda *args: False)
+    legacy = colocate_gridded_ungridded(fake_gridded_daily, fake_ungridded_mixed, **kwargs)
+
+    assert batched.data.attrs == legacy.data.attrs
+    np.testing.assert_array_equal(batched.data.values, legacy.data.values)
+    for coord in legacy.data.coords:
+        np.testing.assert_array_equal(batched.data[coord].values, legacy.data[coord].values)
+
+
 @pytest.mark.xfail(raises=UnresolvableTimeDefinitionError)
 def test_read_emep_colocate_emep_tm5(data_tm5, path_emep):
     reader = ReadMscwCtm(data_dir=path_emep["data_dir"])
@@ -56,6 +56,7 @@ default_setup = {
     "reanalyse_existing": True,
     "raise_exceptions": False,
     "keep_data": True,
+    "num_workers": 1,
     "add_meta": {},
 }
 
@@ -286,6 +287,38 @@ def test_Colocator_run_gridded_ungridded(
     assert np.nanmean(coldata.data[1].values) == pytest.approx(mean_mod, abs=0.01)
 
 
+def test_Colocator_run_parallel(tm5_aero_stp, tmp_path: Path):
+    stp = ColocationSetup(**tm5_aero_stp)
+    stp.update(
+        model_add_vars={"od550aer": ["abs550aer"]},
+        basedir_coldata=tmp_path,
+        save_coldata=True,
+    )
+    serial = Colocator(**stp)
+    result = serial.run()
+
+    parallel = Colocator(**stp)
+    parallel.num_workers = 2
+    result_parallel = parallel.run()
+
+    assert parallel.files_written == serial.files_written
+    assert parallel.processing_status.equals(serial.processing_status)
+    for mvar, ovar in (("od550aer", "od550aer"), ("abs550aer", "od550aer")):
+        coldata, coldata_parallel = result[mvar][ovar], result_parallel[mvar][ovar]
+        np.testing.assert_array_equal(coldata_parallel.data.values, coldata.data.values)
+
+
+def test_Colocator__get_worker_setup():
+    col = Colocator(model_id="blub", obs_id="bla", num_workers=4)
+    setup = col._get_worker_setup()
+    assert setup["num_workers"] == 1
+    assert setup["model_id"] == "blub"
+    assert not any(key in setup for key in Colocator._WORKER_SETUP_IGNORE)
+
+    col.model_read_aux = {"od550aer": {"vars_required": ["od550aer"], "fun": lambda x: x}}
+    assert col._get_worker_setup() is None
+
+
 @pytest.mark.parametrize(
     "update,error",
     [
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+
+from pyaerocom.columnar_array import ColumnarArray
+
+DTYPES = ["int32", "datetime64[s]", "float32", "float64"]
+OPTIONAL = [3]
+
+
+@pytest.fixture
+def dense() -> np.ndarray:
+    arr = np.full((6, 4), np.nan)
+    arr[:, 0] = [0, 0, 1, 1, 2, 2]
+    arr[:, 1] = np.arange(6) * 3600 + 1.262304e9
+    arr[:, 2] = [0.5, 1.5, 2.5, np.nan, 4.5, 5.5]
+    return arr
+
+
+@pytest.fixture
+def columnar(dense: np.ndarray) -> ColumnarArray:
+    return ColumnarArray.from_array(dense, DTYPES, OPTIONAL)
+
+
+def test_ColumnarArray(columnar: ColumnarArray, dense: np.ndarray):
+    assert columnar.shape == (6, 4)
+    assert len(columnar) == 6
+    assert columnar.allocated == [0, 1, 2]
+    assert columnar.nbytes == 6 * (4 + 8 + 4)
+    np.testing.assert_array_equal(np.asarray(columnar), dense)
+
+
+def test_ColumnarArray_missing():
+    arr = ColumnarArray(3, DTYPES, OPTIONAL)
+    assert np.isnan(np.asarray(arr)).all()
+    assert arr._cols[0].tolist() == [ColumnarArray.MISSING_INT] * 3
+    assert np.isnat(arr._cols[1]).all()
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        (slice(None), 0),
+        (slice(1, 4), 1),
+        (np.array([0, 3, 5]), 2),
+        (np.array([True, False] * 3), 3),
+        ((np.array([1, 2]),), 0),
+        (2, 2),
+        (2, slice(None)),
+        (slice(1, 3), slice(0, 2)),
+        (slice(None), [0, 2]),
+    ],
+)
+def test_ColumnarArray___getitem__(columnar: ColumnarArray, dense: np.ndarray, key):
+    val = columnar[key]
+    np.testing.assert_array_equal(np.asarray(val), dense[key])
+
+
+@pytest.mark.parametrize("key", [slice(2, 5), np.array([5, 0]), (slice(None), slice(None))])
+def test_ColumnarArray___getitem___rows(columnar: ColumnarArray, dense: np.ndarray, key):
+    sub = columnar[key]
+    assert isinstance(sub, ColumnarArray)
+    np.testing.assert_array_equal(np.asarray(sub), dense[key])
+    np.testing.assert_array_equal(sub[:, 2], dense[key][:, 2])
+
+
+@pytest.mark.parametrize(
+    "key,value",
+    [
+        ((slice(None), 0), 3),
+        ((slice(1, 3), 2), [10.0, np.nan]),
+        ((np.array([0, 5]), 1), np.nan),
+        ((2, slice(None)), [7, 1e9, 0.25, 8]),
+        ((slice(0, 2), slice(None)), np.ones((2, 4))),
+        ((slice(0, 2),), np.nan),
+    ],
+)
+def test_ColumnarArray___setitem__(columnar: ColumnarArray, dense: np.ndarray, key, value):
+    columnar[key] = value
+    dense[key] = value
+    np.testing.assert_array_equal(np.asarray(columnar), dense)
+
+
+def test_ColumnarArray___setitem___optional(columnar: ColumnarArray):
+    columnar[:, 3] = np.nan
+    assert columnar._cols[3] is None
+    columnar[1, 3] = 42
+    assert columnar.allocated == [0, 1, 2, 3]
+    assert columnar[1, 3] == 42
+    columnar[:, 3] = np.nan
+    assert columnar._cols[3] is None
+
+
+def test_ColumnarArray___setitem___columnar(columnar: ColumnarArray, dense: np.ndarray):
+    new = ColumnarArray(8, DTYPES, OPTIONAL)
+    new[2:5] = columnar[[0, 1, 4]]
+    np.testing.assert_array_equal(np.asarray(new)[2:5], dense[[0, 1, 4]])
+    assert np.isnan(np.asarray(new)[[0, 1, 5, 6, 7]]).all()
+
+
+def test_ColumnarArray_concatenate(columnar: ColumnarArray, dense: np.ndarray):
+    other = dense.copy()
+    other[:, 3] = 1
+    arr = ColumnarArray.concatenate([columnar, other])
+    assert arr.shape == (12, 4)
+    assert arr.dtypes == columnar.dtypes
+    np.testing.assert_array_equal(np.asarray(arr), np.vstack([dense, other]))
+
+
+def test_ColumnarArray_append_rows(columnar: ColumnarArray, dense: np.ndarray):
+    columnar.append_rows(3)
+    assert columnar.shape == (9, 4)
+    np.testing.assert_array_equal(np.asarray(columnar)[:6], dense)
+    assert np.isnan(np.asarray(columnar)[6:]).all()
+
+
+def test_ColumnarArray_copy_pickle(columnar: ColumnarArray, dense: np.ndarray):
+    for new in (columnar.copy(), pickle.loads(pickle.dumps(columnar))):
+        new[:, 2] = 0
+        np.testing.assert_array_equal(np.asarray(new)[:, :2], dense[:, :2])
+    np.testing.assert_array_equal(np.asarray(columnar), dense)
+
+
+def test_ColumnarArray_from_array_error():
+    with pytest.raises(ValueError):
+        ColumnarArray.from_array(np.ones((2, 3)), DTYPES)
@@ -92,6 +92,19 @@ def test_Config___init___error(config_file: str, exception: Type[Exception], err
     assert str(e.value) == error
 
 
+def test_Config_deferred_environment():
+    cfg = testmod.Config()
+    assert cfg._env_pending
+    assert "_search_dirs" not in cfg.__dict__
+    assert isinstance(cfg.DATA_SEARCH_DIRS, list)
+    assert not cfg._env_pending
+
+    cfg = testmod.Config()
+    cfg.WRITE_FILEIO_ERR_LOG = False
+    assert not cfg._env_pending
+    assert not cfg.WRITE_FILEIO_ERR_LOG
+
+
 def test_Config__infer_config_from_basedir(local_db: Path):
     cfg = testmod.Config(try_infer_environment=False)
     res = cfg._infer_config_from_basedir(local_db)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from pathlib import Path
 
+import dask.array as da
 import iris
 import numpy as np
 import pytest
@@ -22,6 +23,8 @@ from pyaerocom.exceptions import (
 from pyaerocom.io import ReadGridded
 from tests.conftest import TEST_RTOL, need_iris_32
 
+TIME_UNIT = "days since 2010-01-01"
+
 TESTLATS = [-10, 20]
 TESTLONS = [-120, 69]
 
@@ -431,6 +434,25 @@ def test_remove_outliers(data_tm5: GriddedData):
     assert new.metadata["outliers_removed"]
 
 
+def test_remove_outliers_lazy():
+    values = np.arange(24, dtype=float).reshape(2, 3, 4)
+    cube = Cube(da.from_array(values, chunks=(1, 3, 4)), var_name="od550aer", units="1")
+    cube.add_dim_coord(iris.coords.DimCoord([0, 1], standard_name="time", units=TIME_UNIT), 0)
+    cube.add_dim_coord(
+        iris.coords.DimCoord([0, 1, 2], standard_name="latitude", units="degrees"), 1
+    )
+    cube.add_dim_coord(
+        iris.coords.DimCoord([0, 1, 2, 3], standard_name="longitude", units="degrees"), 2
+    )
+    data = GriddedData(cube, check_unit=False)
+    new = data.remove_outliers(low=2, high=20, inplace=False)
+    assert new.metadata["outliers_removed"]
+    assert new.cube.has_lazy_data()
+    result = new.cube.data
+    assert result.mask.sum() == 2 + 3
+    assert result.min() == 2 and result.max() == 20
+
+
 def test__resample_time_iris(data_tm5: GriddedData):
     data = data_tm5.copy()
     new = data._resample_time_iris("yearly")
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import pyaerocom
+
+#: modules that must not be loaded by `import pyaerocom`
+HEAVY_MODULES = (
+    "iris",
+    "matplotlib",
+    "cartopy",
+    "xarray",
+    "pyaerocom.config",
+    "pyaerocom.io",
+    "pyaerocom.plot",
+    "pyaerocom.aeroval",
+    "pyaerocom.griddeddata",
+)
+
+#: upper limit of import time in seconds (full import takes several seconds)
+MAX_IMPORT_TIME = 1.0
+
+
+def run_python(code: str) -> str:
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+def test_import_lazy():
+    code = "import json, sys, pyaerocom; print(json.dumps(sorted(sys.modules)))"
+    modules = json.loads(run_python(code))
+    assert [mod for mod in HEAVY_MODULES if mod in modules] == []
+
+
+def test_import_time():
+    code = (
+        "import time; t0 = time.perf_counter(); import pyaerocom; "
+        "print(time.perf_counter() - t0)"
+    )
+    assert float(run_python(code)) < MAX_IMPORT_TIME
+
+
+@pytest.mark.parametrize(
+    "name,module",
+    [
+        ("GriddedData", "pyaerocom.griddeddata"),
+        ("ColocationSetup", "pyaerocom.colocation_auto"),
+        ("search_data_dir_aerocom", "pyaerocom.io.helpers"),
+        ("browse_database", "pyaerocom.tools"),
+    ],
+)
+def test_toplevel_attribute(name: str, module: str):
+    assert name in dir(pyaerocom)
+    assert getattr(pyaerocom, name) is getattr(sys.modules[module], name)
+
+
+@pytest.mark.parametrize("name", ["io", "plot", "exceptions", "trends_engine"])
+def test_submodule_attribute(name: str):
+    assert getattr(pyaerocom, name) is sys.modules[f"pyaerocom.{name}"]
+
+
+def test_const():
+    from pyaerocom.config import Config
+
+    assert isinstance(pyaerocom.const, Config)
+    assert pyaerocom.const is pyaerocom.const
+
+
+def test_attribute_error():
+    with pytest.raises(AttributeError) as e:
+        pyaerocom.blablub
+    assert str(e.value) == "module 'pyaerocom' has no attribute 'blablub'"
@@ -4,6 +4,7 @@ import pytest
 from pyaerocom.mathutils import (
     _nanmean_and_std,
     calc_statistics,
+    calc_statistics_grouped,
     estimate_value_range,
     exponent,
     is_strictly_monotonic,
@@ -156,6 +157,43 @@ def test_calc_statistics_error():
     assert str(e.value).startswith("boolean index did not match indexed array")
 
 
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(),
+        dict(min_num_valid=15),
+        dict(lowlim=0.1, highlim=0.9),
+        dict(weights=np.random.default_rng(1).random(300)),
+    ],
+)
+def test_calc_statistics_grouped(kwargs: dict):
+    rng = np.random.default_rng(42)
+    data, ref_data = rng.random(300), rng.random(300)
+    data[rng.random(300) < 0.2] = np.nan
+    ref_data[rng.random(300) < 0.2] = np.nan
+    data[:50] = data[:50].round(1)  # ties for rank correlation
+    groups = rng.integers(-1, 12, 300)
+    data[groups == 3] = 0.5  # constant data
+    num_groups = 13  # last group is empty
+
+    stats = calc_statistics_grouped(data, ref_data, groups, num_groups, **kwargs)
+    assert len(stats) == num_groups
+    for idx, result in enumerate(stats):
+        mask = groups == idx
+        weights = kwargs.get("weights")
+        _kwargs = {**kwargs, "weights": None if weights is None else weights[mask]}
+        expected = calc_statistics(data[mask], ref_data[mask], **_kwargs)
+        assert list(result) == list(expected)
+        for key, val in expected.items():
+            assert result[key] == pytest.approx(val, rel=1e-10, nan_ok=True)
+
+
+def test_calc_statistics_grouped_error():
+    with pytest.raises(ValueError) as e:
+        calc_statistics_grouped([1, 2], [1, 2], [0])
+    assert str(e.value) == "Invalid input. Data arrays must have the same length"
+
+
 @pytest.mark.parametrize(
     "vmin,vmax,extend_percent,result",
     [
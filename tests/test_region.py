@@ -1,6 +1,15 @@
+import numpy as np
 import pytest
 
-from pyaerocom.region import Region, get_regions_coord
+from pyaerocom.region import (
+    Region,
+    _find_closest_region_coords,
+    clear_region_cache,
+    find_closest_region_coord,
+    find_closest_region_coords,
+    get_all_default_regions,
+    get_regions_coord,
+)
 
 
 @pytest.mark.parametrize(
@@ -61,3 +70,38 @@ def test_get_regions_coord_with_supplied_regions_dict(region_name, lat, lon):
     candidate_regions = {"OCN": oceans, "SAM": sam, "ASIA": asia}
     reg = Region(region_name)
     assert reg.region_id in get_regions_coord(lat, lon, candidate_regions)
+
+
+@pytest.mark.parametrize(
+    "region",
+    [
+        Region("EUR"),
+        Region("NAM"),
+        Region("PAN"),
+        Region("ALL"),
+        Region("PACIFIC", lat_range=[-30, 30], lon_range=[150, -120]),
+    ],
+)
+def test_contains_coordinates(region):
+    lats = np.asarray([0, 39.7555, -37.8136, 59.9139, 10.4806, -33.9249, 0, 80])
+    lons = np.asarray([0, -105.2211, 144.9631, 10.7522, -66.9036, 18.4241, 179, -150])
+    result = region.contains_coordinates(lats, lons)
+    expected = [bool(region.contains_coordinate(lat, lon)) for lat, lon in zip(lats, lons)]
+    assert result.tolist() == expected
+
+
+def test_find_closest_region_coords():
+    lats = [48.864716, 30.033333, 0.0, -33.447487, 39.916668, 48.864716]
+    lons = [2.349014, 31.233334, 0.0, -70.673676, 116.383331, 2.349014]
+    regions = get_all_default_regions()
+    result = find_closest_region_coords(lats, lons, regions)
+    assert result == [find_closest_region_coord(*coord, regions) for coord in zip(lats, lons)]
+
+    assert _find_closest_region_coords.cache_info().currsize >= 1
+    clear_region_cache()
+    assert _find_closest_region_coords.cache_info().currsize == 0
+
+
+def test_find_closest_region_coords_error():
+    with pytest.raises(ValueError, match="lats and lons need to be 1D arrays"):
+        find_closest_region_coords([1, 2], [3])
@@ -16,7 +16,7 @@ from pyaerocom.exceptions import (
     VarNotAvailableError,
 )
 from pyaerocom.io import ReadEarlinet
-from pyaerocom.stationdata import StationData
+from pyaerocom.stationdata import StationData, convert_unit_stations
 from pyaerocom.ungriddeddata import UngriddedData
 from tests.conftest import TEST_RTOL
 from tests.fixtures.stations import FAKE_STATION_DATA
@@ -165,6 +165,24 @@ def test_StationData_convert_unit_error():
     assert str(e.value) == "failed to convert unit from 1 to kg m-3"
 
 
+def test_convert_unit_stations():
+    stats = [stat1.copy(), stat2.copy(), stat2.copy()]
+    stats[2]["ec550aer"] = pd.Series(stats[2]["ec550aer"], index=stats[2].dtime)
+    expected = [stats[0].ec550aer * 1e6, stats[1].ec550aer, stats[2].ec550aer.values]
+    convert_unit_stations(stats, "ec550aer", "Mm-1")
+    for stat, vals in zip(stats, expected):
+        assert stat.get_unit("ec550aer") == "Mm-1"
+        np.testing.assert_allclose(np.asarray(stat.ec550aer), vals)
+    assert isinstance(stats[2].ec550aer, pd.Series)
+    assert (stats[2].ec550aer.index == stats[2].dtime).all()
+
+
+def test_convert_unit_stations_error():
+    with pytest.raises(UnitConversionError) as e:
+        convert_unit_stations([stat3.copy(), stat3.copy()], "concso4", "kg m-3")
+    assert str(e.value) == "failed to convert unit from 1 to kg m-3"
+
+
 def test_StationData_dist_other():
     dist = stat1.dist_other(stat2)
     assert dist == pytest.approx(1.11, abs=0.1)
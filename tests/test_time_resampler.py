@@ -5,6 +5,7 @@ import xarray as xr
 from iris.cube import Cube
 
 from pyaerocom import GriddedData, TsType
+from pyaerocom.exceptions import TemporalResolutionError
 from pyaerocom.helpers import resample_time_dataarray, resample_timeseries
 from pyaerocom.time_resampler import TimeResampler
 
@@ -143,6 +144,47 @@ def test_TimeResampler__gen_index(kwargs, index):
     assert tr._gen_idx(**kwargs) == index
 
 
+@pytest.mark.parametrize(
+    "kwargs,steps",
+    [
+        pytest.param(
+            dict(to_ts_type=TsType("monthly"), how="max"),
+            [("MS", None, "max")],
+            id="unknown input frequency",
+        ),
+        pytest.param(
+            dict(to_ts_type=TsType("daily"), from_ts_type=TsType("daily"), how="max"),
+            [("D", None, "mean")],
+            id="same frequency",
+        ),
+        pytest.param(
+            dict(to_ts_type=TsType("monthly"), from_ts_type=TsType("hourly")),
+            [("MS", None, "mean")],
+            id="no min_num_obs",
+        ),
+        pytest.param(
+            dict(
+                to_ts_type=TsType("monthly"),
+                from_ts_type=TsType("3hourly"),
+                min_num_obs=min_num_obs_default,
+                how=dict(monthly={"daily": "max"}),
+            ),
+            [("D", 2, "mean"), ("MS", 7, "max")],
+            id="3hourly to monthly",
+        ),
+    ],
+)
+def test_TimeResampler_get_resample_steps(kwargs, steps):
+    tr = TimeResampler()
+    assert tr.get_resample_steps(**kwargs) == steps
+
+
+def test_TimeResampler_get_resample_steps_error():
+    tr = TimeResampler()
+    with pytest.raises(TemporalResolutionError):
+        tr.get_resample_steps(TsType("hourly"), TsType("daily"))
+
+
 @pytest.mark.parametrize(
     "kwargs,output_len,output_numnotnan,lup",
     [
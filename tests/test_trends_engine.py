@@ -1 +1,51 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
 from pyaerocom.trends_engine import TrendsEngine
+
+
+@pytest.fixture(scope="module")
+def monthly_data() -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    idx = pd.date_range("2000-01-01", "2015-12-31", freq="MS") + pd.Timedelta(14, "D")
+    slopes = np.array([1, -0.5, 0.1, 2, 0])
+    data = 10 + rng.random((len(idx), len(slopes))) + np.outer(np.arange(len(idx)) / 12, slopes)
+    data[rng.random(data.shape) < 0.2] = np.nan
+    data[:60, 2] = np.nan
+    data[:, 4] = np.nan
+    return pd.DataFrame(data, index=idx)
+
+
+@pytest.mark.parametrize("season", [None, "spring", "winter"])
+@pytest.mark.parametrize("ts_type", ["monthly", "yearly"])
+def test_compute_trends(monthly_data: pd.DataFrame, ts_type: str, season: str | None):
+    data = monthly_data
+    if ts_type == "yearly":
+        data = data.resample("YS").mean()
+    results = TrendsEngine.compute_trends(data, ts_type, 2001, 2015, 7, season)
+    assert len(results) == data.shape[1]
+    for col, result in zip(data, results):
+        expected = TrendsEngine.compute_trend(
+            data[col].rename(None), ts_type, 2001, 2015, 7, season
+        )
+        assert list(result) == list(expected)
+        pd.testing.assert_series_equal(result.pop("data"), expected.pop("data"))
+        assert result == pytest.approx(expected, nan_ok=True)
+    assert results[0]["m"] == pytest.approx(1, rel=0.1)
+    assert results[4]["m"] is None
+
+
+def test_compute_trends_empty(monthly_data: pd.DataFrame):
+    results = TrendsEngine.compute_trends(monthly_data, "monthly", 2020, 2022, 2)
+    assert len(results) == 5
+    assert all(result["data"] is None for result in results)
+    assert results[0]["period"] == "2020-2022"
+
+
+def test_compute_trends_error(monthly_data: pd.DataFrame):
+    with pytest.raises(ValueError) as e:
+        TrendsEngine.compute_trends(monthly_data, "daily", 2001, 2015, 7)
+    assert str(e.value) == "daily"
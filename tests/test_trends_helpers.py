@@ -1,17 +1,25 @@
+from __future__ import annotations
+
 from datetime import date
 
 import numpy as np
 import pandas as pd
 import pytest
+from scipy.stats import kendalltau
+from scipy.stats.mstats import theilslopes
 
 from pyaerocom.trends_helpers import (
     _end_season,
     _find_area,
     _get_season_from_months,
+    _get_yearly,
+    _get_yearly_batch,
     _init_trends_result_dict,
+    _mann_kendall_batch,
     _mid_season,
     _start_season,
     _start_stop_period,
+    _theil_sen_batch,
     _years_from_periodstr,
 )
 
@@ -115,3 +123,58 @@ def test__start_stop_period():
     res = _start_stop_period(period)
     assert len(res) == 2
     assert all(isinstance(item, date) for item in res)
+
+
+@pytest.fixture(params=["unique", "repeated"])
+def yearly_matrix(request) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(42)
+    years = np.arange(1980, 2020, dtype=float)
+    if request.param == "repeated":  # e.g. monthly data with yearly time stamps
+        years = np.sort(rng.choice(years[:10], len(years)))
+    values = rng.random((len(years), 12)) + np.linspace(-1, 1, 12) * (years - 1980)[:, None]
+    values[rng.random(values.shape) < 0.3] = np.nan
+    values[:, 1] = np.round(values[:, 1])  # ties
+    values[:, 2] = 1  # all equal
+    values[:30, 3] = np.nan  # short series (exact p-value)
+    values[:-1, 4] = np.nan  # single value
+    values[:, 5] = np.nan
+    return years, values
+
+
+def test__mann_kendall_batch(yearly_matrix):
+    years, values = yearly_matrix
+    tau, pval = _mann_kendall_batch(years, values)
+    for i in range(values.shape[1]):
+        valid = ~np.isnan(values[:, i])
+        if valid.sum() < 2:
+            assert np.isnan(tau[i]) and np.isnan(pval[i])
+            continue
+        expected = kendalltau(years[valid], values[valid, i])
+        np.testing.assert_equal((tau[i], pval[i]), tuple(expected))
+
+
+def test__theil_sen_batch(yearly_matrix):
+    years, values = yearly_matrix
+    result = _theil_sen_batch(years, values, alpha=0.68)
+    for i in range(values.shape[1]):
+        valid = ~np.isnan(values[:, i])
+        if valid.sum() < 2:
+            assert np.isnan([res[i] for res in result]).all()
+            continue
+        with np.errstate(invalid="ignore"):
+            expected = theilslopes(values[valid, i], years[valid], alpha=0.68)
+        np.testing.assert_equal([res[i] for res in result], list(expected))
+
+
+@pytest.mark.parametrize("season", ["all", "spring", "winter"])
+def test__get_yearly_batch(season: str):
+    rng = np.random.default_rng(1)
+    idx = pd.date_range("2000-01-15", "2005-12-15", freq="MS") + pd.Timedelta(14, "D")
+    data = pd.DataFrame(rng.random((len(idx), 3)), index=idx)
+    data.iloc[:12, 1] = np.nan
+    data.iloc[30:40, 2] = np.nan
+    result = _get_yearly_batch(data.iloc[2:], season, 2001)
+    for col in data:
+        expected = _get_yearly(data.iloc[2:][col], season, 2001)
+        np.testing.assert_array_equal(result[col].values, expected.values)
+        np.testing.assert_array_equal(result.index.values, expected.index.values)
@@ -1,11 +1,20 @@
+from __future__ import annotations
+
 import string
 from pathlib import Path
 
 import numpy as np
+import pandas as pd
 import pytest
 
-from pyaerocom import UngriddedData, ungriddeddata
-from pyaerocom.exceptions import DataCoverageError, VariableDefinitionError
+from pyaerocom import StationData, UngriddedData, ungriddeddata
+from pyaerocom.exceptions import (
+    DataCoverageError,
+    TemporalResolutionError,
+    VariableDefinitionError,
+    VarNotAvailableError,
+)
+from pyaerocom.ungriddeddata import UngriddedDataBuilder
 from tests.fixtures.stations import FAKE_STATION_DATA
 
 
@@ -241,6 +250,302 @@ def test_from_single_station_data():
     assert data0 == pytest.approx(data1, abs=1e-20)
 
 
+def _synthetic_station_data(num_stats: int, num_times: int = 48) -> list[StationData]:
+    rng = np.random.default_rng(42)
+    dtime = np.datetime64("2010-01-01") + np.arange(num_times).astype("timedelta64[h]")
+    stats = []
+    for i in range(num_stats):
+        stat = StationData(
+            station_name=f"station{i}",
+            latitude=rng.uniform(-90, 90),
+            longitude=rng.uniform(-180, 180),
+            altitude=rng.uniform(0, 1000),
+            dtime=dtime,
+        )
+        stat["od550aer"] = rng.random(num_times)
+        stat.var_info["od550aer"] = dict(units="1")
+        if i % 2:
+            stat["ang4487aer"] = rng.random(num_times)
+            stat.var_info["ang4487aer"] = dict(units="1")
+            stat.data_err["ang4487aer"] = rng.random(num_times)
+        stats.append(stat)
+    return stats
+
+
+def test_from_station_data_multiple():
+    stats = _synthetic_station_data(11)
+    data = UngriddedData.from_station_data(stats)
+    data._check_index()
+    assert data.shape == (16 * 48, 12)
+    assert data.var_idx == {"od550aer": 0, "ang4487aer": 1}
+    for meta_key, stat in zip(data.metadata, stats):
+        assert data.metadata[meta_key]["station_name"] == stat.station_name
+        assert data.metadata[meta_key]["var_info"]["od550aer"]["units"] == "1"
+        idx = data.meta_idx[meta_key]["od550aer"]
+        np.testing.assert_array_equal(data._data[idx, data._DATAINDEX], stat.od550aer)
+        times = data._data[idx, data._TIMEINDEX].astype("datetime64[s]")
+        np.testing.assert_array_equal(times, stat.dtime)
+        assert np.all(data._data[idx, data._LATINDEX] == stat.latitude)
+    err = data._data[data.meta_idx[1.0]["ang4487aer"], data._DATAERRINDEX]
+    np.testing.assert_array_equal(err, stats[1].data_err["ang4487aer"])
+    assert np.isnan(data._data[data.meta_idx[0.0]["od550aer"], data._DATAERRINDEX]).all()
+
+
+def test_from_station_data_per_station():
+    """building from many stations equals building from each station individually"""
+    stats = _synthetic_station_data(20)
+    data = UngriddedData.from_station_data(stats)
+    assert len(data.metadata) == 20
+    for meta_key, stat in zip(data.metadata, stats):
+        single = UngriddedData.from_station_data(stat)
+        for var, idx in single.meta_idx[0.0].items():
+            np.testing.assert_array_equal(
+                data._data[data.meta_idx[meta_key][var], 1:], single._data[idx, 1:]
+            )
+        assert data.metadata[meta_key] == single.metadata[0.0]
+
+
+def test_to_columnar():
+    data = UngriddedData.from_station_data(_synthetic_station_data(11))
+    columnar = data.to_columnar()
+    assert not data.is_columnar
+    assert columnar.is_columnar
+    assert columnar._data.nbytes < data._data.nbytes / 2
+    np.testing.assert_allclose(np.asarray(columnar._data), data._data, rtol=1e-6)
+    for meta_key in data.metadata:
+        stat, stat_columnar = data.to_station_data(meta_key), columnar.to_station_data(meta_key)
+        for var in stat.var_info:
+            pd.testing.assert_series_equal(stat[var], stat_columnar[var], rtol=1e-6)
+
+    subset = columnar.filter_by_meta(station_name="station1*")
+    assert subset.is_columnar
+    assert subset.shape == data.filter_by_meta(station_name="station1*").shape
+    assert columnar.extract_var("ang4487aer").is_columnar
+
+    merged = columnar.merge(data)
+    assert merged.is_columnar
+    assert merged.shape == (2 * data.shape[0], 12)
+    merged._check_index()
+
+    dense = columnar.to_dense()
+    assert not dense.is_columnar
+    np.testing.assert_array_equal(dense._data, np.asarray(columnar._data))
+
+
+def test_UngriddedDataBuilder_build_columnar():
+    builder = UngriddedDataBuilder()
+    meta_key = builder.add_meta(dict(station_name="bla", var_info={}))
+    dtime = np.datetime64("2010-01-01") + np.arange(5).astype("timedelta64[D]")
+    builder.add_var(meta_key, "od550aer", dtime, np.arange(5), 10, 20, 30)
+    data = builder.build(columnar=True)
+    assert data.is_columnar
+    assert data._data.allocated == [0, 1, 2, 3, 4, 5, 6]
+    data.add_chunk(10)
+    assert data.shape == (15, 12)
+    assert np.isnan(data._data[5:, data._DATAINDEX]).all()
+    times = data._data[:5, data._TIMEINDEX].astype("datetime64[s]")
+    np.testing.assert_array_equal(times, dtime)
+    np.testing.assert_array_equal(data._data[:5, data._DATAINDEX], np.arange(5))
+
+
+def test_to_columnar_memory():
+    """memory footprint of dense vs columnar storage
+
+    Per data point (one variable, no errors, flags or stop times), dense
+    storage requires 96 bytes and columnar storage 40 bytes, that is, for
+    100M data points 9.6 GB and 4.0 GB, respectively.
+    """
+    builder = UngriddedDataBuilder()
+    dtime = np.datetime64("2010-01-01") + np.arange(100).astype("timedelta64[h]")
+    for i in range(3):
+        meta_key = builder.add_meta(dict(station_name=f"station{i}", var_info={}))
+        builder.add_var(meta_key, "concpm10", dtime, np.arange(100), 10, 20, 30)
+    dense = builder.build()
+    columnar = builder.build(columnar=True)
+    assert dense._data.nbytes == 300 * 96
+    assert columnar._data.nbytes == 300 * 40
+
+
+def test_to_station_arrays():
+    stats = _synthetic_station_data(12)
+    for stat in stats:
+        stat.ts_type = "hourly"
+    data = UngriddedData.from_station_data(stats)
+    out = data.to_station_arrays("od550aer", "daily")
+    assert out["data"].shape == (2, 12)
+    np.testing.assert_array_equal(out["time"], np.array(["2010-01-01", "2010-01-02"], "M8[s]"))
+    stats_ref = data.to_station_data_all("od550aer", freq="daily")["stats"]
+    for stat in stats_ref:
+        idx = list(out["station_name"]).index(stat.station_name)
+        np.testing.assert_allclose(out["data"][:, idx], stat.od550aer.values)
+        assert out["latitude"][idx] == stat.latitude
+        assert out["units"][idx] == "1"
+
+
+@pytest.mark.parametrize(
+    "how,kwargs,result",
+    [
+        ("mean", {}, [[10, 2], [5, np.nan]]),
+        ("median", {}, [[10, 1], [5, np.nan]]),
+        ("sum", {}, [[10, 6], [5, np.nan]]),
+        ("min", {}, [[10, 1], [5, np.nan]]),
+        ("max", {}, [[10, 4], [5, np.nan]]),
+        ("mean", dict(min_num_obs=2), [[np.nan, 2], [np.nan, np.nan]]),
+        ("mean", dict(by_station_name=False), [[2, np.nan, 10], [np.nan, 5, np.nan]]),
+        ("mean", dict(start="2010-02-01", stop="2010-02-28"), [[5]]),
+    ],
+)
+def test_to_station_arrays_aggregate(how: str, kwargs: dict, result: list):
+    stats = []
+    for name, dtime, vals in [
+        ("b", ["2010-01-01", "2010-01-05", "2010-01-31"], [1, 4, 1]),
+        ("a", ["2010-02-03"], [5]),
+        ("a", ["2010-01-15", "2010-01-20"], [10, np.nan]),
+    ]:
+        stat = StationData(station_name=name, latitude=0, longitude=0, altitude=0)
+        stat.dtime = np.asarray(dtime, dtype="datetime64[s]")
+        stat["concpm10"] = np.asarray(vals, dtype=float)
+        stat.var_info["concpm10"] = dict(units="ug m-3")
+        stats.append(stat)
+    data = UngriddedData.from_station_data(stats)
+    out = data.to_station_arrays("concpm10", "monthly", how=how, **kwargs)
+    np.testing.assert_array_equal(out["data"], result)
+    if not kwargs:
+        assert out["station_name"].tolist() == ["a", "b"]
+        assert out["meta_idx"] == [[1.0, 2.0], [0.0]]
+
+
+@pytest.mark.parametrize(
+    "var_name,ts_type,how,exception,error",
+    [
+        ("concpm10", "daily", "mean", VarNotAvailableError, "No such variable concpm10"),
+        ("od550aer", "daily", "mode", ValueError, "Invalid input for how"),
+        ("od550aer", "minutely", "mean", TemporalResolutionError, "found hourly data"),
+    ],
+)
+def test_to_station_arrays_error(var_name, ts_type, how, exception, error):
+    stats = _synthetic_station_data(2)
+    for stat in stats:
+        stat.ts_type = "hourly"
+    data = UngriddedData.from_station_data(stats)
+    with pytest.raises(exception) as e:
+        data.to_station_arrays(var_name, ts_type, how=how)
+    assert error in str(e.value)
+
+
+def test_to_station_arrays_no_data():
+    data = UngriddedData.from_station_data(_synthetic_station_data(2))
+    with pytest.raises(DataCoverageError) as e:
+        data.to_station_arrays("od550aer", "daily", start=2000)
+    assert str(e.value) == "No valid data of od550aer in specified time window"
+
+
+@pytest.fixture
+def ungridded_meta_index() -> UngriddedData:
+    stats = _synthetic_station_data(12, num_times=4)
+    for i, stat in enumerate(stats):
+        stat.station_name = f"station{i % 4}"
+        stat.data_id = "obs1" if i < 6 else "obs2"
+        stat.instrument_name = ["sun", "sky", "lidar"][i % 3]
+    return UngriddedData.from_station_data(stats)
+
+
+@pytest.mark.parametrize(
+    "name,allow_wildcards,indices",
+    [
+        ("station1", False, [1, 5, 9]),
+        ("station1", True, [1, 5, 9]),
+        ("station[12]", True, [1, 2, 5, 6, 9, 10]),
+        ("*", True, list(range(12))),
+    ],
+)
+def test_find_station_meta_indices(
+    ungridded_meta_index: UngriddedData, name: str, allow_wildcards: bool, indices: list
+):
+    data = ungridded_meta_index
+    assert data.find_station_meta_indices(name, allow_wildcards) == [float(i) for i in indices]
+
+
+def test_find_station_meta_indices_invalidate(ungridded_meta_index: UngriddedData):
+    data = ungridded_meta_index
+    assert data.find_station_meta_indices("station1") == [1, 5, 9]
+    data.metadata[5.0]["station_name"] = "bla"
+    assert data.find_station_meta_indices("station1") == [1, 5, 9]
+    data.invalidate_meta_index()
+    assert data.find_station_meta_indices("station1") == [1, 9]
+    data.metadata[12.0] = dict(data.metadata[1.0])
+    assert data.find_station_meta_indices("station1") == [1, 9, 12]
+
+
+@pytest.mark.parametrize(
+    "negate,filters,indices",
+    [
+        (None, dict(data_id="obs1"), [0, 1, 2, 3, 4, 5]),
+        (None, dict(data_id="obs*", instrument_name="sky"), [1, 4, 7, 10]),
+        (None, dict(station_name=["station0", "station3"], data_id="obs2"), [7, 8, 11]),
+        (None, dict(instrument_name=["l*", "sun"], station_name="station1"), [5, 9]),
+        ("data_id", dict(data_id="obs1", instrument_name="sun"), [6, 9]),
+        (None, dict(data_id="blub"), []),
+    ],
+)
+def test__find_meta_matches(
+    ungridded_meta_index: UngriddedData, negate: str | None, filters: dict, indices: list
+):
+    data = ungridded_meta_index
+    matches, totnum = data._find_meta_matches(negate, *data._init_meta_filters(**filters))
+    assert matches == [float(i) for i in indices]
+    assert totnum == sum(len(data.meta_idx[i]["od550aer"]) for i in matches) + sum(
+        len(data.meta_idx[i].get("ang4487aer", [])) for i in matches
+    )
+
+
+@pytest.mark.parametrize(
+    "filters,indices",
+    [
+        (dict(station_name=["station0", "station3"]), [0, 3, 4, 7, 8, 11]),
+        (dict(station_name=("station2",)), [2, 6, 10]),
+        (dict(instrument_name=["l*", "sun"]), [0, 2, 3, 5, 6, 8, 9, 11]),
+        (dict(instrument_name=["sky"], data_id=["obs2"]), [7, 10]),
+        (dict(latitude=[1, 2]), None),
+    ],
+)
+def test__find_meta_candidates(
+    ungridded_meta_index: UngriddedData, filters: dict, indices: list | None
+):
+    data = ungridded_meta_index
+    candidates = data._find_meta_candidates([], *data._init_meta_filters(**filters)[:2])
+    if indices is None:
+        assert candidates is None
+    else:
+        assert candidates == {float(i) for i in indices}
+
+
+def test__find_meta_candidates_non_str(ungridded_meta_index: UngriddedData):
+    data = ungridded_meta_index
+    data.metadata[4.0]["instrument_name"] = None
+    data.invalidate_meta_index()
+    filters = data._init_meta_filters(instrument_name=["sun"])
+    candidates = data._find_meta_candidates([], *filters[:2])
+    # list filters do not reject non-string metadata values
+    assert candidates == {0.0, 3.0, 4.0, 6.0, 9.0}
+    assert data._find_meta_matches([], *filters)[0] == [0.0, 3.0, 4.0, 6.0, 9.0]
+
+
+def test_builder_times_to_float():
+    dtime = np.datetime64("2010-01-01T00:00:00") + np.arange(3).astype("timedelta64[h]")
+    expected = dtime.astype(np.float64)
+    for times in (dtime, dtime.astype("datetime64[ns]"), pd.DatetimeIndex(dtime), list(dtime)):
+        np.testing.assert_array_equal(UngriddedDataBuilder.times_to_float(times), expected)
+    np.testing.assert_array_equal(UngriddedDataBuilder.times_to_float(expected), expected)
+
+
+def test_builder_length_mismatch():
+    builder = UngriddedDataBuilder()
+    meta_key = builder.add_meta({})
+    with pytest.raises(ValueError):
+        builder.add_var(meta_key, "od550aer", np.zeros(3), np.zeros(2), 0, 0, 0)
+
+
 def test_last_meta_idx(aeronetsunv3lev2_subset: UngriddedData):
     assert isinstance(aeronetsunv3lev2_subset.last_meta_idx, (np.ndarray, np.generic))
 
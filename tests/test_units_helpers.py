@@ -8,7 +8,9 @@ from pyaerocom.units_helpers import (
     _check_unit_endswith_freq,
     _unit_conversion_fac_custom,
     _unit_conversion_fac_si,
+    clear_unit_conversion_cache,
     convert_unit,
+    get_unit_conversion_cache_info,
     get_unit_conversion_fac,
 )
 
@@ -135,3 +137,24 @@ def test_get_unit_conversion_fac_error(from_unit: str, to_unit: str, var_name: s
     with pytest.raises(UnitConversionError) as e:
         get_unit_conversion_fac(from_unit, to_unit, var_name)
     assert str(e.value) == f"failed to convert unit from {from_unit} to {to_unit}"
+
+
+def test_get_unit_conversion_fac_cached():
+    clear_unit_conversion_cache()
+    assert get_unit_conversion_fac("ug S m-3", "ug m-3", "concso2") == pytest.approx(
+        1.9979e0, rel=1e-3
+    )
+    info = get_unit_conversion_cache_info()
+    assert info["hits"] == 1 and info["misses"] == 0 and info["size"] > 0
+
+    assert get_unit_conversion_fac("kg m-3", "ug m-3") == pytest.approx(1e9)
+    assert get_unit_conversion_fac("kg m-3", "ug m-3") == pytest.approx(1e9)
+    for _ in range(2):
+        with pytest.raises(UnitConversionError) as e:
+            get_unit_conversion_fac("1", "ug")
+        assert str(e.value) == "failed to convert unit from 1 to ug"
+    info = get_unit_conversion_cache_info()
+    assert info["hits"] == 3 and info["misses"] == 2
+
+    clear_unit_conversion_cache()
+    assert get_unit_conversion_cache_info() == dict(hits=0, misses=0, size=0)
@@ -53,8 +53,10 @@ def test_VarCollection_add_var_error(collection: VarCollection):
 
 def test_VarCollection_delete_var(collection: VarCollection):
     var = Variable(var_name="concpm10", units="ug m-3")
+    collection.get_var(var.var_name)
     collection.delete_variable(var.var_name)
     assert var.var_name not in collection.all_vars
+    assert collection.cache_info()["size"] == 0
 
 
 def test_VarCollection_delete_var_error(collection: VarCollection):
@@ -70,6 +72,22 @@ def test_VarCollection_get_var(collection: VarCollection, var_name: str):
     assert isinstance(collection.get_var(var_name), Variable)
 
 
+def test_VarCollection_get_var_cached(collection: VarCollection):
+    var = collection.get_var("od550aer")
+    assert var.read_only
+    assert collection.get_var("od550aer") is var
+    assert collection["od550csaer"].var_name_aerocom == "od550aer"
+    assert collection.cache_info() == dict(hits=1, misses=2, size=2)
+
+    copy = collection.get_var("od550aer", copy=True)
+    assert copy is not var and not copy.read_only
+    copy.units = "m"
+    assert collection["od550aer"].units == "1"
+
+    collection.clear_cache()
+    assert collection.cache_info() == dict(hits=0, misses=0, size=0)
+
+
 def test_VarCollection_get_var_error(collection: VarCollection):
     var_name = "bla"
     with pytest.raises(VariableDefinitionError) as e:
@@ -127,3 +127,32 @@ def test_Variable___str__():
     s = str(var)
     assert s.startswith("\nPyaerocom Variable")
     assert "var_name: od550aer" in s
+
+
+@pytest.mark.parametrize(
+    "var_name,var_name_aerocom",
+    [
+        ("od550aer", "od550aer"),
+        ("od550csaer", "od550aer"),
+        ("sconcpm10", "concpm10"),
+    ],
+)
+def test_Variable_alias(var_name: str, var_name_aerocom: str):
+    assert Variable(var_name).var_name_aerocom == var_name_aerocom
+
+
+def test_Variable_read_only():
+    var = Variable("od550aer")
+    assert not var.read_only
+    var.set_read_only()
+    assert var.read_only
+    with pytest.raises(AttributeError) as e:
+        var.units = "m"
+    assert str(e.value).startswith("Cannot set units of read-only variable od550aer")
+    with pytest.raises(AttributeError):
+        var.update(map_vmin=0)
+
+    copy = var.copy()
+    assert not copy.read_only
+    copy.units = "m"
+    assert var.units == "1"